@@ -0,0 +1,54 @@
+"""!
+Measures the memory per validated update answer and the garbage collector activity during a long capture.
+
+Run it with: python benchmarks/bench_answer_memory.py
+"""
+import gc
+import tracemalloc
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.schema import DeviceType, ProtocolType
+
+
+NUMBER_OF_UPDATES = 20_000
+
+
+def count_gc_collections() -> int:
+    return sum(generation_stats["collections"] for generation_stats in gc.get_stats())
+
+
+def main() -> None:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    validator = AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls)
+    messages = [
+        f"idle#{100_000 + i} Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok"
+        for i in range(NUMBER_OF_UPDATES)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    answers = [validator.validate(message) for message in messages]
+    memory_without_dicts, _ = tracemalloc.get_traced_memory()
+    for answer in answers:
+        answer.field_value_dict
+    memory_with_dicts, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del answers
+
+    # a capture keeps the answers alive, which lets the garbage collector run through the generations
+    gc.collect()
+    collections_before = count_gc_collections()
+    captured = [validator.validate(message) for message in messages]
+    collections = count_gc_collections() - collections_before
+    del captured
+
+    print(f"bytes per answer:                        {memory_without_dicts / NUMBER_OF_UPDATES:8.0f}")
+    print(f"bytes per answer with field_value_dict:  {memory_with_dicts / NUMBER_OF_UPDATES:8.0f}")
+    print(f"gc collections for {NUMBER_OF_UPDATES} captured answers: {collections:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""!
+Validates well formed, randomly mutated and worst case ?update answers with the answer regexes
+and compares them with the unanchored greedy ".*" regexes, that were used before.
+
+Run it with: python benchmarks/bench_answer_regex_fuzz.py
+"""
+import random
+import re
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.schema import AnswerDef, ConverterType, DeviceType, ProtocolType
+
+
+NUMBER_OF_ANSWERS = 20_000
+WORST_CASE_LENGTH = 2_000
+
+
+def create_legacy_regex(answer_def: AnswerDef) -> str:
+    """! Frozen copy of the regex builder before the values were bounded and the regexes anchored """
+    regex_patterns: List[str] = []
+    for answer_field in answer_def.fields:
+        field_type = answer_field.field_type.field_type
+        value_str = r".*"
+        if answer_field.field_type.converter_ref is ConverterType.PRIMITIVE:
+            if field_type is int or np.issubdtype(field_type, np.integer):
+                value_str = r"[\+\-]?\d+"
+            elif field_type is float:
+                value_str = r"[\+\-]?\d+(\.\d+)?"
+            elif field_type is bool:
+                value_str = r"([Tt]rue)|([Ff]alse)|0|1"
+
+        result_str = "(" + value_str + ")"
+        si_prefix = answer_field.field_type.si_prefix
+        si_unit = answer_field.field_type.si_unit
+        if si_prefix and si_unit:
+            result_str += " " + si_prefix.symbol + si_unit.value
+        elif si_unit:
+            result_str += " " + si_unit.value
+        regex_patterns.append(answer_field.sonic_text_attrs.prefix + result_str + answer_field.sonic_text_attrs.postfix)
+
+    return answer_def.sonic_text_attrs.separator.join(regex_patterns)
+
+
+def mutate(answer: str) -> str:
+    chars = list(answer)
+    for _ in range(random.randint(1, 4)):
+        position = random.randrange(len(chars) + 1)
+        chars.insert(position, random.choice("#%aZ0 -.\n"))
+    return "".join(chars)
+
+
+def measure(validate: Callable[[str], object], answers: List[str]) -> float:
+    start = time.perf_counter()
+    for answer in answers:
+        validate(answer)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    regex = AnswerValidatorBuilder._create_regex_for_answer(answer_def)
+    bounded_pattern = re.compile(regex, re.IGNORECASE)
+    legacy_pattern = re.compile(create_legacy_regex(answer_def), re.IGNORECASE)
+
+    random.seed(0)
+    valid_answers = [
+        f"{random.choice(['idle', 'busy', 'too hot'])}#{random.randint(100_000, 10_000_000)} Hz#{random.randint(0, 150)} %#none#"
+        f"{random.randint(273_150, 373_150)} mK#{random.randint(0, 10**6)} uV#{random.randint(0, 10**6)} uA#"
+        f"{random.randint(0, 360_000_000)} u°#ON#{random.randint(0, 10**6)} uV#submerged#ok"
+        for _ in range(NUMBER_OF_ANSWERS)
+    ]
+    mutated_answers = [mutate(answer) for answer in valid_answers]
+    worst_case_answers = [
+        "#" * WORST_CASE_LENGTH,
+        "idle#" * (WORST_CASE_LENGTH // 5),
+        "idle#1 Hz#" + "1 %#" * (WORST_CASE_LENGTH // 4),
+    ]
+
+    print(f"{'input':<20} {'bounded':>10} {'legacy':>10}")
+    for name, answers in [("valid", valid_answers), ("mutated", mutated_answers), ("worst case", worst_case_answers)]:
+        duration_bounded = measure(bounded_pattern.fullmatch, answers)
+        duration_legacy = measure(legacy_pattern.search, answers)
+        print(f"{name:<20} {duration_bounded:9.3f}s {duration_legacy:9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""!
+Compares decoding a day of recorded ?update answers (one per second) line by line
+with the AnswerValidator against the BatchAnswerDecoder.
+
+Run it with: python benchmarks/bench_batch_answer_decoder.py
+"""
+import random
+import time
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.python_parser.batch_answer_decoder import BatchAnswerDecoder
+from sonic_protocol.schema import DeviceType, ProtocolType
+
+
+NUMBER_OF_LINES = 24 * 60 * 60
+
+
+def main() -> None:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    random.seed(0)
+    lines = [
+        f"{random.choice(['idle', 'busy', 'too hot'])}#{random.randint(100_000, 10_000_000)} Hz#{random.randint(0, 150)} %#none#"
+        f"{random.randint(273_150, 373_150)} mK#{random.randint(0, 10**6)} uV#{random.randint(0, 10**6)} uA#"
+        f"{random.randint(0, 360_000_000)} u°#ON#{random.randint(0, 10**6)} uV#submerged#ok"
+        for _ in range(NUMBER_OF_LINES)
+    ]
+
+    validator = AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls)
+    start = time.perf_counter()
+    answers = [validator.validate(line) for line in lines]
+    duration_validator = time.perf_counter() - start
+    assert all(answer.valid for answer in answers)
+
+    decoder = BatchAnswerDecoder(answer_def, protocol.field_name_cls)
+    start = time.perf_counter()
+    _, valid = decoder.decode(lines)
+    duration_decoder = time.perf_counter() - start
+    assert valid.all()
+
+    print(f"AnswerValidator per line: {duration_validator:6.2f} s")
+    print(f"BatchAnswerDecoder:       {duration_decoder:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
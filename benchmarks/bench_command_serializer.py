@@ -0,0 +1,61 @@
+"""!
+Measures the cost of serializing a SetFrequency command, like it happens for every step of a frequency sweep.
+
+Run it with: python benchmarks/bench_command_serializer.py
+"""
+import tempfile
+import timeit
+from pathlib import Path
+
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser import commands as cmds
+from sonic_protocol.python_parser.command_serializer import CommandSerializer
+from sonic_protocol.python_parser.protocol_compiler import ProtocolCompiler
+from sonic_protocol.schema import DeviceType, ProtocolType
+from soniccontrol.communication.message_protocol import SonicMessageProtocol
+
+
+NUMBER_OF_STEPS = 100_000
+
+
+def bench(name: str, func) -> None:
+    seconds = min(timeit.repeat(func, number=1, repeat=5))
+    print(f"{name:<50} {seconds / NUMBER_OF_STEPS * 1e9:8.0f} ns per step")
+
+
+def main() -> None:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    serializer = CommandSerializer(protocol)
+    compiled_protocol = ProtocolCompiler(Path(tempfile.mkdtemp())).load_or_compile(protocol)
+    message_protocol = SonicMessageProtocol()
+    sweep = [cmds.SetFrequency(100_000 + step) for step in range(NUMBER_OF_STEPS)]
+
+    def sweep_args_with_asdict():
+        for command in sweep:
+            command.args
+
+    def sweep_str():
+        for command in sweep:
+            serializer.serialize_command(command)
+
+    def sweep_compiled():
+        for command in sweep:
+            compiled_protocol.serialize_command(command)
+
+    def sweep_frame_f_string():
+        for request_id, command in enumerate(sweep):
+            message_protocol.parse_request(serializer.serialize_command(command), request_id).encode()
+
+    def sweep_frame_template():
+        for request_id, command in enumerate(sweep):
+            message_protocol.encode_request(serializer.serialize_command(command), request_id)
+
+    bench("Command.args (attrs.asdict)", sweep_args_with_asdict)
+    bench("CommandSerializer.serialize_command", sweep_str)
+    bench("CompiledProtocol.serialize_command", sweep_compiled)
+    bench("frame with f-string and encode", sweep_frame_f_string)
+    bench("frame with byte templates", sweep_frame_template)
+
+
+if __name__ == "__main__":
+    main()
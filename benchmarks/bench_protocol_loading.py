@@ -0,0 +1,56 @@
+"""!
+Measures how long a fresh python process needs to get a protocol,
+once by importing and building the protocol definitions and once by loading a snapshot.
+
+Run it with: python benchmarks/bench_protocol_loading.py
+"""
+import subprocess
+import sys
+import tempfile
+
+
+# Modules that every application imports anyway, like the cli or the robot library
+SETUP = """
+import hashlib, json, logging, pathlib
+import sonic_protocol.command_codes, sonic_protocol.field_names
+from sonic_protocol.schema import DeviceType, ProtocolType, Version
+protocol_type = ProtocolType(Version(2, 0, 0), DeviceType.MVP_WORKER)
+"""
+
+BUILD = """
+from sonic_protocol.protocol import protocol_list
+protocol_list.build_protocol_for(protocol_type)
+"""
+
+LOAD_SNAPSHOT = """
+from pathlib import Path
+from sonic_protocol.json_serializer.protocol_snapshot import ProtocolSnapshotStore
+ProtocolSnapshotStore(Path({snapshot_dir!r})).build_protocol_for(protocol_type)
+"""
+
+
+def run_in_fresh_process(code: str) -> float:
+    # The setup is imported before the timer starts, so that only the protocol loading is measured
+    script = f"""
+{SETUP}
+import time, sys
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    snapshot_dir = tempfile.mkdtemp()
+    load_snapshot = LOAD_SNAPSHOT.format(snapshot_dir=snapshot_dir)
+    run_in_fresh_process(load_snapshot) # creates the snapshot
+
+    for name, code in [("import and build protocol", BUILD), ("load protocol snapshot", load_snapshot)]:
+        seconds = min(run_in_fresh_process(code) for _ in range(5))
+        print(f"{name:<30} {seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
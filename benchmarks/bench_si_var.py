@@ -0,0 +1,48 @@
+"""!
+Measures the creation of SIVars and the isinstance checks, that procedure args and forms do for every field,
+and the conversion of a sweep plan with scalar SIVars compared to convert_array_to_prefix.
+
+Run it with: python benchmarks/bench_si_var.py
+"""
+import timeit
+
+import numpy as np
+
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import ABSOLUTE_FREQUENCY_META, AbsoluteFrequencySIVar, SIVar, convert_array_to_prefix
+
+
+NUMBER = 100_000
+
+
+def bench(name: str, func) -> None:
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    print(f"{name:<45} {seconds / NUMBER * 1e9:8.0f} ns")
+
+
+def main() -> None:
+    deserialized = SIVar.from_deserialization(1000, SIPrefix.NONE)
+
+    bench("AbsoluteFrequencySIVar(100000)", lambda: AbsoluteFrequencySIVar(100000))
+    bench("SIVar(..., meta=ABSOLUTE_FREQUENCY_META)", lambda: SIVar(1000, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META))
+    bench("SIVar.from_deserialization without meta", lambda: SIVar.from_deserialization(1000, SIPrefix.NONE))
+    bench("isinstance(SIVar without meta, SIVar)", lambda: isinstance(deserialized, SIVar))
+    bench("issubclass(SIVar, SIVar)", lambda: issubclass(SIVar, SIVar))
+    bench("SIPrefix.KILO.factor", lambda: SIPrefix.KILO.factor)
+    bench("SIPrefix.MILLI <= SIPrefix.KILO", lambda: SIPrefix.MILLI <= SIPrefix.KILO)
+
+    sweep = np.arange(100, 10_000, dtype=np.int64)
+    seconds = min(timeit.repeat(
+        lambda: [AbsoluteFrequencySIVar(int(value), SIPrefix.KILO).to_prefix(SIPrefix.NONE) for value in sweep],
+        number=10, repeat=5
+    )) / 10
+    print(f"{'scalar conversion of ' + str(len(sweep)) + ' values':<45} {seconds * 1e3:8.2f} ms")
+    seconds = min(timeit.repeat(
+        lambda: convert_array_to_prefix(sweep, SIPrefix.KILO, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META),
+        number=10, repeat=5
+    )) / 10
+    print(f"{'convert_array_to_prefix of ' + str(len(sweep)) + ' values':<45} {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
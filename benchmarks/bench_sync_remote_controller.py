@@ -0,0 +1,75 @@
+"""!
+Compares the per call overhead of running coroutines with loop.run_until_complete, like the CLI and robot tests did,
+with submitting them to the EventLoopThread of the SyncRemoteController.
+It also counts, how often a background task, that stands in for the updater, ran while the caller was busy between calls.
+
+Run it with: python benchmarks/bench_sync_remote_controller.py
+"""
+import asyncio
+import time
+import timeit
+
+from soniccontrol.sync_remote_controller import EventLoopThread
+
+
+NUMBER = 2_000
+CALLER_BUSY_S = 0.01
+NUMBER_OF_BUSY_CALLS = 20
+
+
+async def fake_command() -> str:
+    await asyncio.sleep(0)
+    return "#1000"
+
+
+class BackgroundTicker:
+    def __init__(self) -> None:
+        self.ticks = 0
+
+    async def run(self) -> None:
+        while True:
+            self.ticks += 1
+            await asyncio.sleep(0.001)
+
+
+def bench(name: str, func) -> None:
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    print(f"{name:<45} {seconds / NUMBER * 1e6:8.1f} us")
+
+
+def count_background_ticks(run, start_task) -> int:
+    ticker = BackgroundTicker()
+    start_task(ticker)
+    for _ in range(NUMBER_OF_BUSY_CALLS):
+        run(fake_command())
+        time.sleep(CALLER_BUSY_S) # the caller waits for user input or robot keywords
+    return ticker.ticks
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    bench("loop.run_until_complete", lambda: loop.run_until_complete(fake_command()))
+
+    with EventLoopThread() as loop_thread:
+        bench("EventLoopThread.run", lambda: loop_thread.run(fake_command()))
+
+        thread_ticks = count_background_ticks(
+            loop_thread.run, lambda ticker: loop_thread.call(lambda: asyncio.create_task(ticker.run()))
+        )
+
+    run_until_complete_ticks = count_background_ticks(
+        loop.run_until_complete, lambda ticker: loop.create_task(ticker.run())
+    )
+    for task in asyncio.all_tasks(loop):
+        task.cancel()
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+    busy_ms = NUMBER_OF_BUSY_CALLS * CALLER_BUSY_S * 1000
+    print(f"background ticks during {busy_ms:.0f} ms of caller work:")
+    print(f"{'  loop.run_until_complete':<45} {run_until_complete_ticks:8d}")
+    print(f"{'  EventLoopThread':<45} {thread_ticks:8d}")
+
+
+if __name__ == "__main__":
+    main()
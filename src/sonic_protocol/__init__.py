@@ -1 +1,4 @@
-from sonic_protocol.user_manual_compiler import build_manual
+def build_manual():
+    # imported here, so that every import of sonic_protocol does not also import the manual compilers
+    from sonic_protocol.user_manual_compiler import build_manual as _build_manual
+    _build_manual()
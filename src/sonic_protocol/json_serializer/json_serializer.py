@@ -1,8 +1,8 @@
+from collections.abc import Mapping
 from enum import Enum
 import json
 import attrs
 import numpy as np
-from sonic_protocol.protocol import protocol
 
 class ProtocolJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -18,7 +18,7 @@ class ProtocolJSONEncoder(json.JSONEncoder):
             }
         if isinstance(obj, type):
             return obj.__name__
-        if isinstance(obj, dict):
+        if isinstance(obj, Mapping):
             return {
                 key: self.default(value) for key, value in obj.items()
             }
@@ -31,6 +31,10 @@ class ProtocolJSONEncoder(json.JSONEncoder):
         return json.dumps(obj=obj)
 
 if __name__ == "__main__":
+    from sonic_protocol.protocol import protocol_list
+    from sonic_protocol.schema import DeviceType, ProtocolType
+
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
     json_data = json.dumps(protocol, cls=ProtocolJSONEncoder, indent=2)
     with open("generated/protocol.json", "w") as f:
         f.write(json_data)
\ No newline at end of file
@@ -0,0 +1,272 @@
+import hashlib
+import importlib
+import json
+import logging
+import os
+from collections.abc import MutableMapping
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+import attrs
+import numpy as np
+
+from sonic_protocol.schema import CommandContract, ICommandCode, Protocol, ProtocolType
+
+
+# Increment this, if the format of the snapshots changes, so that old snapshots are not used anymore
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Only types from these modules are resolved, when a snapshot is loaded
+_ALLOWED_TYPE_MODULES = ("builtins", "numpy", "sonic_protocol")
+# The builtins are only referenced as field types and never instantiated
+_ALLOWED_BUILTIN_TYPES = (bool, int, float, str)
+
+# Files that define how the protocols are built. If one of them changes, the snapshots get rebuilt
+_SOURCE_PATHS = ("protocols", "schema.py", "command_codes.py", "field_names.py", "protocol_list.py", "si_unit.py")
+
+
+class ProtocolSnapshotEncoder:
+    """!
+    Encodes a built protocol into a compact json compatible form, that can be decoded back into the same protocol.
+    Unlike the ProtocolJSONEncoder, it keeps all type information:
+    Classes and enums are stored as references into a type table, attrs classes only store the fields that differ from the default
+    and each command contract is encoded on its own, so that they can be decoded lazily.
+    """
+    def __init__(self):
+        self._types: List[str] = []
+        self._type_indices: Dict[type, int] = {}
+
+    def encode(self, protocol: Protocol) -> Dict[str, Any]:
+        protocol_fields = {
+            field.name: self._encode_value(getattr(protocol, field.name))
+            for field in attrs.fields(Protocol) if field.name != "command_contracts"
+        }
+        contracts = [
+            [self._encode_value(code), self._encode_value(command_contract)]
+            for code, command_contract in protocol.command_contracts.items()
+        ]
+        return {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "types": self._types,
+            "protocol": protocol_fields,
+            "contracts": contracts,
+        }
+
+    def _type_index(self, cls: type) -> int:
+        index = self._type_indices.get(cls)
+        if index is None:
+            index = len(self._types)
+            self._types.append(f"{cls.__module__}:{cls.__qualname__}")
+            self._type_indices[cls] = index
+        return index
+
+    def _encode_value(self, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, Enum):
+            return {"e": self._type_index(type(value)), "n": value.name}
+        if isinstance(value, np.generic):
+            return {"s": self._type_index(type(value)), "v": value.item()}
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, type):
+            return {"c": self._type_index(value)}
+        if attrs.has(type(value)):
+            encoded_fields = {}
+            for field in attrs.fields(type(value)):
+                if not field.init:
+                    continue
+                field_value = getattr(value, field.name)
+                if field.default is not attrs.NOTHING and not isinstance(field.default, attrs.Factory) \
+                        and type(field.default) is type(field_value) and field.default == field_value:
+                    continue
+                encoded_fields[field.alias] = self._encode_value(field_value)
+            return {"a": self._type_index(type(value)), "f": encoded_fields}
+        if isinstance(value, tuple):
+            return {"t": [self._encode_value(item) for item in value]}
+        if isinstance(value, list):
+            return [self._encode_value(item) for item in value]
+        if isinstance(value, (dict, MutableMapping)):
+            return {"d": [[self._encode_value(key), self._encode_value(item)] for key, item in value.items()]}
+        raise TypeError(f"Cannot encode {value!r} of type {type(value)} into a protocol snapshot")
+
+
+class ProtocolSnapshotDecoder:
+    """! Decodes the values encoded by the ProtocolSnapshotEncoder """
+    def __init__(self, type_names: List[str]):
+        self._type_names = type_names
+        self._types: List[type | None] = [None] * len(type_names)
+
+    def _resolve_type(self, index: int) -> type:
+        """! Only primitive builtins, enums, attrs classes and numpy scalar types are resolved, so that a snapshot cannot call arbitrary functions """
+        cls = self._types[index]
+        if cls is None:
+            type_name = self._type_names[index]
+            module_name, qualname = type_name.split(":")
+            if module_name.split(".")[0] not in _ALLOWED_TYPE_MODULES:
+                raise ValueError(f"The type {type_name} is not allowed in a protocol snapshot")
+            resolved: Any = importlib.import_module(module_name)
+            for name in qualname.split("."):
+                resolved = getattr(resolved, name)
+            if module_name == "builtins":
+                is_allowed = any(resolved is allowed_type for allowed_type in _ALLOWED_BUILTIN_TYPES)
+            else:
+                is_allowed = isinstance(resolved, type) \
+                    and (issubclass(resolved, (Enum, np.generic)) or attrs.has(resolved))
+            if not is_allowed:
+                raise ValueError(f"The type {type_name} is not allowed in a protocol snapshot")
+            cls = resolved
+            self._types[index] = cls
+        return cls
+
+    def _resolve_subclass(self, index: int, base: type) -> type:
+        cls = self._resolve_type(index)
+        if not issubclass(cls, base):
+            raise ValueError(f"The type {self._type_names[index]} is not a {base.__name__}")
+        return cls
+
+    def decode_value(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode_value(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "a" in value:
+            cls = self._resolve_type(value["a"])
+            if not attrs.has(cls):
+                raise ValueError(f"The type {self._type_names[value['a']]} is not an attrs class")
+            return cls(**{name: self.decode_value(item) for name, item in value["f"].items()})
+        if "e" in value:
+            return self._resolve_subclass(value["e"], Enum)[value["n"]]
+        if "c" in value:
+            return self._resolve_type(value["c"])
+        if "t" in value:
+            return tuple(self.decode_value(item) for item in value["t"])
+        if "d" in value:
+            return {self.decode_value(key): self.decode_value(item) for key, item in value["d"]}
+        if "s" in value:
+            return self._resolve_subclass(value["s"], np.generic)(value["v"])
+        raise ValueError(f"Unknown value in protocol snapshot: {value}")
+
+
+class LazyCommandContracts(MutableMapping):
+    """!
+    Maps the command codes to the command contracts of a protocol loaded from a snapshot.
+    The command contracts are only decoded, when they are accessed for the first time.
+    """
+    def __init__(self, decoder: ProtocolSnapshotDecoder, encoded_contracts: Dict[ICommandCode, Any]):
+        self._decoder = decoder
+        self._encoded_contracts = encoded_contracts
+        self._contracts: Dict[ICommandCode, CommandContract | None] = dict.fromkeys(encoded_contracts)
+
+    def __getitem__(self, code: ICommandCode) -> CommandContract:
+        command_contract = self._contracts[code]
+        if command_contract is None:
+            command_contract = self._decoder.decode_value(self._encoded_contracts.pop(code))
+            self._contracts[code] = command_contract
+        return command_contract # type: ignore
+
+    def __setitem__(self, code: ICommandCode, command_contract: CommandContract) -> None:
+        self._encoded_contracts.pop(code, None)
+        self._contracts[code] = command_contract
+
+    def __delitem__(self, code: ICommandCode) -> None:
+        del self._contracts[code]
+        self._encoded_contracts.pop(code, None)
+
+    def __iter__(self) -> Iterator[ICommandCode]:
+        return iter(self._contracts)
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._contracts
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._contracts)})"
+
+
+def dump_protocol_snapshot(protocol: Protocol) -> str:
+    return json.dumps(ProtocolSnapshotEncoder().encode(protocol), separators=(",", ":"), ensure_ascii=False)
+
+
+def load_protocol_snapshot(snapshot: str) -> Protocol:
+    """!
+    Loads a protocol from a snapshot created by dump_protocol_snapshot.
+    Only the schema, the command codes and field names get imported, but not the protocol definitions.
+    """
+    data = json.loads(snapshot)
+    if data.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported protocol snapshot format: {data.get('format')}")
+    decoder = ProtocolSnapshotDecoder(data["types"])
+    protocol_fields = { name: decoder.decode_value(value) for name, value in data["protocol"].items() }
+    encoded_contracts = { decoder.decode_value(code): contract for code, contract in data["contracts"] }
+    return Protocol(command_contracts=LazyCommandContracts(decoder, encoded_contracts), **protocol_fields) # type: ignore
+
+
+def _import_protocol_list() -> Any:
+    return importlib.import_module("sonic_protocol.protocol").protocol_list
+
+
+class ProtocolSnapshotStore:
+    """!
+    Builds protocols like a ProtocolList, but caches the built protocols as snapshots on disk.
+    If a snapshot exists, the protocol is loaded from it without importing the protocol definition modules,
+    which takes most of the startup time of short running programs, like the cli.
+
+    The snapshots are keyed by the protocol type and a fingerprint of the protocol definition sources,
+    so a changed protocol definition gets rebuilt automatically.
+    """
+    def __init__(self, snapshot_dir: Path, protocol_list_loader: Callable[[], Any] = _import_protocol_list,
+                 logger: logging.Logger = logging.getLogger()):
+        self._snapshot_dir = snapshot_dir
+        self._protocol_list_loader = protocol_list_loader
+        self._logger = logging.getLogger(logger.name + "." + ProtocolSnapshotStore.__name__)
+        self._source_fingerprint: str | None = None
+
+    @staticmethod
+    def compute_source_fingerprint() -> str | None:
+        """! Returns None, if the sources cannot be found, for example in frozen builds """
+        package_dir = Path(__file__).resolve().parent.parent
+        entries: List[str] = [str(SNAPSHOT_FORMAT_VERSION)]
+        for source_path in _SOURCE_PATHS:
+            path = package_dir / source_path
+            files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+            for file in files:
+                try:
+                    stat = file.stat()
+                except OSError:
+                    return None
+                entries.append(f"{file.relative_to(package_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha256("\n".join(entries).encode()).hexdigest()[:32]
+
+    def get_snapshot_path(self, protocol_type: ProtocolType) -> Path | None:
+        if self._source_fingerprint is None:
+            self._source_fingerprint = ProtocolSnapshotStore.compute_source_fingerprint()
+            if self._source_fingerprint is None:
+                return None
+        build_str = "release" if protocol_type.is_release else "debug"
+        opts_str = f"_{protocol_type.additional_opts}" if protocol_type.additional_opts else ""
+        file_name = f"protocol_snapshot_{protocol_type.device_type.value}_{protocol_type.version}_{build_str}{opts_str}_{self._source_fingerprint}.json"
+        return self._snapshot_dir / file_name
+
+    def build_protocol_for(self, protocol_type: ProtocolType) -> Protocol:
+        snapshot_path = self.get_snapshot_path(protocol_type)
+        if snapshot_path is not None and snapshot_path.exists():
+            try:
+                return load_protocol_snapshot(snapshot_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                self._logger.warning("Could not load the protocol snapshot %s, rebuilding the protocol: %s", snapshot_path, e)
+
+        protocol = self._protocol_list_loader().build_protocol_for(protocol_type)
+        if snapshot_path is not None:
+            try:
+                self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+                # write to a temporary file first, so that concurrent processes never load a half written file
+                tmp_file = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_file.write_text(dump_protocol_snapshot(protocol), encoding="utf-8")
+                os.replace(tmp_file, snapshot_path)
+            except (OSError, TypeError) as e:
+                self._logger.warning("Could not save the protocol snapshot %s: %s", snapshot_path, e)
+        return protocol
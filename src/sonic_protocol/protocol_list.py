@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
+import typing
 from sonic_protocol.command_codes import ICommandCode
 from sonic_protocol.schema import DeviceParamConstantType, DeviceType, IEFieldName, ProtocolType, Protocol, Version, CommandContract
 import abc
@@ -6,6 +7,14 @@ import attrs
 
 
 
+class IProtocolFactory(typing.Protocol):
+    """
+        Interface for everything that can build protocols, like the ProtocolList or the ProtocolSnapshotStore.
+    """
+    def build_protocol_for(self, protocol_type: ProtocolType) -> Protocol:
+        ...
+
+
 class ProtocolList:
     """
         This class is the base class for protocol classes.
@@ -92,4 +101,20 @@ class ProtocolList:
 
         return protocol
 
-
+    def get_all_protocol_types(self) -> List[ProtocolType]:
+        """
+            Returns all combinations of version, device type and build type, that this protocol list and its previous protocols support.
+            The versions are sorted from oldest to newest.
+        """
+        versions: List[Version] = []
+        protocol: ProtocolList | None = self
+        while protocol is not None:
+            versions.append(protocol.version)
+            protocol = protocol.previous_protocol
+
+        return [
+            ProtocolType(version, device_type, is_release)
+            for version in reversed(versions)
+            for device_type in DeviceType if self.supports_device_type(device_type)
+            for is_release in (True, False)
+        ]
@@ -510,7 +510,7 @@ float_param = FieldType(
 
 param_atf = CommandParamDef(
     name=EFieldName.ATF,
-    param_type=uint32_param
+    param_type=uint32_param.param_type
 )
 
 param_att = CommandParamDef(
@@ -1,10 +1,10 @@
 import copy
-from enum import Enum, IntEnum
+from enum import Enum
 from typing import List
 from sonic_protocol.field_names import EFieldName
 from sonic_protocol.schema import (
     CommandParamDef, ControlMode, ConverterType, FieldType, SIPrefix, SIUnit, SonicTextAnswerFieldAttrs, SonicTextCommandAttrs, UserManualAttrs, CommandDef, AnswerDef,
-    AnswerFieldDef, CommandContract, SystemState, TransducerState, Anomaly
+    AnswerFieldDef, CommandContract, SystemState, TransducerState, Anomaly, DeviceState
 )
 from sonic_protocol.protocols.protocol_v1_0_0.flashing_commands.flashing_commands import field_success
 from sonic_protocol.protocols.protocol_v1_0_0.generic_commands.generic_fields import field_message
@@ -291,14 +291,6 @@ for idx, field in enumerate(get_update_worker_v2_0_0.answer_def.fields):
         break
 
 
-class DeviceState(IntEnum):
-    OFF = 0
-    BROKEN = 1
-    READY = 2
-    SERVICE = 3
-    WAKE_UP = 4
-    EXIT_APP = 5
-
 field_type_device_state = FieldType(
     field_type=DeviceState,
     converter_ref=ConverterType.ENUM
@@ -1,7 +1,7 @@
 
 
 import re
-from typing import Any, Callable, Dict, List,  Optional, Type
+from typing import Any, Callable, Dict, FrozenSet, List,  Optional, Tuple, Type
 
 import attrs
 
@@ -10,16 +10,77 @@ from sonic_protocol.command_codes import CommandCode
 from sonic_protocol.field_names import IEFieldName
 
 
-@attrs.define()    
+# Shared by all answers without fields, so that they do not need to allocate their own index map
+_NO_FIELD_INDICES: Dict[IEFieldName, int] = {}
+
+@attrs.define(eq=False, repr=False)
 class Answer:
+    """!
+    The field values are stored in a tuple. The field indices map the field names to the positions in the tuple.
+    The index map is created once per answer validator and shared by all of its answers.
+    A dict of the fields is only created, if field_value_dict is accessed.
+    """
     message: str = attrs.field(on_setattr=attrs.setters.NO_OP) 
     # TODO: probably better to make an enum ValidationStatus and merge valid and was_validated
     valid: bool = attrs.field(on_setattr=attrs.setters.NO_OP)
     was_validated: bool = attrs.field(on_setattr=attrs.setters.NO_OP)
     command_code: CommandCode | None = attrs.field(default=None)
-    field_value_dict: Dict[IEFieldName, Any] = attrs.field(default={})
+    _field_values: Tuple[Any, ...] = attrs.field(default=())
+    _field_indices: Dict[IEFieldName, int] = attrs.field(default=_NO_FIELD_INDICES)
+    _field_value_dict: Dict[IEFieldName, Any] | None = attrs.field(default=None)
     # received_timestamp: float = attrs.field(factory=time.time, init=False, on_setattr=attrs.setters.NO_OP)
 
+    def __init__(
+        self, 
+        message: str, 
+        valid: bool, 
+        was_validated: bool, 
+        command_code: CommandCode | None = None, 
+        field_value_dict: Dict[IEFieldName, Any] | None = None
+    ) -> None:
+        self.__attrs_init__(message, valid, was_validated, command_code, (), _NO_FIELD_INDICES, field_value_dict) # type: ignore
+
+    @staticmethod
+    def from_field_values(
+        message: str, 
+        field_indices: Dict[IEFieldName, int], 
+        field_values: Tuple[Any, ...], 
+        command_code: CommandCode | None = None
+    ) -> "Answer":
+        """! Creates a valid answer without allocating a dict for the fields """
+        answer = Answer(message, True, True, command_code)
+        answer._field_indices = field_indices
+        answer._field_values = field_values
+        return answer
+
+    @property
+    def field_value_dict(self) -> Dict[IEFieldName, Any]:
+        if self._field_value_dict is None:
+            self._field_value_dict = { 
+                field_name: self._field_values[index] for field_name, index in self._field_indices.items() 
+            }
+        return self._field_value_dict
+
+    @field_value_dict.setter
+    def field_value_dict(self, field_value_dict: Dict[IEFieldName, Any]) -> None:
+        self._field_value_dict = field_value_dict
+
+    def get_value(self, field_name: IEFieldName, default: Any = None) -> Any:
+        if self._field_value_dict is not None:
+            return self._field_value_dict.get(field_name, default)
+        index = self._field_indices.get(field_name)
+        return default if index is None else self._field_values[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Answer):
+            return NotImplemented
+        return (self.message, self.valid, self.was_validated, self.command_code, self.field_value_dict) \
+            == (other.message, other.valid, other.was_validated, other.command_code, other.field_value_dict)
+
+    def __repr__(self) -> str:
+        return f"Answer(message={self.message!r}, valid={self.valid!r}, was_validated={self.was_validated!r}, " \
+            f"command_code={self.command_code!r}, field_value_dict={self.field_value_dict!r})"
+
     @property
     def is_error_msg(self) -> bool:
         return self.command_code is not None and self.command_code.value >= 20000
@@ -33,12 +94,19 @@ class AfterConverter:
 
 @attrs.define()
 class AnswerValidator:
+    """!
+    Validates answers with a regex, that has exactly one capturing group per field converter.
+    The groups are mapped to the field names and converters by their index, in the order of the converters.
+    The whole answer has to match the pattern.
+    """
     pattern: str = attrs.field(on_setattr=attrs.setters.NO_OP)
     field_name_enum: type[IEFieldName] = attrs.field(on_setattr=attrs.setters.NO_OP)
-    _named_pattern: str = attrs.field(init=False)
     _converters: Dict[IEFieldName, Converter] = attrs.field(init=False, repr=False)
     _after_converters: Dict[IEFieldName, AfterConverter] = attrs.field(init=False, repr=False)
     _compiled_pattern: re.Pattern[str] = attrs.field(init=False, repr=False)
+    _group_converters: Tuple[Converter, ...] = attrs.field(init=False, repr=False)
+    _field_indices: Dict[IEFieldName, int] = attrs.field(init=False, repr=False)
+    _field_names: FrozenSet[str] = attrs.field(init=False, repr=False)
 
 
     def __init__(
@@ -48,31 +116,27 @@ class AnswerValidator:
         field_converters: Dict[IEFieldName, Converter | AfterConverter] = {},
     ) -> None:
         """
-        Initializes the CommandValidator instance with the specified pattern and converters.
+        Initializes the AnswerValidator instance with the specified pattern and converters.
 
         Parameters:
-            pattern (str): The pattern to be used.
-            **kwargs:   Additional keyword arguments that are passed to the Converter constructor.
-                        The keyword argument should be a string that is the name of the
-                        value. The value should be a Callable that takes in the value and returns
-                        the value in the correct type. The converted values are available in the
-                        result attribute.
-
-                        Additionally, the keyword argument can be a dictionary with the following
-                        keys: "worker" and "keywords". The "worker" key should be a Callable that
-                        takes in the value and returns the value in the correct type. The "keywords"
-                        are the names of the values used to determine the type of the value. These
-                        are "after converters". They are using the previously converted values.
+            pattern (str): The pattern to be used. It must have one capturing group for each converter.
+                        All other groups have to be non capturing.
+            field_converters: Maps the field names to their converters. The n-th converter
+                        converts the value of the n-th capturing group.
+
+                        Additionally, a field name can be mapped to an AfterConverter. Its convert_func 
+                        takes a dict with the previously converted values, whose field names are in keywords.
+                        AfterConverters have no capturing group.
 
         Example:
-            CommandValidator(
-                pattern="(?P<foo>[a-z]+) (?P<bar>[0-9]+)",
-                foo=int,
-                bar=float,
-                foobar={
-                    "worker": lambda foo, bar: foo * bar,
-                    "keywords": ["foo", "bar"],
+            AnswerValidator(
+                pattern=r"([a-z]+) ([0-9]+)",
+                field_name_enum=EFieldName,
+                field_converters={
+                    EFieldName.FOO: get_converter(ConverterType.PRIMITIVE, str),
+                    EFieldName.BAR: get_converter(ConverterType.PRIMITIVE, int),
                 }
+            )
 
         Returns:
             None
@@ -91,127 +155,52 @@ class AnswerValidator:
         self.field_name_enum = field_name_enum
         self._converters = workers
         self._after_converters = after_workers
-        field_names = [field_name.name for field_name in self._converters.keys()]
-            
-        self._named_pattern = self.generate_named_pattern(
-            pattern=self.pattern, keywords=field_names
-        )
+        self._group_converters = tuple(self._converters.values())
+        self._field_indices = { field_name: index for index, field_name in enumerate(self._converters.keys()) }
+        self._field_names = frozenset(field_name.name for field_name in self._converters.keys())
         self._compiled_pattern = re.compile(
-            pattern=self._named_pattern,
+            pattern=self.pattern,
             flags=re.IGNORECASE,
         )
-
-    @staticmethod
-    def generate_named_pattern(pattern: str, keywords: List[str]) -> str:
-        """
-        Generates a named pattern by replacing the unnamed capture groups in the given pattern with named capture groups.
-
-        Args:
-            pattern (str): The pattern to generate the named pattern from.
-            keywords (List[str]): The list of keywords to use for naming the capture groups.
-
-        Throws:
-            throws an exception, if you do not pass the same number of keyword arguments as captured regex groups
-
-        Returns:
-            str: The generated named pattern.
-
-        Example:
-            >>> generate_named_pattern("(?:foo) (bar) (?:baz)", ["keyword1", "keyword2"])
-            '(?P<keyword1>:foo) (?P<keyword2>(bar)) (?:baz)'
-
-        Note:
-            - The named capture groups are generated using the keywords provided.
-            - The unnamed capture groups are replaced with named capture groups.
-            - The named capture groups are enclosed in parentheses and prefixed with '?P<keyword>'.
-            - The named capture groups are generated in the order of the keywords provided.
-            - If no keywords are provided, the original pattern is returned.
-        """
-        if not keywords:
-            return pattern
-        
-        keyword_iter = iter(keywords)
-        segments = re.split(r"(\(.*?\))", pattern)
-        if len(segments) != (2 * len(keywords)) + 1:
-            # TODO @Thomas add documentation why this is needed
-            segments = AnswerValidator.split_top_level_groups(pattern)
-        processed = "".join(
-            (
-                f"(?P<{next(keyword_iter)}>{segment[1:-1]})"
-                if not segment.startswith("(?:") and segment.startswith("(")
-                else segment
+        if self._compiled_pattern.groups != len(self._group_converters):
+            raise ValueError(
+                f"The pattern {self.pattern!r} has {self._compiled_pattern.groups} capturing groups, "
+                f"but {len(self._group_converters)} converters were given"
             )
-            for segment in segments
-            if segment
-        )
-        assert (next(keyword_iter, None) is None)
-
-        return processed
-    
-    @staticmethod
-    def split_top_level_groups(pattern):
-        segments = []
-        buffer = ''
-        depth = 0
-
-        for i, char in enumerate(pattern):
-            if char == '(':
-                if depth == 0 and buffer:
-                    segments.append(buffer)
-                    buffer = ''
-                depth += 1
-            elif char == ')':
-                depth -= 1
-            elif char == '#' and depth == 0:
-                if buffer:
-                    segments.append(buffer)
-                    buffer = ''
-                segments.append('#')
-                continue
-
-            buffer += char
-
-        if buffer:
-            segments.append(buffer)
-
-        # Ensure the pattern starts and ends with ''
-        segments = [''] + segments
-        segments.append('')
-
-        return segments
 
 
     def validate(self, data: str) -> Answer:
         """
-        Checks if the given data matches the compiled pattern and performs conversions on the matched groups.
-        The converted values are stored in the result attribute.
+        Checks if the whole data matches the compiled pattern and performs conversions on the matched groups.
 
         Args:
             data (str): The input data to check against the pattern.
 
         Returns:
-            bool: True if the data matches the pattern and conversions are successful, False otherwise.
+            Answer: A valid answer with the converted values, if the data matches the pattern and conversions are successful.
+                Otherwise an invalid answer.
         """
 
         #logging.info("Searching: %s", data)
-        result: Optional[re.Match] = self._compiled_pattern.search(data)
+        result: Optional[re.Match] = self._compiled_pattern.fullmatch(data)
         if result is None:
             return Answer(data, False, True)
 
-        result_dict: Dict[IEFieldName, Any] = {}
-        for keyword, value in result.groupdict().items():
-            field_name = self.field_name_enum[keyword.upper()]
-            converter = self._converters[field_name]
-
+        field_values: List[Any] = []
+        for converter, value in zip(self._group_converters, result.groups()):
             if not converter.validate_str(value):
                 return Answer(data, False, True) 
-            result_dict[field_name] = converter.convert_str_to_val(value)
+            field_values.append(converter.convert_str_to_val(value))
+
+        if not self._after_converters:
+            return Answer.from_field_values(data, self._field_indices, tuple(field_values))
 
+        result_dict: Dict[IEFieldName, Any] = dict(zip(self._field_indices.keys(), field_values))
         for field_name, worker in self._after_converters.items():
             kwargs = {
                 k: result_dict.get(field_name)
                 for k in worker.keywords
-                if k in result.groupdict()
+                if k in self._field_names
             }
             result_dict[field_name] = worker.convert_func(kwargs)
 
@@ -1,4 +1,5 @@
-from typing import Dict, List
+import re
+from typing import Dict, List, Tuple
 from sonic_protocol.python_parser.answer import AfterConverter, AnswerValidator
 from sonic_protocol.python_parser.converters import Converter, get_converter
 from sonic_protocol.schema import AnswerDef, AnswerFieldDef, ConverterType
@@ -6,6 +7,13 @@ from sonic_protocol.field_names import IEFieldName
 import numpy as np
 
 
+# matches regex fragments that consist only of plain characters and escaped special characters
+_LITERAL_REGEX_PATTERN = re.compile(r"(?:\\[^0-9A-Za-z]|[^\\.^$*+?{}\[\]|()])*")
+_ESCAPED_CHAR_PATTERN = re.compile(r"\\(.)")
+# upper bounds for the length of a single value, so that no field can consume an arbitrarily long input
+MAX_VALUE_LENGTH = 1024
+MAX_DIGITS = 20
+
 class AnswerValidatorBuilder:
     @staticmethod
     def create_answer_validator(answer_def: AnswerDef, field_enum: type[IEFieldName]) -> AnswerValidator: 
@@ -20,19 +28,36 @@ class AnswerValidatorBuilder:
 
     @staticmethod
     def _create_regex_for_answer(answer_def: AnswerDef) -> str:
+        """!
+        Creates an anchored regex with exactly one capturing group per field.
+        The values of fields without a fixed format can contain every character except newlines and,
+        if the answer has multiple fields, the separator.
+        So no group can overlap with the next field and malformed answers cannot trigger heavy backtracking.
+        """
         assert (not isinstance(answer_def.sonic_text_attrs, list))
 
         regex_patterns: List[str] = []
+        separator = answer_def.sonic_text_attrs.separator
+        any_value_regex = AnswerValidatorBuilder._create_any_value_regex(separator if len(answer_def.fields) > 1 else None)
 
         # TODO: add command code to regex
 
         for answer_field in answer_def.fields:
-            regex_patterns.append(AnswerValidatorBuilder._create_regex_for_answer_field(answer_field)) 
+            regex_patterns.append(AnswerValidatorBuilder._create_regex_for_answer_field(answer_field, any_value_regex)) 
+
+        return r"\A" + re.escape(separator).join(regex_patterns) + r"\Z"
 
-        return answer_def.sonic_text_attrs.separator.join(regex_patterns)
+    @staticmethod
+    def _create_any_value_regex(separator: str | None) -> str:
+        if separator is None or "\n" in separator:
+            # newlines are never part of a value, so the value cannot run into the next line anyway
+            return rf"[^\n]{{0,{MAX_VALUE_LENGTH}}}?"
+        if len(separator) == 1:
+            return rf"[^\n{re.escape(separator)}]{{0,{MAX_VALUE_LENGTH}}}?"
+        return rf"(?:(?!{re.escape(separator)})[^\n]){{0,{MAX_VALUE_LENGTH}}}?"
     
     @staticmethod
-    def _create_regex_for_answer_field(answer_field: AnswerFieldDef) -> str:
+    def _create_regex_for_answer_field(answer_field: AnswerFieldDef, any_value_regex: str = rf"[^\n]{{0,{MAX_VALUE_LENGTH}}}?") -> str:
         assert (not isinstance(answer_field.sonic_text_attrs, list))
         sonic_text_attrs = answer_field.sonic_text_attrs
 
@@ -40,26 +65,53 @@ class AnswerValidatorBuilder:
         field_type = answer_field.field_type.field_type
         if answer_field.field_type.converter_ref is ConverterType.PRIMITIVE:
             if field_type is int or np.issubdtype(field_type, np.integer):
-                value_str = r"[\+\-]?\d+"
+                value_str = rf"[\+\-]?\d{{1,{MAX_DIGITS}}}"
             elif field_type is float:
-                value_str = r"[\+\-]?\d+(\.\d+)?"
+                value_str = rf"[\+\-]?\d{{1,{MAX_DIGITS}}}(?:\.\d{{1,{MAX_DIGITS}}})?"
             elif field_type is bool:
-                value_str = r"([Tt]rue)|([Ff]alse)|0|1"
+                value_str = r"true|false|0|1" # the regex is case insensitive
             elif field_type is str:
-                value_str = r".*"
+                value_str = any_value_regex
             else:
                 assert (False) # should never happen.
         else:
-            value_str = r".*"
+            value_str = any_value_regex
 
         result_str = "(" + value_str + ")" # make a regex group
 
         si_prefix = answer_field.field_type.si_prefix
         si_unit = answer_field.field_type.si_unit
         if si_prefix and si_unit:
-            result_str += " " + si_prefix.symbol + si_unit.value
+            result_str += re.escape(" " + si_prefix.symbol + si_unit.value)
         elif si_unit:
-            result_str += " " + si_unit.value
+            result_str += re.escape(" " + si_unit.value)
      
         
-        return sonic_text_attrs.prefix + result_str + sonic_text_attrs.postfix
\ No newline at end of file
+        return sonic_text_attrs.prefix + result_str + sonic_text_attrs.postfix
+
+    @staticmethod
+    def _regex_to_literal(regex: str) -> str | None:
+        if _LITERAL_REGEX_PATTERN.fullmatch(regex) is None:
+            return None
+        return _ESCAPED_CHAR_PATTERN.sub(r"\1", regex)
+
+    @staticmethod
+    def get_literal_affixes(answer_field: AnswerFieldDef) -> Tuple[str, str] | None:
+        """!
+        Returns the literal text in front of the value and the literal text after it (unit and postfix).
+        Returns None, if the prefix or postfix of the field contain regex syntax and can therefore only be matched by the regex.
+        """
+        assert (not isinstance(answer_field.sonic_text_attrs, list))
+        prefix = AnswerValidatorBuilder._regex_to_literal(answer_field.sonic_text_attrs.prefix)
+        postfix = AnswerValidatorBuilder._regex_to_literal(answer_field.sonic_text_attrs.postfix)
+        if prefix is None or postfix is None:
+            return None
+
+        unit = ""
+        si_prefix = answer_field.field_type.si_prefix
+        si_unit = answer_field.field_type.si_unit
+        if si_prefix and si_unit:
+            unit = " " + si_prefix.symbol + si_unit.value
+        elif si_unit:
+            unit = " " + si_unit.value
+        return prefix, unit + postfix
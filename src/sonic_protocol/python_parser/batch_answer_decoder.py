@@ -0,0 +1,223 @@
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from sonic_protocol.python_parser.answer import AnswerValidator
+from sonic_protocol.python_parser.answer_validator_builder import MAX_DIGITS, MAX_VALUE_LENGTH, AnswerValidatorBuilder
+from sonic_protocol.python_parser.converters import EnumConverter, get_converter
+from sonic_protocol.schema import AnswerDef, AnswerFieldDef, ConverterType, IEFieldName
+
+
+class BatchAnswerDecoder:
+    """!
+    Decodes many answer strings at once into a numpy structured array.
+    This is meant for offline analysis of recorded answers, like the ones of ?update from logs.
+
+    All lines are joined and split at once and each column is converted with vectorized numpy string functions.
+    Lines that cannot be decoded like this (different casing of units, newlines, ...)
+    are validated one by one with the AnswerValidator, so the results are the same as validating each line.
+
+    The columns are named after the field names. Numbers get the dtype of the field,
+    enums, strings, versions and timestamps are stored as objects.
+    """
+    def __init__(self, answer_def: AnswerDef, field_enum: type[IEFieldName]):
+        assert not isinstance(answer_def.sonic_text_attrs, list)
+        self._answer_def = answer_def
+        self._separator = answer_def.sonic_text_attrs.separator
+        self._fields: List[AnswerFieldDef] = answer_def.fields
+        self._validator: AnswerValidator = AnswerValidatorBuilder.create_answer_validator(answer_def, field_enum)
+        self._dtype = np.dtype([
+            (answer_field.field_name.name, BatchAnswerDecoder._get_column_dtype(answer_field))
+            for answer_field in self._fields
+        ])
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @staticmethod
+    def _get_column_dtype(answer_field: AnswerFieldDef) -> Any:
+        field_type = answer_field.field_type
+        if field_type.converter_ref is ConverterType.PRIMITIVE and field_type.field_type is not str:
+            return np.int64 if field_type.field_type is int else field_type.field_type
+        return object
+
+    def decode(self, lines: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """!
+        Returns a structured array with a row for each line and a boolean mask that tells, which lines were valid.
+        The rows of invalid lines are filled with zeros and Nones.
+        """
+        result = np.zeros(len(lines), dtype=self._dtype)
+        for answer_field in self._fields:
+            if self._dtype[answer_field.field_name.name] == object:
+                result[answer_field.field_name.name] = None
+        if len(lines) == 0:
+            return result, np.zeros(0, dtype=bool)
+
+        num_separators = len(self._fields) - 1
+        # The regex "." does not match newlines, so those lines are left to the answer validator
+        is_decodable = np.fromiter(
+            (line.count(self._separator) == num_separators and "\n" not in line for line in lines), 
+            dtype=bool, count=len(lines)
+        )
+        decodable_indices = np.flatnonzero(is_decodable)
+
+        if decodable_indices.size > 0 and len(self._fields) > 0:
+            decodable_lines = lines if decodable_indices.size == len(lines) else [lines[i] for i in decodable_indices]
+            columns = np.array(self._separator.join(decodable_lines).split(self._separator), dtype=str) \
+                .reshape(len(decodable_lines), len(self._fields))
+            rows_valid = np.ones(len(decodable_lines), dtype=bool)
+            column_values: List[np.ndarray] = []
+            for column_index, answer_field in enumerate(self._fields):
+                values, column_valid = self._decode_column(columns[:, column_index], answer_field)
+                rows_valid &= column_valid
+                column_values.append(values)
+            for answer_field, values in zip(self._fields, column_values):
+                result[answer_field.field_name.name][decodable_indices[rows_valid]] = values[rows_valid]
+            is_decodable[decodable_indices[~rows_valid]] = False
+
+        valid = is_decodable
+        for line_index in np.flatnonzero(~is_decodable):
+            answer = self._validator.validate(lines[line_index])
+            if not answer.valid:
+                continue
+            valid[line_index] = True
+            for field_name, value in answer.field_value_dict.items():
+                result[field_name.name][line_index] = value
+        return result, valid
+
+    def decode_to_dataframe(self, lines: Sequence[str]) -> pd.DataFrame:
+        """! Returns a dataframe with the valid lines """
+        result, valid = self.decode(lines)
+        return pd.DataFrame(result[valid])
+
+    def _decode_column(self, column: np.ndarray, answer_field: AnswerFieldDef) -> Tuple[np.ndarray, np.ndarray]:
+        """!
+        Converts the column. Returns the converted values and the mask of the valid entries.
+        """
+        valid = np.ones(column.shape, dtype=bool)
+        affixes = AnswerValidatorBuilder.get_literal_affixes(answer_field)
+        if affixes is None:
+            return np.zeros(column.shape, dtype=self._dtype[answer_field.field_name.name]), ~valid
+        prefix, suffix = affixes
+        if prefix:
+            valid &= np.char.startswith(column, prefix)
+            column = BatchAnswerDecoder._remove_prefix(column, len(prefix))
+        if suffix:
+            valid &= np.char.endswith(column, suffix)
+            column = BatchAnswerDecoder._remove_suffix(column, len(suffix), valid)
+
+        field_type = answer_field.field_type
+        target_class = field_type.field_type
+        if field_type.converter_ref is not ConverterType.PRIMITIVE or target_class is str:
+            # the regex matches these values only up to MAX_VALUE_LENGTH
+            valid &= np.char.str_len(column) <= MAX_VALUE_LENGTH
+        values: np.ndarray
+        if field_type.converter_ref is ConverterType.PRIMITIVE and target_class is bool:
+            lowered = np.char.lower(column)
+            valid &= np.isin(lowered, ["true", "1", "false", "0"])
+            values = np.isin(lowered, ["true", "1"])
+        elif field_type.converter_ref is ConverterType.PRIMITIVE and (target_class is int or np.issubdtype(target_class, np.integer)):
+            unsigned, has_valid_sign = BatchAnswerDecoder._strip_sign(column)
+            values, are_digits = BatchAnswerDecoder._parse_unsigned_integers(unsigned)
+            values = np.where(np.char.startswith(column, "-"), -values, values)
+            valid &= has_valid_sign & are_digits
+            if target_class is not int:
+                type_info = np.iinfo(target_class)
+                valid &= (values >= type_info.min) & (values <= type_info.max)
+        elif field_type.converter_ref is ConverterType.PRIMITIVE and target_class is float:
+            unsigned, has_valid_sign = BatchAnswerDecoder._strip_sign(column)
+            integer_part = np.char.partition(unsigned, ".")
+            has_fraction = integer_part[:, 1] == "."
+            valid &= has_valid_sign & np.char.isdecimal(integer_part[:, 0]) \
+                & (np.char.str_len(integer_part[:, 0]) <= MAX_DIGITS) \
+                & (~has_fraction | (np.char.isdecimal(integer_part[:, 2]) & (np.char.str_len(integer_part[:, 2]) <= MAX_DIGITS)))
+            values = BatchAnswerDecoder._convert_numbers(column, valid, np.float64)
+        elif field_type.converter_ref is ConverterType.PRIMITIVE:
+            values = column.astype(object)
+        else:
+            # There are only a few different values, so each of them gets only converted once
+            unique_values, inverse = np.unique(column, return_inverse=True)
+            converted = np.empty(len(unique_values), dtype=object)
+            unique_valid = np.zeros(len(unique_values), dtype=bool)
+            converter = get_converter(field_type.converter_ref, target_class)
+            for i, unique_value in enumerate(unique_values.tolist()):
+                if isinstance(converter, EnumConverter):
+                    converted[i] = converter.member_lookup.get(unique_value.casefold())
+                    unique_valid[i] = converted[i] is not None
+                elif converter.validate_str(unique_value):
+                    converted[i] = converter.convert_str_to_val(unique_value)
+                    unique_valid[i] = True
+            valid &= unique_valid[inverse.reshape(-1)]
+            values = converted[inverse.reshape(-1)]
+
+        return values, valid
+
+    @staticmethod
+    def _to_code_points(column: np.ndarray) -> np.ndarray:
+        column = np.ascontiguousarray(column)
+        max_length = column.dtype.itemsize // 4
+        return column.view(np.uint32).reshape(len(column), max_length)
+
+    @staticmethod
+    def _from_code_points(code_points: np.ndarray) -> np.ndarray:
+        if code_points.shape[1] == 0:
+            return np.zeros(len(code_points), dtype="<U1")
+        return np.ascontiguousarray(code_points).view(f"<U{code_points.shape[1]}").reshape(len(code_points))
+
+    @staticmethod
+    def _remove_prefix(column: np.ndarray, prefix_length: int) -> np.ndarray:
+        """! Removes the first prefix_length characters of each entry, like s[prefix_length:] """
+        return BatchAnswerDecoder._from_code_points(BatchAnswerDecoder._to_code_points(column)[:, prefix_length:])
+
+    @staticmethod
+    def _remove_suffix(column: np.ndarray, suffix_length: int, valid: np.ndarray) -> np.ndarray:
+        """!
+        Removes the last suffix_length characters of the valid entries, like s[:-suffix_length].
+        The strings are padded with zeros, so the suffix is removed by overwriting it with zeros.
+        """
+        code_points = BatchAnswerDecoder._to_code_points(column).copy()
+        positions = np.arange(code_points.shape[1])
+        suffix_starts = np.char.str_len(column) - suffix_length
+        code_points[(positions >= suffix_starts[:, np.newaxis]) & valid[:, np.newaxis]] = 0
+        return BatchAnswerDecoder._from_code_points(code_points)
+
+    @staticmethod
+    def _strip_sign(column: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """! Returns the column without signs and a mask, that is False for entries with more than one sign """
+        unsigned = np.char.lstrip(column, "+-")
+        return unsigned, (np.char.str_len(column) - np.char.str_len(unsigned)) <= 1
+
+    @staticmethod
+    def _parse_unsigned_integers(column: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """!
+        Parses the integers directly from the code points of the strings, which is a lot faster than astype.
+        Returns the values and a mask that is False for entries that are empty, too long or contain non digit characters.
+        """
+        MAX_INT64_DIGITS = 18 # so that the values fit into int64
+        column = np.ascontiguousarray(column)
+        max_length = column.dtype.itemsize // 4
+        lengths = np.char.str_len(column)
+        if max_length == 0:
+            return np.zeros(column.shape, dtype=np.int64), np.zeros(column.shape, dtype=bool)
+
+        digits = column.view(np.uint32).reshape(len(column), max_length).astype(np.int64) - ord("0")
+        positions = np.arange(max_length)
+        is_inside = positions < lengths[:, np.newaxis]
+        are_digits = ((digits >= 0) & (digits <= 9)) | ~is_inside
+        valid = are_digits.all(axis=1) & (lengths > 0) & (lengths <= MAX_INT64_DIGITS)
+
+        exponents = np.clip(lengths[:, np.newaxis] - 1 - positions, 0, MAX_INT64_DIGITS)
+        digits = np.where(is_inside & valid[:, np.newaxis], digits, 0)
+        values = (digits * (10 ** exponents)).sum(axis=1)
+        return values, valid
+
+    @staticmethod
+    def _convert_numbers(column: np.ndarray, valid: np.ndarray, dtype: Any) -> np.ndarray:
+        try:
+            return np.where(valid, column, "0").astype(dtype)
+        except (ValueError, OverflowError):
+            # isdecimal also accepts non ascii digits, that numpy cannot parse. Leave those to the answer validator
+            valid[:] = False
+            return np.zeros(column.shape, dtype=dtype)
@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, List, Optional
 from typing_extensions import Dict
 from sonic_protocol.command_codes import ICommandCode
-from sonic_protocol.schema import SonicTextCommandAttrs
+from sonic_protocol.schema import CommandParamDef, SonicTextCommandAttrs
 from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.python_parser.converters import get_converter
 from sonic_protocol.schema import Protocol
 import re
 
@@ -16,39 +17,112 @@ class DeserializedCommand(Command):
         return self._args
 
 
+class CommandIdentifierTrie:
+    """!
+    Prefix tree over the string identifiers of the commands.
+    Used for autocompletion of the commands in the monitor.
+    """
+    def __init__(self):
+        self._children: Dict[str, CommandIdentifierTrie] = {}
+        self._command_code: ICommandCode | None = None
+
+    def insert(self, identifier: str, command_code: ICommandCode) -> None:
+        node = self
+        for char in identifier:
+            node = node._children.setdefault(char, CommandIdentifierTrie())
+        node._command_code = command_code
+
+    def find_completions(self, prefix: str) -> List[str]:
+        """! Returns all identifiers that start with the prefix in sorted order """
+        node: CommandIdentifierTrie | None = self
+        for char in prefix:
+            node = node._children.get(char)
+            if node is None:
+                return []
+
+        completions: List[str] = []
+        stack = [(prefix, node)]
+        while stack:
+            identifier, node = stack.pop()
+            if node._command_code is not None:
+                completions.append(identifier)
+            stack.extend((identifier + char, child) for char, child in node._children.items())
+        return sorted(completions)
+
+
 class CommandDeserializer:
     def __init__(self, protocol: Protocol):
         self._command_contracts = protocol.command_contracts
         self._compiled_command_regex = self._compile_command_regex()
-
-    def _find_command_contract_for_identifier(self, command_identifier: str) -> ICommandCode | None:
-        for command_code, command_contract in self._command_contracts.items():
+        self._identifier_lookup: Dict[str, ICommandCode] = {}
+        self._identifier_trie = CommandIdentifierTrie()
+        # iterate in reverse, so that the first command contract wins, if two contracts share an identifier
+        for command_code, command_contract in reversed(list(self._command_contracts.items())):
             # We need this because of notify command contract
             if command_contract.command_def is None:
                 continue
 
             string_identifiers = command_contract.command_def.sonic_text_attrs.string_identifier
             string_identifiers = string_identifiers if isinstance(string_identifiers, list) else [string_identifiers]
-            if command_identifier in string_identifiers:
-                return command_code
-        return None
+            for string_identifier in string_identifiers:
+                self._identifier_lookup[string_identifier] = command_code
+                self._identifier_trie.insert(string_identifier, command_code)
+
+    @property
+    def identifier_trie(self) -> CommandIdentifierTrie:
+        return self._identifier_trie
+
+    def _find_command_contract_for_identifier(self, command_identifier: str) -> ICommandCode | None:
+        return self._identifier_lookup.get(command_identifier)
 
     def _compile_command_regex(self):
         command_identifier_regex = r"(?P<command_identifier>([\!\?\-\=][_a-zA-Z]*)|([_a-zA-Z]+))"
-        index_regex = r"((\d+)|(\[.+\]))"
-        command_regex = rf"{command_identifier_regex}{index_regex}?(\=.+)?"
+        index_regex = r"(?P<index>(\d+)|(\[.+\]))"
+        command_regex = rf"{command_identifier_regex}{index_regex}?(\=(?P<value>.+))?"
         compiled_pattern = re.compile(command_regex)
         return compiled_pattern
 
     def get_deserialized_command_code(self, command_str: str) -> ICommandCode | None:
         match_result = re.match(self._compiled_command_regex, command_str)
-        
+
         if match_result is None:
             return None
-    
+
         command_identifier = match_result.group("command_identifier")
         command_code = self._find_command_contract_for_identifier(command_identifier)
 
         return command_code
 
-    
+    def deserialize_command(self, command_str: str) -> DeserializedCommand | None:
+        """!
+        Deserializes a command string into its command code, index and value.
+        The index and value are converted with the converters of the command params.
+        If they cannot be converted, the raw strings are kept.
+        """
+        match_result = re.match(self._compiled_command_regex, command_str)
+        if match_result is None:
+            return None
+
+        command_code = self._find_command_contract_for_identifier(match_result.group("command_identifier"))
+        if command_code is None:
+            return None
+
+        command_def = self._command_contracts[command_code].command_def
+        assert command_def is not None
+        args: Dict[str, Any] = {}
+        index_str: Optional[str] = match_result.group("index")
+        if index_str is not None:
+            args["index"] = CommandDeserializer._convert_param(command_def.index_param, index_str)
+        value_str: Optional[str] = match_result.group("value")
+        if value_str is not None:
+            args["value"] = CommandDeserializer._convert_param(command_def.setter_param, value_str)
+        return DeserializedCommand(command_code, args)
+
+    @staticmethod
+    def _convert_param(param_def: CommandParamDef | None, text: str) -> Any:
+        if param_def is None:
+            return text
+        converter = get_converter(param_def.param_type.converter_ref, param_def.param_type.field_type)
+        if not converter.validate_str(text):
+            return text
+        return converter.convert_str_to_val(text)
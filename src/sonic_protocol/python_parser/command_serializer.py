@@ -1,11 +1,40 @@
 from enum import Enum
-from typing import Any
+from typing import Any, Dict
+
+import attrs
 from sonic_protocol.python_parser.commands import Command
-from sonic_protocol.schema import Protocol
+from sonic_protocol.schema import CommandDef, ICommandCode, Protocol
+
+
+@attrs.define(frozen=True)
+class CommandTemplate:
+    """!
+    Precompiled serialization instructions for a single command code.
+    The identifier is resolved once, so serializing a command only needs to insert the index and value.
+    """
+    identifier: str = attrs.field()
+    has_index: bool = attrs.field()
+    has_value: bool = attrs.field()
+
+    @staticmethod
+    def from_command_def(command_def: CommandDef) -> "CommandTemplate":
+        identifier = command_def.sonic_text_attrs.string_identifier
+        identifier = identifier[0] if isinstance(identifier, list) else identifier
+        return CommandTemplate(
+            identifier,
+            command_def.index_param is not None,
+            command_def.setter_param is not None
+        )
+
 
 class CommandSerializer:
     def __init__(self, protocol: Protocol):
         self._command_contracts = protocol.command_contracts
+        self._templates: Dict[ICommandCode, CommandTemplate] = {
+            code: CommandTemplate.from_command_def(command_contract.command_def)
+            for code, command_contract in self._command_contracts.items()
+            if command_contract.command_def is not None
+        }
 
     def _serialize_field(self, obj: Any) -> str:
         if isinstance(obj, Enum):
@@ -13,20 +42,29 @@ class CommandSerializer:
         else:
             return str(obj)
 
+    @staticmethod
+    def _get_arg(command: Command, arg_name: str) -> Any:
+        # Reading the attribute directly avoids the conversion of the whole command with attrs.asdict
+        try:
+            return getattr(command, arg_name)
+        except AttributeError:
+            assert arg_name in command.args
+            return command.args[arg_name]
+
+    def _get_template(self, command: Command) -> CommandTemplate:
+        template = self._templates.get(command.code, None)
+        if template is None:
+            assert command.code in self._command_contracts, f"The command {command} is not known for the protocol" # throw error?
+            assert False, f"There exists no command definition for {command}"
+        return template
+
     def serialize_command(self, command: Command) -> str:
-        command_contract = self._command_contracts.get(command.code, None)
-        assert command_contract is not None, f"The command {command} is not known for the protocol" # throw error?
-        assert command_contract.command_def is not None, f"There exists no command definition for {command}"
+        template = self._get_template(command)
 
-        command_def = command_contract.command_def
-        
-        identifier = command_def.sonic_text_attrs.string_identifier
-        request_msg: str = identifier[0] if isinstance(identifier, list) else identifier
-        if command_def.index_param:
-            assert "index"in command.args
-            request_msg += self._serialize_field(command.args["index"])
-        if command_def.setter_param:
-            assert "value"in command.args 
-            request_msg += "=" + self._serialize_field(command.args["value"])
+        request_msg: str = template.identifier
+        if template.has_index:
+            request_msg += self._serialize_field(CommandSerializer._get_arg(command, "index"))
+        if template.has_value:
+            request_msg += "=" + self._serialize_field(CommandSerializer._get_arg(command, "value"))
 
         return request_msg
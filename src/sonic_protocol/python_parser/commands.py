@@ -59,6 +59,26 @@ class GetSignal(Command):
     def __attrs_post_init__(self):
         super().__init__(code=CommandCode.GET_SIGNAL)
 
+@attrs.define()
+class GetTemp(Command):
+    def __attrs_post_init__(self):
+        super().__init__(code=CommandCode.GET_TEMP)
+
+@attrs.define()
+class GetTmcu(Command):
+    def __attrs_post_init__(self):
+        super().__init__(code=CommandCode.GET_TMCU)
+
+@attrs.define()
+class GetUipt(Command):
+    def __attrs_post_init__(self):
+        super().__init__(code=CommandCode.GET_UIPT)
+
+@attrs.define()
+class GetIrms(Command):
+    def __attrs_post_init__(self):
+        super().__init__(code=CommandCode.GET_IRMS)
+
 
 @attrs.define()
 class GetAtf(Command):
@@ -1,6 +1,6 @@
 import abc
-from enum import Enum, IntEnum
-from typing import Any, TypeVar
+from enum import Enum
+from typing import Any, Dict, Tuple, TypeVar
 import numpy as np
 
 from sonic_protocol.schema import ConverterType, Timestamp, Version
@@ -63,6 +63,20 @@ class TimestampConverter(Converter):
 class EnumConverter(Converter):
     def __init__(self, target_enum_class: type[Enum]):
         self._target_enum_class: type[Enum] = target_enum_class
+        # The lookup tables are built once per enum class, so that converting a field of an answer
+        # is a single dict access instead of a linear scan over all enum members.
+        # Values take precedence over names, if a name of one member equals the value of another one.
+        self._member_lookup: Dict[str, Enum] = {
+            enum_member.name.casefold(): enum_member for enum_member in target_enum_class
+        }
+        self._member_lookup.update({
+            str(enum_member.value).casefold(): enum_member for enum_member in target_enum_class
+        })
+
+    @property
+    def member_lookup(self) -> Dict[str, Enum]:
+        """! Maps the case-folded values and names to the enum members """
+        return self._member_lookup
 
     def validate_val(self, value: Any) -> bool: 
         return isinstance(value, self._target_enum_class)
@@ -72,17 +86,14 @@ class EnumConverter(Converter):
         return str(value.name)
 
     def validate_str(self, text: str) -> bool: 
-        return text.lower() in [ enum_member.value.lower() for enum_member in self._target_enum_class]
+        return text.casefold() in self._member_lookup
 
     def convert_str_to_val(self, text: str) -> Any: 
-        assert(self.validate_str(text))
-        if isinstance(self._target_enum_class, IntEnum):
-            return self._target_enum_class(int(text))
         # Return the corresponding enum member, case-insensitive match on value or name
-        for enum_member in self._target_enum_class:
-            if text.lower() == str(enum_member.value).lower() or text.lower() == enum_member.name.lower():
-                return enum_member
-        raise ValueError(f"No matching enum member found for '{text}' in {self._target_enum_class}")
+        enum_member = self._member_lookup.get(text.casefold())
+        if enum_member is None:
+            raise ValueError(f"No matching enum member found for '{text}' in {self._target_enum_class}")
+        return enum_member
     
 T = TypeVar("T", int, str, bool, float, np.uint8, np.uint16, np.uint32)
 class PrimitiveTypeConverter(Converter):
@@ -129,7 +140,11 @@ class PrimitiveTypeConverter(Converter):
 
 
 
-def get_converter(converter_type: ConverterType, target_class: Any) -> Converter:
+# Converters are stateless after construction, so they can be shared between all fields, 
+# answer validators and devices that use the same target class.
+_converter_cache: Dict[Tuple[ConverterType, Any], Converter] = {}
+
+def _create_converter(converter_type: ConverterType, target_class: Any) -> Converter:
     match converter_type:
         case ConverterType.ENUM:
             assert(issubclass(target_class, Enum))
@@ -140,3 +155,11 @@ def get_converter(converter_type: ConverterType, target_class: Any) -> Converter
             return PrimitiveTypeConverter(target_class)
         case ConverterType.TIMESTAMP:
             return TimestampConverter()
+
+def get_converter(converter_type: ConverterType, target_class: Any) -> Converter:
+    key = (converter_type, target_class)
+    converter = _converter_cache.get(key)
+    if converter is None:
+        converter = _create_converter(converter_type, target_class)
+        _converter_cache[key] = converter
+    return converter
@@ -0,0 +1,339 @@
+import hashlib
+import importlib.util
+import json
+import os
+from enum import Enum
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from sonic_protocol.json_serializer.json_serializer import ProtocolJSONEncoder
+from sonic_protocol.python_parser.answer import Answer, AnswerValidator
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.python_parser.command_deserializer import DeserializedCommand
+from sonic_protocol.python_parser.command_serializer import CommandSerializer
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import AnswerDef, AnswerFieldDef, CommandDef, ConverterType, ICommandCode, IEFieldName, Protocol
+
+
+ParseFunc = Callable[[str], Optional[Answer]]
+SerializeFunc = Callable[[Command], str]
+
+
+class CompiledAnswerValidator:
+    """!
+    Validates answers with a generated parse function.
+    The generated function only handles well formed answers.
+    For everything else (wrong casing, newlines, ...) it gives up and returns None.
+    Then the regex based AnswerValidator is used, so that the results are the same as without compilation.
+    """
+    def __init__(self, parse_func: ParseFunc, answer_def: AnswerDef, field_enum: type[IEFieldName]):
+        self._parse_func = parse_func
+        self._answer_def = answer_def
+        self._field_enum = field_enum
+        self._fallback_validator: AnswerValidator | None = None
+
+    def validate(self, data: str) -> Answer:
+        answer = self._parse_func(data)
+        if answer is not None:
+            return answer
+
+        if self._fallback_validator is None:
+            self._fallback_validator = AnswerValidatorBuilder.create_answer_validator(self._answer_def, self._field_enum)
+        return self._fallback_validator.validate(data)
+
+
+class CompiledProtocol:
+    """!
+    Wraps the module generated by the ProtocolCompiler.
+    Has the same interface as the CommandSerializer and provides an answer validator for each command code.
+    """
+    def __init__(self, protocol: Protocol, module: ModuleType):
+        self._protocol = protocol
+        self._module = module
+        self._serializers: Dict[int, SerializeFunc] = module.SERIALIZERS
+        self._fallback_serializer = CommandSerializer(protocol)
+        self._answer_validators: Dict[ICommandCode, CompiledAnswerValidator] = {
+            code: CompiledAnswerValidator(module.PARSERS[code.value], command_contract.answer_def, protocol.field_name_cls)
+            for code, command_contract in protocol.command_contracts.items()
+        }
+
+    @property
+    def protocol_hash(self) -> str:
+        return self._module.PROTOCOL_HASH
+
+    @property
+    def answer_validators(self) -> Dict[ICommandCode, CompiledAnswerValidator]:
+        return self._answer_validators
+
+    def serialize_command(self, command: Command) -> str:
+        if isinstance(command, DeserializedCommand):
+            # The DeserializedCommand is no attrs class and only provides its args as dict
+            return self._fallback_serializer.serialize_command(command)
+        serializer = self._serializers.get(command.code)
+        assert serializer is not None, f"The command {command} is not known for the protocol"
+        return serializer(command)
+
+
+class ProtocolCompiler:
+    """!
+    The ProtocolCompiler generates python source code out of a protocol.
+    For each AnswerDef a parse function and for each CommandDef a serialize function is generated.
+    The generated functions are straight-line code, so they do not need any regex,
+    dispatching over dicts of converters or reflection with attrs.
+
+    The source is cached on disk. The file name is the hash of the protocol,
+    so a changed protocol gets automatically recompiled.
+    The loaded modules are additionally cached in memory by the hash of the protocol,
+    so that they are not imported again, each time a device is created for an equal protocol.
+    The cache dir must only be writable by the user, because the cached files are executed.
+    """
+    # Increment this, if the generated code changes, so that old cache files are not used anymore
+    COMPILER_VERSION = 3
+
+    _compiled_protocols: Dict[Tuple[Path, str], CompiledProtocol] = {}
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def compute_protocol_hash(protocol: Protocol) -> str:
+        protocol_json = json.dumps(protocol, cls=ProtocolJSONEncoder, sort_keys=True)
+        hash_input = f"{ProtocolCompiler.COMPILER_VERSION}:{protocol_json}"
+        return hashlib.sha256(hash_input.encode()).hexdigest()[:32]
+
+    def load_or_compile(self, protocol: Protocol) -> CompiledProtocol:
+        protocol_hash = ProtocolCompiler.compute_protocol_hash(protocol)
+        compiled_protocol = ProtocolCompiler._compiled_protocols.get((self._cache_dir, protocol_hash))
+        if compiled_protocol is not None:
+            return compiled_protocol
+
+        source_file = self._cache_dir / f"compiled_protocol_{protocol_hash}.py"
+        if not source_file.exists():
+            source = self.generate_source(protocol, protocol_hash)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so that concurrent processes never load a half written file
+            tmp_file = source_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(source, encoding="utf-8")
+            os.replace(tmp_file, source_file)
+
+        module = ProtocolCompiler._load_module(source_file, f"_sonic_compiled_protocol_{protocol_hash}")
+        compiled_protocol = CompiledProtocol(protocol, module)
+        ProtocolCompiler._compiled_protocols[(self._cache_dir, protocol_hash)] = compiled_protocol
+        return compiled_protocol
+
+    @staticmethod
+    def _load_module(source_file: Path, module_name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(module_name, source_file)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def generate_source(self, protocol: Protocol, protocol_hash: str | None = None) -> str:
+        if protocol_hash is None:
+            protocol_hash = ProtocolCompiler.compute_protocol_hash(protocol)
+        generator = _SourceGenerator(protocol)
+        return generator.generate(protocol_hash)
+
+
+class _SourceGenerator:
+    def __init__(self, protocol: Protocol):
+        self._protocol = protocol
+        self._imports: Dict[type, str] = {}
+        self._constants: List[str] = []
+        self._constant_names: Dict[Any, str] = {}
+
+    def generate(self, protocol_hash: str) -> str:
+        functions: List[str] = []
+        parsers: List[str] = []
+        serializers: List[str] = []
+        for code, command_contract in self._protocol.command_contracts.items():
+            parse_func_name = f"parse_{code.name}"
+            functions.append(self._generate_parse_func(parse_func_name, command_contract.answer_def))
+            parsers.append(f"    {code.value}: {parse_func_name},")
+            if command_contract.command_def is not None:
+                serialize_func_name = f"serialize_{code.name}"
+                functions.append(self._generate_serialize_func(serialize_func_name, command_contract.command_def))
+                serializers.append(f"    {code.value}: {serialize_func_name},")
+
+        lines = [
+            "# This file is generated by sonic_protocol.python_parser.protocol_compiler. Do not edit it.",
+            f"# Protocol: {self._protocol.info}",
+            "from enum import Enum",
+            "from sonic_protocol.python_parser.answer import Answer",
+            "from sonic_protocol.python_parser.answer_validator_builder import MAX_DIGITS, MAX_VALUE_LENGTH",
+            "from sonic_protocol.python_parser.converters import get_converter",
+            "from sonic_protocol.schema import ConverterType",
+        ]
+        lines.extend(
+            f"from {cls.__module__} import {cls.__qualname__.split('.')[0]} as {alias}" for cls, alias in self._imports.items()
+        )
+        lines.append("")
+        lines.append(f"PROTOCOL_HASH = {protocol_hash!r}")
+        lines.extend(self._constants)
+        lines.append("")
+        lines.extend(functions)
+        lines.append("PARSERS = {")
+        lines.extend(parsers)
+        lines.append("}")
+        lines.append("")
+        lines.append("SERIALIZERS = {")
+        lines.extend(serializers)
+        lines.append("}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _import(self, cls: type) -> str:
+        if cls not in self._imports:
+            self._imports[cls] = f"_T{len(self._imports)}"
+        # nested classes are accessed over their enclosing class
+        nested_path = cls.__qualname__.split(".")[1:]
+        return ".".join([self._imports[cls], *nested_path])
+
+    def _constant(self, key: Any, expr: str) -> str:
+        if key not in self._constant_names:
+            name = f"_C{len(self._constant_names)}"
+            self._constant_names[key] = name
+            self._constants.append(f"{name} = {expr}")
+        return self._constant_names[key]
+
+    def _field_name_constant(self, field_name: IEFieldName) -> str:
+        alias = self._import(type(field_name))
+        return self._constant(field_name, f"{alias}.{field_name.name}")
+
+    def _converter_constant(self, converter_type: ConverterType, target_class: type) -> str:
+        alias = self._import(target_class)
+        return self._constant((converter_type, target_class), f"get_converter(ConverterType.{converter_type.name}, {alias})")
+
+    def _generate_serialize_func(self, func_name: str, command_def: CommandDef) -> str:
+        identifier = command_def.sonic_text_attrs.string_identifier
+        identifier = identifier[0] if isinstance(identifier, list) else identifier
+        expr_parts = [repr(identifier)]
+        if command_def.index_param:
+            expr_parts.append(_SourceGenerator._serialize_expr("command.index", command_def.index_param.param_type.converter_ref))
+        if command_def.setter_param:
+            expr_parts.append(repr("="))
+            expr_parts.append(_SourceGenerator._serialize_expr("command.value", command_def.setter_param.param_type.converter_ref))
+        return "\n".join([
+            f"def {func_name}(command):",
+            f"    return {' + '.join(expr_parts)}",
+            "",
+        ])
+
+    @staticmethod
+    def _serialize_expr(value_expr: str, converter_ref: ConverterType) -> str:
+        if converter_ref is ConverterType.ENUM:
+            return f"(str({value_expr}.value) if isinstance({value_expr}, Enum) else str({value_expr}))"
+        return f"str({value_expr})"
+
+    def _generate_parse_func(self, func_name: str, answer_def: AnswerDef) -> str:
+        assert not isinstance(answer_def.sonic_text_attrs, list)
+        separator = answer_def.sonic_text_attrs.separator
+        num_fields = len(answer_def.fields)
+        lines = [f"def {func_name}(data):"]
+        if num_fields == 0:
+            lines.append("    return Answer(data, True, True)")
+            lines.append("")
+            return "\n".join(lines)
+
+        # The regex "." does not match newlines, so we leave those cases to the regex validator
+        lines.append("    if '\\n' in data:")
+        lines.append("        return None")
+        lines.append(f"    parts = data.split({separator!r})")
+        lines.append(f"    if len(parts) != {num_fields}:")
+        lines.append("        return None")
+
+        index_items: List[str] = []
+        for index, answer_field in enumerate(answer_def.fields):
+            field_lines = self._generate_field_parsing(index, answer_field)
+            if field_lines is None:
+                # The answer can only be parsed with the regex
+                return "\n".join([f"def {func_name}(data):", "    return None", ""])
+            lines.extend(field_lines)
+            index_items.append(f"{self._field_name_constant(answer_field.field_name)}: {index}")
+        field_indices = self._constant(
+            ("indices", tuple(answer_field.field_name for answer_field in answer_def.fields)), 
+            f"{{{', '.join(index_items)}}}"
+        )
+        field_values = ", ".join(f"v{index}" for index in range(num_fields))
+        lines.append(f"    return Answer.from_field_values(data, {field_indices}, ({field_values},))")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _generate_field_parsing(self, index: int, answer_field: AnswerFieldDef) -> List[str] | None:
+        assert not isinstance(answer_field.sonic_text_attrs, list)
+        field_type = answer_field.field_type
+        affixes = AnswerValidatorBuilder.get_literal_affixes(answer_field)
+        if affixes is None:
+            return None
+        prefix, suffix = affixes
+
+        lines = [f"    s = parts[{index}]"]
+        if prefix:
+            lines.append(f"    if not s.startswith({prefix!r}):")
+            lines.append("        return None")
+            lines.append(f"    s = s[{len(prefix)}:]")
+        if suffix:
+            lines.append(f"    if not s.endswith({suffix!r}):")
+            lines.append("        return None")
+            lines.append(f"    s = s[:{-len(suffix)}]")
+
+        target_class = field_type.field_type
+        value_var = f"v{index}"
+        if field_type.converter_ref is not ConverterType.PRIMITIVE or target_class is str:
+            # the regex matches these values only up to MAX_VALUE_LENGTH
+            lines.append("    if len(s) > MAX_VALUE_LENGTH:")
+            lines.append("        return None")
+        if field_type.converter_ref is ConverterType.PRIMITIVE:
+            if target_class is bool:
+                lines.extend([
+                    "    s = s.lower()",
+                    "    if s == 'true' or s == '1':",
+                    f"        {value_var} = True",
+                    "    elif s == 'false' or s == '0':",
+                    f"        {value_var} = False",
+                    "    else:",
+                    "        return None",
+                ])
+            elif target_class is int or np.issubdtype(target_class, np.integer):
+                lines.extend([
+                    "    t = s[1:] if s[:1] == '+' or s[:1] == '-' else s",
+                    "    if not (t.isdigit() and t.isascii() and len(t) <= MAX_DIGITS):",
+                    "        return None",
+                    f"    {value_var} = int(s)",
+                ])
+                if target_class is not int:
+                    # the numpy types overflow, so we have to check the limits
+                    type_info = np.iinfo(target_class)
+                    lines.append(f"    if not ({int(type_info.min)} <= {value_var} <= {int(type_info.max)}):")
+                    lines.append("        return None")
+            elif target_class is float:
+                lines.extend([
+                    "    t = s[1:] if s[:1] == '+' or s[:1] == '-' else s",
+                    "    i, _, d = t.partition('.')",
+                    "    if not (i.isdigit() and i.isascii() and len(i) <= MAX_DIGITS):",
+                    "        return None",
+                    "    if _ and not (d.isdigit() and d.isascii() and len(d) <= MAX_DIGITS):",
+                    "        return None",
+                    f"    {value_var} = float(s)",
+                ])
+            elif target_class is str:
+                lines.append(f"    {value_var} = s")
+            else:
+                assert False, "should never happen"
+        elif field_type.converter_ref is ConverterType.ENUM:
+            assert issubclass(target_class, Enum)
+            converter = self._converter_constant(ConverterType.ENUM, target_class)
+            lookup = self._constant(("lookup", target_class), f"{converter}.member_lookup")
+            lines.append(f"    {value_var} = {lookup}.get(s.casefold())")
+            lines.append(f"    if {value_var} is None:")
+            lines.append("        return None")
+        else:
+            converter = self._converter_constant(field_type.converter_ref, target_class)
+            lines.append(f"    if not {converter}.validate_str(s):")
+            lines.append("        return None")
+            lines.append(f"    {value_var} = {converter}.convert_str_to_val(s)")
+        return lines
@@ -4,7 +4,6 @@ import attrs
 import numpy as np
 
 import re
-from functools import total_ordering
 from datetime import datetime
 
 
@@ -86,7 +85,19 @@ class SIUnit(Enum):
     DEGREE = "°"
     PERCENT = "%"
 
-@total_ordering
+# Maps each SI prefix symbol to its exponent
+_SI_PREFIX_EXPONENTS: Dict[str, int] = {
+    'n': -9,  # NANO
+    'u': -6,  # MICRO
+    'm': -3,  # MILLI
+    'd': -2,  # DECI
+    'c': -1,  # CENTI
+    '':   0,  # NONE
+    'k':  3,  # KILO
+    'M':  6,  # MEGA
+    'G':  9,  # GIGA
+}
+
 class SIPrefix(Enum):
     NANO  = 'n'
     MICRO = 'u'
@@ -100,51 +111,47 @@ class SIPrefix(Enum):
 
     def __init__(self, symbol: str) -> None:
         self.symbol = symbol
-
-    def _map_symbol_to_factor(self) -> int:
-        # Map each symbol to its exponent
-        match self.symbol:
-            case 'n':  # NANO
-                return -9
-            case 'u':  # MICRO
-                return -6
-            case 'm':  # MILLI
-                return -3
-            case 'd':  # DECI
-                return -2
-            case 'c':  # CENTI
-                return -1
-            case '':   # NONE
-                return 0
-            case 'k':  # KILO
-                return 3
-            case 'M':  # MEGA
-                return 6
-            case 'G':  # GIGA
-                return 9
-            case _:
-                raise ValueError(f"Unknown SI prefix symbol: {self.symbol}")
+        # exponent and factor are looked up once here, because they are needed for every comparison and conversion
+        if symbol not in _SI_PREFIX_EXPONENTS:
+            raise ValueError(f"Unknown SI prefix symbol: {symbol}")
+        self._exponent: int = _SI_PREFIX_EXPONENTS[symbol]
+        self._factor: int | float = 1 if self._exponent == 0 else 10 ** self._exponent
 
     @property
-    def exponent(self):
-        return self._map_symbol_to_factor()
+    def exponent(self) -> int:
+        return self._exponent
 
     @property
-    def factor(self):
-        return 1 if self.exponent == 0 else 10 ** self.exponent
+    def factor(self) -> int | float:
+        return self._factor
 
     def __eq__(self, other):
         if isinstance(other, SIPrefix):
-            return self.exponent == other.exponent
+            return self._exponent == other._exponent
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, SIPrefix):
-            return self.exponent < other.exponent
+            return self._exponent < other._exponent
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, SIPrefix):
+            return self._exponent <= other._exponent
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, SIPrefix):
+            return self._exponent > other._exponent
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, SIPrefix):
+            return self._exponent >= other._exponent
         return NotImplemented
 
     def __hash__(self):
-        return hash(self.exponent)
+        return hash(self._exponent)
 
 class ConverterType(Enum):
     """!
@@ -225,6 +232,14 @@ class Activation(Enum):
     ACTIVATED = "activated"
     DEACTIVATED = "deactivated"
 
+class DeviceState(IntEnum):
+    OFF = 0
+    BROKEN = 1
+    READY = 2
+    SERVICE = 3
+    WAKE_UP = 4
+    EXIT_APP = 5
+
 
 @attrs.define()
 class Timestamp():
@@ -1,7 +1,11 @@
 
 from abc import ABCMeta
-from typing import Generic, TypeVar, cast, Optional, get_args
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generic, Iterator, TypeVar, cast, Optional, get_args
 import attrs
+import numpy as np
+import numpy.typing as npt
 from sonic_protocol.schema import SIUnit, SIPrefix
 
 
@@ -15,9 +19,58 @@ class SIVarMeta:
     min_value: tuple[float, SIPrefix] = attrs.field(default=(0.0, SIPrefix.NONE))
     max_value: tuple[float, SIPrefix] = attrs.field(default=(1000.0, SIPrefix.NONE))
 
+    def allowed_prefix(self, prefix: SIPrefix) -> bool:
+        return self.si_prefix_min <= prefix <= self.si_prefix_max
+
+    def get_min_value_in_prefix(self, target_prefix: SIPrefix) -> float:
+        min_val, min_prefix = self.min_value
+        return min_val * (min_prefix.factor / target_prefix.factor)
+
+    def get_max_value_in_prefix(self, target_prefix: SIPrefix) -> float:
+        max_val, max_prefix = self.max_value
+        return max_val * (max_prefix.factor / target_prefix.factor)
+
+
+def convert_array_to_prefix(
+    values: npt.ArrayLike, from_prefix: SIPrefix, to_prefix: SIPrefix, meta: Optional[SIVarMeta] = None
+) -> np.ndarray:
+    """
+    Converts a whole array of values from one prefix to another.
+    Integer arrays stay integer arrays, if they are converted to a smaller prefix. Otherwise the result is a float array.
+    If meta is given, the prefixes and the converted values are validated against it
+    and a ValueError is raised, if any of them is outside of the allowed range.
+    """
+    array = np.asarray(values)
+    if array.dtype == bool or not np.issubdtype(array.dtype, np.number):
+        raise TypeError("values must be an array of int|float (no bool)")
+    if meta is not None and not (meta.allowed_prefix(from_prefix) and meta.allowed_prefix(to_prefix)):
+        raise ValueError("Prefix outside specified limits")
+
+    exponent_difference = from_prefix.exponent - to_prefix.exponent
+    if exponent_difference == 0:
+        result = array.copy()
+    elif exponent_difference > 0 and np.issubdtype(array.dtype, np.integer):
+        result = array * (10 ** exponent_difference)
+    else:
+        # same calculation as SIVar.to_prefix, so that both give the same results
+        result = array.astype(np.float64) * (from_prefix.factor / to_prefix.factor)
+
+    if meta is not None and result.size > 0:
+        out_of_range = (result < meta.get_min_value_in_prefix(to_prefix)) | (result > meta.get_max_value_in_prefix(to_prefix))
+        if out_of_range.any():
+            first_index = int(np.flatnonzero(out_of_range)[0])
+            raise ValueError(
+                f"{np.count_nonzero(out_of_range)} values outside of the allowed range, "
+                f"first one at index {first_index}: {result.flat[first_index]} {to_prefix.symbol}{meta.si_unit.value}"
+            )
+    return result
+
 
 T = TypeVar("T", int, float)
 
+# Set during deserialization and in generic forms, where SIVars without meta are created on purpose
+_missing_meta_allowed: ContextVar[bool] = ContextVar("missing_meta_allowed", default=False)
+
 class SIVarMetaClass(ABCMeta):
     """Metaclass for creating SIVar subclasses with fixed metadata."""
     
@@ -49,23 +102,8 @@ class SIVar(Generic[T], metaclass=SIVarMetaClass):
         if hasattr(self.__class__, '_si_meta') and self.__class__ is not SIVar:
             self.meta = self.__class__._si_meta
         # For direct SIVar instantiation (e.g., during deserialization or DictFieldView), meta may be None in valid context
-        elif self.meta is None:
-            import inspect
-            frame = inspect.currentframe()
-            allow_none = False
-            while frame:
-                name_global = frame.f_globals.get('__name__')
-                if (
-                    'structure' in frame.f_code.co_name
-                    or 'converter' in str(frame.f_locals.get('self', ''))
-                    or 'create_value_field' in frame.f_code.co_name
-                    or (name_global is not None and 'DictFieldView' in name_global)
-                ):
-                    allow_none = True
-                    break
-                frame = frame.f_back
-            if not allow_none:
-                raise ValueError("meta must be provided for direct SIVar instantiation")
+        elif self.meta is None and not _missing_meta_allowed.get():
+            raise ValueError("meta must be provided for direct SIVar instantiation")
 
         if not isinstance(self.value, (int, float)) or isinstance(self.value, bool):
             raise TypeError("SIVar.value must be int|float (no bool)")
@@ -73,26 +111,24 @@ class SIVar(Generic[T], metaclass=SIVarMetaClass):
         if not self.allowed_prefix(self.si_prefix):
             raise ValueError("si_prefix outside allowed range")
 
-    @classmethod
-    def __subclasshook__(cls, subclass):
-        # Prevent direct instantiation of SIVar in normal code
-        if cls is SIVar and subclass is SIVar:
-            # Allow during deserialization or from DictFieldView but warn about direct use
-            import inspect
-            frame = inspect.currentframe()
-            while frame:
-                # Allow if called from deserialization or DictFieldView context
-                name_global = frame.f_globals.get('__name__')
-                if (
-                    'structure' in frame.f_code.co_name
-                    or 'converter' in str(frame.f_locals.get('self', ''))
-                    or 'create_value_field' in frame.f_code.co_name
-                    or (name_global is not None and 'DictFieldView' in name_global)
-                ):
-                    return True  # Allow during deserialization or DictFieldView
-                frame = frame.f_back
-            raise TypeError("SIVar is abstract - use specific subclasses like TemperatureSIVar")
-        return NotImplemented
+    @staticmethod
+    @contextmanager
+    def allow_missing_meta() -> Iterator[None]:
+        """
+        Allows the direct instantiation of SIVar without meta inside the with block.
+        Only use this, if the meta is really unknown, like in deserialization or in generic forms.
+        """
+        token = _missing_meta_allowed.set(True)
+        try:
+            yield
+        finally:
+            _missing_meta_allowed.reset(token)
+
+    @staticmethod
+    def from_deserialization(value: T, si_prefix: SIPrefix, meta: Optional[SIVarMeta] = None) -> "SIVar":
+        """Creates a SIVar from deserialized data, where the meta can be missing."""
+        with SIVar.allow_missing_meta():
+            return SIVar(value=value, si_prefix=si_prefix, meta=meta)
 
     @classmethod
     def underlying_type(cls) -> type[T]:
@@ -107,21 +143,19 @@ class SIVar(Generic[T], metaclass=SIVarMetaClass):
     def allowed_prefix(self, prefix: SIPrefix) -> bool:
         if self.meta is None:
             return True  # Allow all prefixes if meta is None
-        return self.meta.si_prefix_min <= prefix <= self.meta.si_prefix_max
+        return self.meta.allowed_prefix(prefix)
 
     def get_min_value_in_prefix(self, target_prefix: SIPrefix) -> float:
         """Get the minimum allowed value converted to the target prefix."""
         if self.meta is None:
             return float('-inf')  # No lower bound if meta is None
-        min_val, min_prefix = self.meta.min_value
-        return min_val * (min_prefix.factor / target_prefix.factor)
+        return self.meta.get_min_value_in_prefix(target_prefix)
 
     def get_max_value_in_prefix(self, target_prefix: SIPrefix) -> float:
         """Get the maximum allowed value converted to the target prefix."""
         if self.meta is None:
             return float('inf')  # No upper bound if meta is None
-        max_val, max_prefix = self.meta.max_value
-        return max_val * (max_prefix.factor / target_prefix.factor)
+        return self.meta.get_max_value_in_prefix(target_prefix)
 
     def is_value_in_range(self, value: float, prefix: SIPrefix) -> bool:
         """Check if a value in the given prefix is within the allowed range."""
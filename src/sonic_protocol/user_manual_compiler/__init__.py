@@ -1,9 +1,11 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import List, Optional, Tuple
+from sonic_protocol.protocol_list import IProtocolFactory
 from sonic_protocol.schema import DeviceType, Version
-from sonic_protocol.user_manual_compiler.jinja_manual_compiler import HtmlManualCompiler
-from sonic_protocol.user_manual_compiler.manual_compiler import MarkdownManualCompiler
+from sonic_protocol.user_manual_compiler.manual_compiler import ManualCompiler, MarkdownManualCompiler
 
 
 class FileType(Enum):
@@ -11,31 +13,78 @@ class FileType(Enum):
     MARKDOWN = "md"
 
 
+ManualVariant = Tuple[DeviceType, Version, bool]
+
+
+def create_manual_compiler(file_type: FileType, protocol_factory: Optional[IProtocolFactory] = None) -> ManualCompiler:
+    if file_type == FileType.HTML:
+        # imported here, because jinja takes long to import and is only needed for html manuals
+        from sonic_protocol.user_manual_compiler.jinja_manual_compiler import HtmlManualCompiler
+        return HtmlManualCompiler(protocol_factory)
+    return MarkdownManualCompiler(protocol_factory)
+
+
+def get_manual_file_name(device_type: DeviceType, protocol_version: Version, is_release: bool, file_type: FileType) -> str:
+    version_str = "_".join(map(str, protocol_version))
+    build_str = "release" if is_release else "debug"
+    return f"manual_{device_type.value}_{version_str}_{build_str}.{file_type.value}"
+
+
+def write_manual_file(output_dir: Path, device_type: DeviceType, protocol_version: Version, is_release: bool, file_type: FileType) -> Path:
+    """! Writes the manual directly into the file, without building it as a string first """
+    file_name = output_dir / get_manual_file_name(device_type, protocol_version, is_release, file_type)
+    with open(file_name, "w", encoding="utf-8") as file:
+        create_manual_compiler(file_type).write_manual_for_specific_device(file, device_type, protocol_version, is_release)
+    return file_name
+
+
+def get_all_manual_variants() -> List[ManualVariant]:
+    """! Returns all combinations of device type, protocol version and build type, that the protocol list supports """
+    from sonic_protocol.protocol import protocol_list
+
+    return [
+        (protocol_type.device_type, protocol_type.version, protocol_type.is_release)
+        for protocol_type in protocol_list.get_all_protocol_types()
+    ]
+
+
+def build_all_manuals(output_dir: Path, file_types: List[FileType], max_workers: Optional[int] = None) -> List[Path]:
+    """! Writes the manuals of all variants and file types in parallel with a process pool """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(write_manual_file, output_dir, device_type, version, is_release, file_type)
+            for device_type, version, is_release in get_all_manual_variants()
+            for file_type in file_types
+        ]
+        return [future.result() for future in futures]
+
+
 def build_manual():
     parser = argparse.ArgumentParser()
     parser.add_argument("--output-dir", type=Path, default=Path("./"))
-    parser.add_argument("--protocol-version", type=str,required=True)
-    parser.add_argument("--device-type", type=DeviceType, required=True)
+    parser.add_argument("--protocol-version", type=str)
+    parser.add_argument("--device-type", type=DeviceType)
     parser.add_argument("--release", action="store_true")
-    parser.add_argument("--file-type", type=FileType, default=FileType.HTML)
+    parser.add_argument("--file-type", type=FileType, nargs="+", default=[FileType.HTML])
+    parser.add_argument("--all", action="store_true", help="builds the manuals for all device types, protocol versions and build types")
+    parser.add_argument("--jobs", type=int, default=None, help="number of processes used with --all")
     args = parser.parse_args()
 
-    device_type: DeviceType = args.device_type
-    protocol_version: Version = Version.to_version(args.protocol_version)
-    is_release: bool = args.release
     output_dir: Path = args.output_dir
-    file_type: FileType = args.file_type
+    file_types: List[FileType] = args.file_type
 
-    version_str = args.protocol_version.replace('.', '_')
-    build_str = "release" if is_release else "debug"
-    file_name = output_dir / f"manual_{device_type.value}_{version_str}_{build_str}.{file_type.value}"
-    
-    if not output_dir.is_dir(): 
+    if not output_dir.is_dir():
         raise Exception(f"The output-dir must be a directory, but is instead a file: {str(output_dir)}")
 
+    if args.all:
+        build_all_manuals(output_dir, file_types, args.jobs)
+        return
 
-    manual_compiler = HtmlManualCompiler() if file_type == FileType.HTML else MarkdownManualCompiler()
-    manual = manual_compiler.compile_manual_for_specific_device(device_type, protocol_version, is_release)
+    if args.protocol_version is None or args.device_type is None:
+        parser.error("--protocol-version and --device-type are required, if --all is not set")
 
-    with open(file_name, "w") as file:
-        file.write(manual)
+    device_type: DeviceType = args.device_type
+    protocol_version: Version = Version.to_version(args.protocol_version)
+    is_release: bool = args.release
+    for file_type in file_types:
+        write_manual_file(output_dir, device_type, protocol_version, is_release, file_type)
@@ -1,45 +1,86 @@
 import abc
 import argparse
+import io
 from enum import Enum
 from pathlib import Path
-from sonic_protocol.schema import AnswerFieldDef, ICommandCode, CommandContract, CommandParamDef, ConverterType, DeviceParamConstantType, DeviceParamConstants, DeviceType, FieldType, ProtocolType, SonicTextCommandAttrs, UserManualAttrs, Version, Protocol
-from sonic_protocol.protocol import protocol_list
+from typing import Any, Dict, TextIO, Tuple
+from sonic_protocol.schema import AnswerFieldDef, ICommandCode, CommandContract, CommandParamDef, ConverterType, DeviceParamConstantType, DeviceParamConstants, DeviceType, FieldType, ProtocolType, SonicTextCommandAttrs, UserManualAttrs, Version, Protocol, VersionTuple
+from sonic_protocol.protocol_list import IProtocolFactory
+
+ManualCacheKey = Tuple[DeviceType, VersionTuple, bool]
 
 class ManualCompiler(abc.ABC):
+    """!
+    Base class for the manual compilers.
+    The manuals are written to a stream, so that they can be written directly into a file.
+    If the manual is compiled into a string, it gets cached for each protocol type,
+    because the monitor of the cli compiles the same manual on every call of help.
+    """
+    def __init__(self, protocol_factory: IProtocolFactory | None = None):
+        self._protocol_factory = protocol_factory
+        self._manual_cache: Dict[ManualCacheKey, str] = {}
+
+    def _build_protocol(self, protocol_type: ProtocolType) -> Protocol:
+        if self._protocol_factory is None:
+            # imported here, so that importing the manual compilers does not import all protocol definitions
+            from sonic_protocol.protocol import protocol_list
+            self._protocol_factory = protocol_list
+        return self._protocol_factory.build_protocol_for(protocol_type)
+
+    @staticmethod
+    def _get_cache_key(device_type: DeviceType, protocol_version: Version, is_release: bool) -> ManualCacheKey:
+        return (device_type, tuple(protocol_version), is_release) # type: ignore
+
     @abc.abstractmethod
-    def compile_manual_for_specific_device(self, device_type: DeviceType, protocol_version: Version, is_release: bool = True) -> str: ...
+    def _write_manual(self, stream: TextIO, protocol: Protocol) -> None: ...
 
+    def write_manual_for_specific_device(self, stream: TextIO, device_type: DeviceType, protocol_version: Version, is_release: bool = True) -> None:
+        cached_manual = self._manual_cache.get(ManualCompiler._get_cache_key(device_type, protocol_version, is_release))
+        if cached_manual is not None:
+            stream.write(cached_manual)
+            return
 
-class MarkdownManualCompiler(ManualCompiler):
-    def compile_manual_for_specific_device(self, device_type: DeviceType, protocol_version: Version, is_release: bool = True) -> str:
         try:
-            protocol = protocol_list.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
+            protocol = self._build_protocol(ProtocolType(protocol_version, device_type, is_release))
         except Exception as e:
-            return "Error constructing manual: " + str(e) 
+            stream.write("Error constructing manual: " + str(e))
+            return
+        self._write_manual(stream, protocol)
+
+    def compile_manual_for_specific_device(self, device_type: DeviceType, protocol_version: Version, is_release: bool = True) -> str:
+        cache_key = ManualCompiler._get_cache_key(device_type, protocol_version, is_release)
+        manual = self._manual_cache.get(cache_key)
+        if manual is None:
+            try:
+                protocol = self._build_protocol(ProtocolType(protocol_version, device_type, is_release))
+            except Exception as e:
+                return "Error constructing manual: " + str(e)
+            stream = io.StringIO()
+            self._write_manual(stream, protocol)
+            manual = stream.getvalue()
+            self._manual_cache[cache_key] = manual
+        return manual
 
+
+class MarkdownManualCompiler(ManualCompiler):
+    def _write_manual(self, stream: TextIO, protocol: Protocol) -> None:
         self.consts = protocol.consts # save consts as attribute. We need min and max values for fields
 
-        manual = ""
-        manual += self.create_title(device_type, protocol_version, is_release)
+        self.write_title(stream, protocol.info.device_type, protocol.info.version, protocol.info.is_release)
         for command_code, command_contract in protocol.command_contracts.items():
-            manual += self.create_command_entry(command_contract, command_code)
-
-        return manual
+            self.write_command_entry(stream, command_contract, command_code)
 
-    def create_title(self, device_type: DeviceType, protocol_version: Version, is_release: bool) -> str:
-        title = f"# Sonic Protocol for {device_type.value} - {protocol_version}.{ 'Release' if is_release else 'Beta'}\n"
-        return title
+    def write_title(self, stream: TextIO, device_type: DeviceType, protocol_version: Version, is_release: bool) -> None:
+        stream.write(f"# Sonic Protocol for {device_type.value} - {protocol_version}.{ 'Release' if is_release else 'Beta'}\n")
 
-    def create_command_entry(self, command_contract: CommandContract, command_code: ICommandCode) -> str:
+    def write_command_entry(self, stream: TextIO, command_contract: CommandContract, command_code: ICommandCode) -> None:
 
         description = command_contract.user_manual_attrs.description
         example = command_contract.user_manual_attrs.example
 
-        section_title = f"## **{command_code.value}**: {command_code.name}  \n"
-        command_entry = section_title
-        tags = " | ".join(map(lambda tag: f"<u>{tag}</u>", command_contract.tags)) + "  \n\n"
-        command_entry += tags
-        command_entry += ("..." if description is None else description) + "  \n\n"
+        stream.write(f"## **{command_code.value}**: {command_code.name}  \n")
+        stream.write(" | ".join(map(lambda tag: f"<u>{tag}</u>", command_contract.tags)) + "  \n\n")
+        stream.write(("..." if description is None else description) + "  \n\n")
 
         if command_contract.command_def:
             setter_param = command_contract.command_def.setter_param
@@ -49,57 +90,57 @@ class MarkdownManualCompiler(ManualCompiler):
             string_identifier = sonic_text_attrs.string_identifier
             string_identifier = string_identifier if isinstance(string_identifier, list) else [string_identifier]
             
-            command_entry += "### Command Names\n"
-            command_entry += " | ".join(map(lambda id: f"`{id}`", string_identifier)) + "  \n"
+            stream.write("### Command Names\n")
+            stream.write(" | ".join(map(lambda id: f"`{id}`", string_identifier)) + "  \n")
 
-            command_entry += "### Params\n"
+            stream.write("### Params\n")
             if index_param is None and setter_param is None:
-                command_entry += "No parameters  \n"
+                stream.write("No parameters  \n")
             if index_param is not None:
-                command_entry += self.create_param_entry(index_param)
+                self.write_param_entry(stream, index_param)
             if setter_param is not None:
-                command_entry += self.create_param_entry(setter_param)
+                self.write_param_entry(stream, setter_param)
 
-        command_entry += "### Answer\n"
+        stream.write("### Answer\n")
         for field in command_contract.answer_def.fields:
-            command_entry += self.create_answer_field_entry(field)
+            self.write_answer_field_entry(stream, field)
 
         if example is not None:
-            command_entry += "### Example\n"
-            command_entry += f"```\n{example}\n```  \n"
-
-        return command_entry
+            stream.write("### Example\n")
+            stream.write(f"```\n{example}\n```  \n")
 
-    def create_param_entry(self, param_def: CommandParamDef) -> str:
+    def write_param_entry(self, stream: TextIO, param_def: CommandParamDef) -> None:
         description = None
         description_attrs = param_def.user_manual_attrs
         if isinstance(description_attrs, UserManualAttrs):
             description = description_attrs.description
 
-        param_entry = self.create_field_type_entry(str(param_def.name.value), param_def.param_type, description)
-        return param_entry
+        self.write_field_type_entry(stream, str(param_def.name.value), param_def.param_type, description)
 
 
-    def create_answer_field_entry(self, field_def: AnswerFieldDef) -> str:
+    def write_answer_field_entry(self, stream: TextIO, field_def: AnswerFieldDef) -> None:
         description = None
         description_attrs = field_def.user_manual_attrs
         if isinstance(description_attrs, UserManualAttrs):
             description = description_attrs.description
 
-        field_entry = self.create_field_type_entry(str(field_def.field_name.value), field_def.field_type, description)
+        self.write_field_type_entry(stream, str(field_def.field_name.value), field_def.field_type, description)
 
-        return field_entry
+    def _resolve_limit(self, limit: Any) -> Any:
+        if isinstance(limit, DeviceParamConstantType):
+            return getattr(self.consts, limit.value)
+        return limit
 
-    def create_field_type_entry(self, name: str, field_type: FieldType, description: str | None = None) -> str:
-        type_header = f"- **{name}**: *{field_type.field_type.__name__}*"
+    def write_field_type_entry(self, stream: TextIO, name: str, field_type: FieldType, description: str | None = None) -> None:
+        stream.write(f"- **{name}**: *{field_type.field_type.__name__}*")
         if field_type.si_unit is not None or field_type.si_prefix is not None:
-            type_header += " in ["
+            stream.write(" in [")
             if field_type.si_prefix is not None:
-                type_header += field_type.si_prefix.value
+                stream.write(field_type.si_prefix.value)
             if field_type.si_unit is not None:
-                type_header += field_type.si_unit.value
-            type_header += "]"
-        type_header += "  \n"
+                stream.write(field_type.si_unit.value)
+            stream.write("]")
+        stream.write("  \n")
 
 
         possible_values = field_type.allowed_values
@@ -107,20 +148,15 @@ class MarkdownManualCompiler(ManualCompiler):
             assert issubclass(field_type.field_type, Enum)
             possible_values = [ enum_member.value for enum_member in field_type.field_type ]
         if possible_values is not None:
-            type_header += "\tPossible values:  \n"
+            stream.write("\tPossible values:  \n")
             for value in possible_values:
-                type_header += f"\t- {value}  \n"
+                stream.write(f"\t- {value}  \n")
 
+        # the limits are either device constants or fixed values
         if field_type.min_value is not None:
-            assert isinstance(field_type.min_value, DeviceParamConstantType)
-            val = getattr(self.consts, field_type.min_value.value)
-            type_header += f"\tMinimum value: {val}  \n"
+            stream.write(f"\tMinimum value: {self._resolve_limit(field_type.min_value)}  \n")
         if field_type.max_value is not None:
-            assert isinstance(field_type.max_value, DeviceParamConstantType)
-            val = getattr(self.consts, field_type.max_value.value)
-            type_header += f"\tMaximum value: {val}  \n"
+            stream.write(f"\tMaximum value: {self._resolve_limit(field_type.max_value)}  \n")
 
         if description is not None:
-            type_header += f"\t{description}  \n"
-
-        return type_header
+            stream.write(f"\t{description}  \n")
@@ -1,9 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import List
-from sonic_protocol.schema import CommandParamDef, DeviceParamConstantType, DeviceParamConstants, DeviceType, ProtocolType, Version
-from sonic_protocol.protocol import protocol_list as operator_protocol_factory
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+from typing import Dict, List, Optional, Tuple
+import attrs
+from sonic_protocol.json_serializer.protocol_snapshot import ProtocolSnapshotStore
+from sonic_protocol.python_parser import answer_validator_builder
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.schema import CommandParamDef, DeviceParamConstantType, DeviceParamConstants, DeviceType, Protocol, ProtocolType, Version
+from soniccontrol.app_config import PROTOCOL_CACHE_DIR
+from soniccontrol.builder import operator_protocol_factory
 from soniccontrol_gui.plugins.device_plugin import DevicePluginRegistry, register_device_plugins
 
+
+COMMAND_EXAMPLES_CACHE_DIR = PROTOCOL_CACHE_DIR / "command_examples"
+
+# Increment this, if the generation of the examples changes, so that old cache files are not used anymore
+COMMAND_EXAMPLES_FORMAT_VERSION = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_answer_pattern(answer_pattern: str) -> re.Pattern[str]:
+    return re.compile(answer_pattern, re.IGNORECASE)
+
+
+@attrs.define(frozen=True)
+class CommandExample:
+    """!
+    An example command together with the regex of the answer expected for it.
+    The regex has one group per answer field, in the order of answer_field_names.
+    """
+    command: str = attrs.field()
+    command_code: int = attrs.field()
+    answer_pattern: str = attrs.field()
+    answer_field_names: Tuple[str, ...] = attrs.field(converter=tuple)
+
+    def validate_answer(self, answer: str) -> Dict[str, str] | None:
+        """!
+        Returns the unconverted values of the answer fields mapped to the field names
+        or None, if the answer does not match the expected answer.
+        Error messages of the device do not match, because they have their own answer definitions.
+        """
+        match = _compile_answer_pattern(self.answer_pattern).fullmatch(answer)
+        if match is None:
+            return None
+        return dict(zip(self.answer_field_names, match.groups()))
+
 # TODO: we could from max and min values also deduce commands that should fail
 def deduce_param_limits(consts: DeviceParamConstants, param_def: CommandParamDef | None) -> List[str]:
     if param_def is None:
@@ -42,20 +88,14 @@ def deduce_param_limits(consts: DeviceParamConstants, param_def: CommandParamDef
     return list(map(str, param_limits))
     
 
-def deduce_command_examples(protocol_version: Version, device_type: DeviceType, is_release: bool = False, options: str = "") -> List[str]:
+def generate_command_examples(protocol: Protocol) -> List[CommandExample]:
     """
     description:
     This function generates example commands, based on the command_identifiers and limits specified in the protocol.
-    Those commands should then be used by parameterized tests in the robot framework to test against.
     returns:
-    Returns a list of example command strings that can directly be send to the device
+    Returns a list of example commands with the answers expected for them
     """
-    command_examples: List[str] = []
-    register_device_plugins()
-    protocol_factories = { plugin.device_type: plugin.protocol_factory for plugin in DevicePluginRegistry.get_device_plugins() }
-    protocol_factory = protocol_factories.get(device_type, operator_protocol_factory)
-    protocol = protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
-            
+    command_examples: List[CommandExample] = []
 
     for command_contract in protocol.command_contracts.values():
         command_def = command_contract.command_def
@@ -76,15 +116,118 @@ def deduce_command_examples(protocol_version: Version, device_type: DeviceType,
         setter_param = command_def.setter_param
         setter_limits = deduce_param_limits(protocol.consts, setter_param)
 
+        answer_def = command_contract.answer_def
+        answer_pattern = AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls).pattern
+        answer_field_names = tuple(answer_field.field_name.name for answer_field in answer_def.fields)
+        def add_example(command: str) -> None:
+            command_examples.append(CommandExample(command, command_contract.code.value, answer_pattern, answer_field_names))
+
         for string_identifier in string_identifiers:
             for index_limit in index_limits:
                 if index_limit != "" and not index_limit.isdecimal():
                     index_limit = f"[{index_limit}]"
 
                 if len(setter_limits) == 0:
-                    command_examples.append(f"{string_identifier}{index_limit}")
+                    add_example(f"{string_identifier}{index_limit}")
                 else:
                     for setter_limit in setter_limits:
-                        command_examples.append(f"{string_identifier}{index_limit}={setter_limit}")
+                        add_example(f"{string_identifier}{index_limit}={setter_limit}")
+
+    return command_examples
+
+
+def _build_protocol(protocol_type: ProtocolType) -> Protocol:
+    register_device_plugins()
+    protocol_factories = { plugin.device_type: plugin.protocol_factory for plugin in DevicePluginRegistry.get_device_plugins() }
+    protocol_factory = protocol_factories.get(protocol_type.device_type, operator_protocol_factory)
+    return protocol_factory.build_protocol_for(protocol_type)
+
+
+def _compute_answer_pattern_fingerprint() -> str | None:
+    """! The answer patterns are rendered into the cache files, so they depend on the source of the regex builder """
+    try:
+        source = Path(answer_validator_builder.__file__).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def _get_cache_file(cache_dir: Path, protocol_type: ProtocolType) -> Path | None:
+    fingerprint = ProtocolSnapshotStore.compute_source_fingerprint()
+    answer_pattern_fingerprint = _compute_answer_pattern_fingerprint()
+    if fingerprint is None or answer_pattern_fingerprint is None:
+        return None
+    build_str = "release" if protocol_type.is_release else "debug"
+    opts_str = f"_{protocol_type.additional_opts}" if protocol_type.additional_opts else ""
+    file_name = f"command_examples_{protocol_type.device_type.value}_{protocol_type.version}_{build_str}{opts_str}" \
+        f"_{COMMAND_EXAMPLES_FORMAT_VERSION}_{fingerprint}_{answer_pattern_fingerprint}.json"
+    return cache_dir / file_name
+
+
+# ProtocolType and Version are not hashable, so the cache uses a tuple of their values
+_MemoryCacheKey = Tuple[str, DeviceType, bool, str | None, Path]
+_command_examples_cache: Dict[_MemoryCacheKey, List[CommandExample]] = {}
+
+def _get_memory_cache_key(protocol_type: ProtocolType, cache_dir: Path) -> _MemoryCacheKey:
+    return (str(protocol_type.version), protocol_type.device_type, protocol_type.is_release, protocol_type.additional_opts, cache_dir)
+
+def get_command_examples(protocol_type: ProtocolType, cache_dir: Path = COMMAND_EXAMPLES_CACHE_DIR) -> List[CommandExample]:
+    """
+    description:
+    Returns the command examples for the protocol type. They are generated only once and then cached in memory and on disk.
+    The cache files are keyed by the protocol type, a fingerprint of the protocol definition sources
+    and a fingerprint of the answer regex builder.
+    Protocols of device plugins are not part of the fingerprint, so delete the cache directory, if they change.
+    """
+    cache_key = _get_memory_cache_key(protocol_type, cache_dir)
+    command_examples = _command_examples_cache.get(cache_key)
+    if command_examples is not None:
+        return command_examples
+
+    cache_file = _get_cache_file(cache_dir, protocol_type)
+    if cache_file is not None and cache_file.exists():
+        try:
+            command_examples = [ CommandExample(**example) for example in json.loads(cache_file.read_text(encoding="utf-8")) ]
+        except (ValueError, TypeError):
+            command_examples = None # the file is broken, so generate the examples again
+
+    if command_examples is None:
+        command_examples = generate_command_examples(_build_protocol(protocol_type))
+        if cache_file is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so that concurrent processes never read a half written file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps([ attrs.asdict(example) for example in command_examples ]), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+
+    _command_examples_cache[cache_key] = command_examples
+    return command_examples
+
+
+def deduce_command_examples(protocol_version: Version, device_type: DeviceType, is_release: bool = False, options: str = "") -> List[str]:
+    """
+    description:
+    This function generates example commands, based on the command_identifiers and limits specified in the protocol.
+    Those commands should then be used by parameterized tests in the robot framework to test against.
+    returns:
+    Returns a list of example command strings that can directly be send to the device
+    """
+    protocol_type = ProtocolType(protocol_version, device_type, is_release, options or None)
+    return [ example.command for example in get_command_examples(protocol_type) ]
+
+
+def deduce_all_command_examples(cache_dir: Path = COMMAND_EXAMPLES_CACHE_DIR, max_workers: Optional[int] = None) -> List[Tuple[ProtocolType, List[CommandExample]]]:
+    """
+    description:
+    Generates the command examples of all device types, protocol versions and build types in parallel with a process pool
+    and stores them in the cache.
+    """
+    from sonic_protocol.protocol import protocol_list
 
+    protocol_types = protocol_list.get_all_protocol_types()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(get_command_examples, protocol_types, [cache_dir] * len(protocol_types))
+        command_examples = list(zip(protocol_types, results))
+    for protocol_type, examples in command_examples:
+        _command_examples_cache[_get_memory_cache_key(protocol_type, cache_dir)] = examples
     return command_examples
@@ -1,5 +1,5 @@
-import asyncio
 from os import environ
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from typing_extensions import List
@@ -7,11 +7,10 @@ from robot.api.deco import keyword, library
 import robot.api.logger as logger
 from sonic_protocol.field_names import EFieldName
 from sonic_protocol.protocol_list import ProtocolList
-from sonic_protocol.schema import DeviceType
-from sonic_robot.deduce_command_examples import deduce_command_examples
+from sonic_protocol.schema import DeviceType, ProtocolType
+from sonic_robot.deduce_command_examples import deduce_command_examples, get_command_examples
 from soniccontrol.procedures.procedure_controller import ProcedureType
-from soniccontrol.procedures.procs.ramper import RamperArgs
-from soniccontrol.remote_controller import RemoteController
+from soniccontrol.sync_remote_controller import SyncRemoteController
 from soniccontrol_gui.plugins.device_plugin import DevicePluginRegistry, register_device_plugins
 
 
@@ -22,19 +21,19 @@ class RobotRemoteController:
     def __init__(self, log_path: Optional[str] = None):
         register_device_plugins()
         protocol_factories = { plugin.device_type: plugin.protocol_factory for plugin in DevicePluginRegistry.get_device_plugins() }
-        self._controller = RemoteController(log_path=Path(log_path) if log_path else None, protocol_factories=protocol_factories)
-        # Because our RemoteController is async, but robot is sync, 
-        # we have to embed all the calls to the RemoteController functions into an asyncio event loop.
-        self._loop = asyncio.get_event_loop()
+        # Because our RemoteController is async, but robot is sync, the calls are submitted to an event loop,
+        # that runs in its own thread. So the updater keeps running between the keywords.
+        self._sync_controller = SyncRemoteController(log_path=Path(log_path) if log_path else None, protocol_factories=protocol_factories)
+        self._controller = self._sync_controller.controller
 
     @keyword('Connect via serial to')
     def connect_via_serial(self, url: str) -> None:
-        self._loop.run_until_complete(self._controller.connect_via_serial(Path(url)))
+        self._sync_controller.connect_via_serial(Path(url))
         logger.info(f"Connected via serial to ${url}")
 
     @keyword('Connect via process to')
     def connect_via_process(self, process_file: str, cmd_args: List[str] = []) -> None:
-        self._loop.run_until_complete(self._controller.connect_via_process(Path(process_file), cmd_args=cmd_args))
+        self._sync_controller.connect_via_process(Path(process_file), cmd_args=cmd_args)
         logger.info(f"Connected via process to ${process_file}")
 
     @keyword('Is connected to device')
@@ -47,10 +46,10 @@ class RobotRemoteController:
     @keyword('Send Command ')
     def send_command(self, command_str: str) -> Tuple[str, dict, bool]:
         # if command_str == "!restart":
-        #     self._loop.run_until_complete(self._controller.stop_updater())
-        answer = self._loop.run_until_complete(self._controller.send_command(command_str))
+        #     self._sync_controller.stop_updater()
+        answer = self._sync_controller.send_command(command_str)
         # if command_str == "!restart":
-        #     self._loop.run_until_complete(self._controller.disconnect())
+        #     self._sync_controller.disconnect()
         return self._convert_answer(answer)
 
     @keyword('Deduce list of command examples')
@@ -59,33 +58,47 @@ class RobotRemoteController:
         info = self._controller._device.info
         return deduce_command_examples(info.protocol_version, info.device_type)
 
+    @keyword('Answer matches the expected answer of command example')
+    def answer_matches_command_example(self, command_str: str, answer_str: str) -> bool:
+        """
+        Checks the answer against the answer regex stored with the command examples, without building the protocol.
+        Error messages of the device never match.
+        """
+        assert (self._controller._device is not None)
+        info = self._controller._device.info
+        command_examples = get_command_examples(ProtocolType(info.protocol_version, info.device_type))
+        return any(
+            example.validate_answer(answer_str) is not None
+            for example in command_examples if example.command == command_str
+        )
+
     @keyword('Execute script')
     def execute_script(self, text: str) -> None:
-        self._loop.run_until_complete(self._controller.execute_script(text))
+        self._sync_controller.execute_script(text)
     
     @keyword('Execute ramp with ')
     def execute_ramp(self, ramp_args: dict) -> None:
-        self._controller.execute_ramp(RamperArgs(**ramp_args))
+        self._sync_controller.execute_procedure(ProcedureType.RAMP, ramp_args)
 
     @keyword('Execute procedure "${procedure}" with "${args}"')
     def execute_procedure(self, procedure: ProcedureType, args: dict) -> None:
-        self._controller.execute_procedure(procedure, args)
+        self._sync_controller.execute_procedure(procedure, args)
     
     @keyword('Stop procedure')
     def stop_procedure(self) -> None:
-        self._loop.run_until_complete(self._controller.stop_procedure())
+        self._sync_controller.stop_procedure()
     
     @keyword('Disconnect')
     def disconnect(self) -> None:
-        self._loop.run_until_complete(self._controller.disconnect())
+        self._sync_controller.disconnect()
 
     @keyword("Sleep for ${time_ms} ms")
     def sleep(self, time_ms: int) -> None:
         """
-        This is needed, because the sleep function of the robot framework pauses the whole application,
-        also the execution of the asyncio event loop
+        The event loop runs in its own thread, so the updater keeps running while sleeping.
+        Kept for the existing robot tests, that use this keyword instead of the sleep of the robot framework.
         """
-        self._loop.run_until_complete(asyncio.sleep(time_ms / 1000))
+        time.sleep(time_ms / 1000)
         print(f"Sleeping for {time_ms} ms")
 
 
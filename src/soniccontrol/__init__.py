@@ -1,6 +1,7 @@
 import logging
 # forward imports
 from soniccontrol.remote_controller import RemoteController 
+from soniccontrol.sync_remote_controller import SyncRemoteController
 from sonic_protocol.python_parser import commands
 from sonic_protocol.field_names import EFieldName
 
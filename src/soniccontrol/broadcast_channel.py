@@ -0,0 +1,175 @@
+import asyncio
+from enum import Enum
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable, Generic, List, Tuple, TypeVar
+
+import attrs
+
+
+T = TypeVar("T")
+
+
+class DropPolicy(Enum):
+    """!
+    Defines what happens, if a subscriber is too slow and its queue is full.
+    """
+    KEEP_LATEST = "keep_latest" #! Only the newest item is kept. Meant for GUIs, that only need to show the current state
+    DROP_OLDEST = "drop_oldest" #! The oldest items are dropped. Meant for plots, that show a window of recent items
+    BACKPRESSURE = "backpressure" #! No items are lost, instead the publisher waits until the queue has space. Meant for captures
+
+
+@attrs.define
+class SubscriberStatistics:
+    """!
+    The lag is the time between publishing an item and the start of the call of the listener with it.
+    """
+    delivered: int = attrs.field(default=0)
+    dropped: int = attrs.field(default=0)
+    queue_length: int = attrs.field(default=0)
+    max_lag_s: float = attrs.field(default=0.)
+    total_lag_s: float = attrs.field(default=0.)
+
+    @property
+    def mean_lag_s(self) -> float:
+        return self.total_lag_s / self.delivered if self.delivered > 0 else 0.
+
+
+class Subscription(Generic[T]):
+    def __init__(
+        self,
+        listener: Callable[[T], None | Awaitable[None]],
+        drop_policy: DropPolicy,
+        max_queue_size: int,
+        coalesce: Callable[[T, T], T] | None,
+        logger: logging.Logger
+    ) -> None:
+        if max_queue_size <= 0:
+            raise ValueError(f"The queue size has to be positive, but is {max_queue_size}")
+        self._listener = listener
+        self._drop_policy = drop_policy
+        self._coalesce = coalesce
+        self._logger = logger
+        self._queue: asyncio.Queue[Tuple[float, T]] = asyncio.Queue(1 if drop_policy is DropPolicy.KEEP_LATEST else max_queue_size)
+        self._task: asyncio.Task | None = None
+        self._statistics = SubscriberStatistics()
+        # Counts the items, that were put and that were delivered or dropped, so that drain knows when it is done
+        self._items_put = 0
+        self._items_done = 0
+        self._item_done = asyncio.Event()
+
+    @property
+    def drop_policy(self) -> DropPolicy:
+        return self._drop_policy
+
+    @property
+    def statistics(self) -> SubscriberStatistics:
+        self._statistics.queue_length = self._queue.qsize()
+        return self._statistics
+
+    async def put(self, item: T) -> None:
+        if self._task is None:
+            # The task is started here and not on subscribing, because there is no running event loop before
+            self._task = asyncio.create_task(self._deliver())
+
+        published = time.monotonic()
+        if self._drop_policy is DropPolicy.BACKPRESSURE:
+            await self._queue.put((published, item))
+            self._items_put += 1
+            return
+
+        if self._queue.full():
+            old_published, old_item = self._queue.get_nowait()
+            if self._drop_policy is DropPolicy.KEEP_LATEST and self._coalesce is not None:
+                # the lag is measured from the oldest item, that got merged into this one
+                item = self._coalesce(old_item, item)
+                published = old_published
+            self._statistics.dropped += 1
+            self._mark_done()
+        self._queue.put_nowait((published, item))
+        self._items_put += 1
+
+    async def _deliver(self) -> None:
+        while True:
+            published, item = await self._queue.get()
+            lag = time.monotonic() - published
+            self._statistics.delivered += 1
+            self._statistics.total_lag_s += lag
+            self._statistics.max_lag_s = max(self._statistics.max_lag_s, lag)
+            try:
+                result = self._listener(item)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._logger.exception("Listener %s failed: %s", self._listener, e)
+            self._mark_done()
+
+    def _mark_done(self) -> None:
+        self._items_done += 1
+        self._item_done.set()
+
+    async def drain(self) -> None:
+        """!
+        Waits until the listener was called with all items, that were put before.
+        Returns early, if the subscription gets closed.
+        """
+        items_put = self._items_put
+        while self._task is not None and self._items_done < items_put:
+            self._item_done.clear()
+            await self._item_done.wait()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._item_done.set()
+
+
+class BroadcastChannel(Generic[T]):
+    """!
+    Broadcasts items to subscribers, that each get their own bounded queue and task.
+    So a slow subscriber does not delay the publisher or the other subscribers,
+    except for subscribers with DropPolicy.BACKPRESSURE, whose queues are full.
+    """
+    def __init__(self, logger: logging.Logger = logging.getLogger()) -> None:
+        self._logger = logging.getLogger(logger.name + "." + BroadcastChannel.__name__)
+        self._subscriptions: List[Subscription[T]] = []
+
+    @property
+    def subscriptions(self) -> List[Subscription[T]]:
+        return self._subscriptions
+
+    def subscribe(
+        self,
+        listener: Callable[[T], None | Awaitable[None]],
+        drop_policy: DropPolicy = DropPolicy.KEEP_LATEST,
+        max_queue_size: int = 100,
+        coalesce: Callable[[T, T], T] | None = None
+    ) -> Subscription[T]:
+        """!
+        @param listener Called with each item. Can be a coroutine function.
+        @param max_queue_size Is ignored for DropPolicy.KEEP_LATEST, which keeps only one item.
+        @param coalesce Used by DropPolicy.KEEP_LATEST to merge a dropped item into the newer item.
+        """
+        subscription = Subscription(listener, drop_policy, max_queue_size, coalesce, self._logger)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription[T]) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            await subscription.close()
+
+    async def publish(self, item: T) -> None:
+        for subscription in list(self._subscriptions):
+            await subscription.put(item)
+
+    async def close(self) -> None:
+        for subscription in self._subscriptions:
+            await subscription.close()
+        self._subscriptions.clear()
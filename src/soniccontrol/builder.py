@@ -1,30 +1,85 @@
+import asyncio
 import logging
 from typing import Any, Dict
 
 
-from sonic_protocol.protocol import protocol_list as operator_protocol_factory
-from sonic_protocol.protocol_list import ProtocolList
+from sonic_protocol.json_serializer.protocol_snapshot import ProtocolSnapshotStore
+from sonic_protocol.protocol_list import IProtocolFactory
 from sonic_protocol.schema import BuildType, DeviceType, ProtocolType, Version
 from sonic_protocol.field_names import EFieldName, IEFieldName
-from soniccontrol.communication.connection import Connection
+from soniccontrol.communication.communicator import Communicator
+from soniccontrol.communication.connection import Connection, SerialConnection
 from soniccontrol.communication.legacy_communicator import LegacyCommunicator
 from soniccontrol.communication.serial_communicator import SerialCommunicator
+from soniccontrol.app_config import PROTOCOL_CACHE_DIR
+from soniccontrol.device_profile_cache import ConnectTimings, DeviceProfile, DeviceProfileCache, get_port_of_connection
+from soniccontrol.device_state_cache import DeviceStateCache
 from soniccontrol.sonic_device import FirmwareInfo, SonicDevice
 import sonic_protocol.python_parser.commands as cmds
 
 
+# Loads the protocols from snapshots, so that the protocol definitions do not need to be imported on startup
+operator_protocol_factory = ProtocolSnapshotStore(PROTOCOL_CACHE_DIR)
+
+# Bounds for waiting on the first message of a crystal device, whose boot time is known from its profile
+LEGACY_MIN_INITIAL_TIMEOUT_S = 1.
+LEGACY_MAX_INITIAL_TIMEOUT_S = 10.
+
+
 class DeviceBuilder:
-    def __init__(self, protocol_factories: Dict[DeviceType, ProtocolList] = {}, logger: logging.Logger = logging.getLogger()):
+    def __init__(self, protocol_factories: Dict[DeviceType, IProtocolFactory] = {}, logger: logging.Logger = logging.getLogger(),
+                 use_state_cache: bool = False, profile_cache: DeviceProfileCache | None = None):
+        """!
+        @param use_state_cache If True, the built devices answer idempotent getters from a DeviceStateCache, while the answers are fresh
+        @param profile_cache If set, devices that were connected before on the same port are built immediately from their profile.
+        The profile gets verified in the background afterwards, see profile_verification
+        """
         self._logger = logger
         self._builder_logger = logging.getLogger(logger.name + "." + DeviceBuilder.__name__)
         self._protocol_factories = protocol_factories
+        self._use_state_cache = use_state_cache
+        self._profile_cache = profile_cache
+        self._connect_timings: ConnectTimings | None = None
+        self._profile_verification: asyncio.Task[bool] | None = None
+
+    @property
+    def connect_timings(self) -> ConnectTimings | None:
+        """! The timings of the phases of the last build """
+        return self._connect_timings
+
+    @property
+    def profile_verification(self) -> asyncio.Task[bool] | None:
+        """!
+        The background task, that checks if the device matches the profile it was built from.
+        Results in False, if it did not match. Then the profile is replaced and the device should be rebuilt.
+        None if the last build did not use a profile.
+        """
+        return self._profile_verification
+
+    def _create_state_cache(self) -> DeviceStateCache | None:
+        return DeviceStateCache() if self._use_state_cache else None
+
+    def _get_profile(self, connection: Connection) -> DeviceProfile | None:
+        if self._profile_cache is None:
+            return None
+        return self._profile_cache.get(get_port_of_connection(connection))
+
+    def _store_profile(self, connection: Connection, info: FirmwareInfo, boot_time_s: float | None = None) -> None:
+        if self._profile_cache is None:
+            return
+        baudrate = connection.baudrate if isinstance(connection, SerialConnection) else None
+        self._profile_cache.put(DeviceProfile.from_info(get_port_of_connection(connection), info, baudrate, boot_time_s))
+
+    def _finish_build(self, timings: ConnectTimings) -> None:
+        self._connect_timings = timings
+        self._builder_logger.info("Connected in %s%s", timings, " using the cached device profile" if timings.used_profile else "")
 
 
     async def _update_info(self, device: SonicDevice) -> None:
         info = device.info
         result_dict: Dict[IEFieldName, Any] = {}
         if device.has_command(cmds.GetInfo()):
-            answer = await device.execute_command(cmds.GetInfo(), raise_exception=False, should_log=False)
+            answer = await device.execute_command(cmds.GetInfo(), raise_exception=False, should_log=False, use_cache=False)
             result_dict.update(answer.field_value_dict)
         
         info.firmware_version = result_dict.get(EFieldName.FIRMWARE_VERSION, Version(0, 0, 0))
@@ -35,63 +90,150 @@ class DeviceBuilder:
         self._builder_logger.info("Firmware info: %s", info.firmware_info)
         self._builder_logger.info("Protocol version: %s", info.protocol_version)
 
+    async def _deduce_protocol_type(self, comm: Communicator) -> ProtocolType | None:
+        """! Asks the device with ?protocol, which protocol it understands. None if it does not understand ?protocol """
+        protocol = operator_protocol_factory.build_protocol_for(ProtocolType(Version(1, 0, 0), DeviceType.UNKNOWN, True))
+
+        device = SonicDevice(comm, protocol, FirmwareInfo(), logger=self._logger)
+        answer = await device.execute_command(cmds.GetProtocol(), raise_exception=False)
+        if not answer.valid:
+            return None
+        assert(EFieldName.DEVICE_TYPE in answer.field_value_dict)
+        assert(EFieldName.PROTOCOL_VERSION in answer.field_value_dict)
+        assert(EFieldName.IS_RELEASE in answer.field_value_dict)
+        return ProtocolType(
+            answer.field_value_dict[EFieldName.PROTOCOL_VERSION],
+            answer.field_value_dict[EFieldName.DEVICE_TYPE],
+            answer.field_value_dict[EFieldName.IS_RELEASE] == BuildType.RELEASE.name
+        )
+
+    async def _verify_profile(self, device: SonicDevice, connection: Connection, profile: DeviceProfile, boot_time_s: float | None = None) -> bool:
+        try:
+            if device.info.device_type != DeviceType.CRYSTAL:
+                # The protocol of the crystal is fixed, so there is nothing to deduce
+                protocol_type = await self._deduce_protocol_type(device.communicator)
+                if protocol_type is None:
+                    self._builder_logger.warning("The device on %s does not understand ?protocol anymore", profile.port)
+                    self._profile_cache.invalidate(profile.port) # type: ignore
+                    return False
+                device.info.device_type = protocol_type.device_type
+                device.info.protocol_version = protocol_type.version
+                device.info.is_release = protocol_type.is_release
+            await self._update_info(device)
+        except Exception as e:
+            self._builder_logger.warning("Could not verify the device profile of %s: %s", profile.port, e)
+            self._profile_cache.invalidate(profile.port) # type: ignore
+            return False
+
+        self._store_profile(connection, device.info, boot_time_s if boot_time_s is not None else profile.boot_time_s)
+        current_profile = self._get_profile(connection)
+        assert current_profile is not None
+        if not current_profile.matches(profile):
+            self._builder_logger.warning(
+                "The device on %s changed since the last connection. Expected %s, but got %s. The device has to be rebuilt", 
+                profile.port, profile, current_profile
+            )
+            return False
+        self._builder_logger.debug("The device on %s matches its profile", profile.port)
+        return True
+
+    def _start_profile_verification(self, device: SonicDevice, connection: Connection, profile: DeviceProfile, boot_time_s: float | None = None) -> None:
+        self._profile_verification = asyncio.create_task(self._verify_profile(device, connection, profile, boot_time_s))
+
 
     async def build_legacy_crystal(self, connection: Connection) -> SonicDevice:
         protocol_version: Version = Version(1, 0, 0)
         device_type: DeviceType = DeviceType.CRYSTAL
         is_release: bool = True
 
+        timings = ConnectTimings()
+        self._profile_verification = None
+        profile = self._get_profile(connection)
+        if profile is not None and profile.device_type != DeviceType.CRYSTAL:
+            profile = None
+
         comm = LegacyCommunicator(_logger=self._logger)
-        await comm.open_communication(connection)
+        with timings.measure("open_connection"):
+            if profile is None:
+                await comm.open_communication(connection)
+            else:
+                # We know how long the device needs to boot, so we do not have to wait the whole time for its first message
+                initial_timeout = LEGACY_MIN_INITIAL_TIMEOUT_S if profile.boot_time_s is None else \
+                    min(LEGACY_MAX_INITIAL_TIMEOUT_S, max(LEGACY_MIN_INITIAL_TIMEOUT_S, 2 * profile.boot_time_s))
+                await comm.open_communication(connection, baudrate=profile.baudrate or 115200, initial_timeout_s=initial_timeout)
         
         # create device
         self._builder_logger.info("The device is a %s with a %s build and understands the protocol %s", device_type.value, "release", str(protocol_version))
-        protocol = operator_protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
+        with timings.measure("build_protocol"):
+            protocol = operator_protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
             
+        if profile is not None:
+            timings.used_profile = True
+            device = SonicDevice(comm, protocol, profile.to_info(), logger=self._logger, state_cache=self._create_state_cache())
+            self._start_profile_verification(device, connection, profile, comm.first_message_delay_s)
+            self._finish_build(timings)
+            return device
+
         info = FirmwareInfo()
-        device = SonicDevice(comm, protocol, info, logger=self._logger)
+        device = SonicDevice(comm, protocol, info, logger=self._logger, state_cache=self._create_state_cache())
     
         # update info
         info.device_type = device_type
         info.protocol_version = protocol_version
         info.is_release = is_release
-        await self._update_info(device)
+        with timings.measure("get_info"):
+            await self._update_info(device)
 
+        self._store_profile(connection, info, comm.first_message_delay_s)
+        self._finish_build(timings)
         return device
 
 
     async def build_amp(self, connection: Connection, try_deduce_protocol_used: bool = True) -> SonicDevice:
         """!
-        @param open_in_rescue_mode This param can be set to False, so that it does not try to deduce which protocol to use. Used for the rescue window
+        @param try_deduce_protocol_used This param can be set to False, so that it does not try to deduce which protocol to use. Used for the rescue window
         """
         
         protocol_version: Version = Version(0, 0, 0)
         device_type: DeviceType = DeviceType.UNKNOWN
         is_release: bool = True
 
+        timings = ConnectTimings()
+        self._profile_verification = None
+        # In rescue mode we do not know the protocol on purpose, so the profile is not used
+        profile = self._get_profile(connection) if try_deduce_protocol_used else None
+        if profile is not None and profile.device_type in (DeviceType.CRYSTAL, DeviceType.UNKNOWN):
+            profile = None
+
         comm = SerialCommunicator(logger=self._logger) #type: ignore
-        await comm.open_communication(connection)
+        with timings.measure("open_connection"):
+            if profile is not None and profile.baudrate is not None:
+                await comm.open_communication(connection, baudrate=profile.baudrate)
+            else:
+                await comm.open_communication(connection)
 
         self._builder_logger.debug("Serial connection is open, start building device")
 
         info = FirmwareInfo()
         # deduce the right protocol version, device_type and build_type
-        if try_deduce_protocol_used:
+        if profile is not None:
+            self._builder_logger.debug("Use the cached profile of the device on %s", profile.port)
+            timings.used_profile = True
+            info = profile.to_info()
+            device_type = profile.device_type
+            protocol_version = profile.protocol_version
+            is_release = profile.is_release
+        elif try_deduce_protocol_used:
             self._builder_logger.debug("Try to figure out which protocol to use with ?protocol")
 
-            protocol_version: Version = Version(1, 0, 0)
-            protocol = operator_protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
-
-            device = SonicDevice(comm, protocol, info, logger=self._logger)
-            answer = await device.execute_command(cmds.GetProtocol(), raise_exception=False)
-            if answer.valid:
-                assert(EFieldName.DEVICE_TYPE in answer.field_value_dict)
-                assert(EFieldName.PROTOCOL_VERSION in answer.field_value_dict)
-                assert(EFieldName.IS_RELEASE in answer.field_value_dict)
-                device_type = answer.field_value_dict[EFieldName.DEVICE_TYPE]
-                protocol_version = answer.field_value_dict[EFieldName.PROTOCOL_VERSION]
-                is_release = answer.field_value_dict[EFieldName.IS_RELEASE] == BuildType.RELEASE.name
+            with timings.measure("deduce_protocol"):
+                protocol_type = await self._deduce_protocol_type(comm)
+            if protocol_type is not None:
+                device_type = protocol_type.device_type
+                protocol_version = protocol_type.version
+                is_release = protocol_type.is_release
             else:
+                protocol_version = Version(1, 0, 0)
                 self._builder_logger.debug("Device does not understand ?protocol command")
         else:
             self._builder_logger.warning("Device uses unknown protocol")
@@ -99,17 +241,28 @@ class DeviceBuilder:
         # create device
         self._builder_logger.info("The device is a %s with a %s build and understands the protocol %s", device_type.value, "release" if is_release else "build", str(protocol_version))
         
-        protocol_factory = self._protocol_factories.get(device_type, operator_protocol_factory)
-        protocol = protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
+        with timings.measure("build_protocol"):
+            protocol_factory = self._protocol_factories.get(device_type, operator_protocol_factory)
+            protocol = protocol_factory.build_protocol_for(ProtocolType(protocol_version, device_type, is_release))
             
         # If we did not deduce the protocol then we should also not try to validate the answers, because we do not know how they look like
         device = SonicDevice(comm, protocol, info, 
-                             should_validate_answers=try_deduce_protocol_used, logger=self._logger)
+                             should_validate_answers=try_deduce_protocol_used, logger=self._logger, 
+                             state_cache=self._create_state_cache())
+
+        if profile is not None:
+            self._start_profile_verification(device, connection, profile)
+            self._finish_build(timings)
+            return device
     
         # update info
         info.device_type = device_type
         info.protocol_version = protocol_version
         info.is_release = is_release
-        await self._update_info(device)
+        with timings.measure("get_info"):
+            await self._update_info(device)
 
+        if try_deduce_protocol_used and device_type != DeviceType.UNKNOWN:
+            self._store_profile(connection, info)
+        self._finish_build(timings)
         return device
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import Final, List, Optional
 
@@ -29,6 +30,7 @@ class LegacyCommunicator(Communicator):
     _command_queue: asyncio.Queue = attrs.field(default=asyncio.Queue(), init=False)
     _restart: bool = attrs.field(default=False, init=False)
     _message_counter: int = attrs.field(default=0, init=False)
+    _first_message_delay_s: float | None = attrs.field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         self._logger = logging.getLogger(self._logger.name + "." + LegacyCommunicator.__name__)
@@ -47,10 +49,20 @@ class LegacyCommunicator(Communicator):
     def connection_opened(self) -> asyncio.Event:
         return self._connection_opened
     
+    @property
+    def first_message_delay_s(self) -> float | None:
+        """! Time until the device sent its first message after the connection was opened. None if it sent nothing """
+        return self._first_message_delay_s
+
     async def open_communication(
         self, connection: Connection,
-        baudrate = 115200
+        baudrate = 115200,
+        initial_timeout_s: float = 10
     ) -> None:
+        """!
+        @param initial_timeout_s How long to wait for the first message of the device.
+        Crystal devices take a long time to respond after connecting, so only reduce it, if you know how long the device takes.
+        """
         self._connection = connection
         self._logger.info("try open communication")
         if isinstance(connection, SerialConnection):
@@ -60,10 +72,14 @@ class LegacyCommunicator(Communicator):
         self._reader, self._writer = await self._connection.open_connection()
         #self._writer.write(b"!SERIAL\n")
         #await self._writer.drain()
-        timeout = 10  # Crystal devices takes a long time to respond after connecting
+        timeout = initial_timeout_s
+        self._first_message_delay_s = None
+        opened_at = time.monotonic()
         while True:
             try:
                 answer = await asyncio.wait_for(self._reader.readline(), timeout=timeout)
+                if self._first_message_delay_s is None:
+                    self._first_message_delay_s = time.monotonic() - opened_at
                 timeout = 0.4 # Change timeout back so we dont have to wait for 10 after the last line
                 self._logger.info("Received: %s", answer)
                 #self._answer_lines.append(answer.strip())
@@ -1,4 +1,5 @@
 from enum import Enum
+import functools
 import logging
 from typing import Any
 import abc
@@ -21,6 +22,11 @@ class CommunicationProtocol:
     @abc.abstractmethod
     def parse_request(self, request: str, request_id: int) -> Any: ...
 
+    def encode_request(self, request: str | bytes, request_id: int, encoding: str = "utf-8") -> bytes:
+        """! Returns the final frame of the request, that gets written to the connection """
+        request_str = request.decode(encoding) if isinstance(request, bytes) else request
+        return str(self.parse_request(request_str, request_id)).encode(encoding)
+
     @abc.abstractmethod
     def prot_type(self) -> ProtocolType: ...
 
@@ -98,6 +104,15 @@ class SonicMessageProtocol(CommunicationProtocol):
     def parse_request(self, request: str, request_id: int) -> str:
         # The \n at the end ensures that terminals in canonical mode read in the whole message
         return f"{SonicMessageProtocol.COMMAND_PREFIX}#{request_id}={request}{self.separator}"
+
+    @functools.cached_property
+    def _request_frame_template(self) -> bytes:
+        return f"{SonicMessageProtocol.COMMAND_PREFIX}#%d=%b{self.separator}".encode()
+
+    def encode_request(self, request: str | bytes, request_id: int, encoding: str = "utf-8") -> bytes:
+        # formats the frame directly as bytes with a precompiled template
+        request_bytes = request if isinstance(request, bytes) else request.encode(encoding)
+        return self._request_frame_template % (request_id, request_bytes)
     
     @abc.abstractmethod
     def prot_type(self) -> ProtocolType:
@@ -10,6 +10,7 @@ from soniccontrol.communication.message_protocol import CommunicationProtocol, S
 from soniccontrol.app_config import ENCODING
 from soniccontrol.events import Event
 from soniccontrol.app_config import PLATFORM, System
+from soniccontrol.tracing import trace_span
 
 @attrs.define()
 class SerialCommunicator(Communicator):
@@ -101,38 +102,43 @@ class SerialCommunicator(Communicator):
         assert self._writer is not None
         assert self._message_fetcher.is_running
 
-        async with self._lock:
+        with trace_span("lock_wait", "communication"):
+            await self._lock.acquire()
+        try:
             if request_str != "-":
                 self._logger.info("Send command: %s", request_str)
 
             self._message_counter = (self._message_counter + 1) % self.MESSAGE_ID_MAX_CLIENT
             message_counter = self._message_counter
 
-            message = self._protocol.parse_request(
-                request_str, message_counter
+            encoded_message = self._protocol.encode_request(
+                request_str, message_counter, ENCODING
             )
 
             if request_str != "-":
-                self._logger.info("Write package: %s", message)
-            encoded_message = message.encode(ENCODING)
+                self._logger.info("Write package: %s", encoded_message)
 
             
-            if PLATFORM == System.WINDOWS:
-                # FIXME: Quick fix. We have a weird error that the buffer does not get flushed somehow
-                await self._send_chunks(encoded_message)    
-            else:
-                self._writer.write(encoded_message)
-                await self._writer.drain()
+            with trace_span("write", "communication"):
+                if PLATFORM == System.WINDOWS:
+                    # FIXME: Quick fix. We have a weird error that the buffer does not get flushed somehow
+                    await self._send_chunks(encoded_message)    
+                else:
+                    self._writer.write(encoded_message)
+                    await self._writer.drain()
 
             # FIXME: to move the awaiting of the response inside the lock is only a quickfix, because the code on
             # the device of the uart needs to be refactored, so that it can handle messaging bursts.
-            response =  await self._message_fetcher.get_answer_of_request(
-                message_counter
-            )
+            with trace_span("wait_for_answer", "communication"):
+                response =  await self._message_fetcher.get_answer_of_request(
+                    message_counter
+                )
             if request_str != "-":
                 self._logger.info("Receive Answer: %s", response)
 
             return response
+        finally:
+            self._lock.release()
 
     async def send_and_wait_for_response(self, request: str, **kwargs) -> str:
         if not self._connection_opened.is_set():
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import math
+import numbers
+from typing import Any, Iterable, List, Tuple
+
+import attrs
+
+from sonic_protocol.field_names import EFieldName, IEFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.answer import Answer
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import SIVar
+from soniccontrol.sonic_device import SonicDevice
+from soniccontrol.tracing import trace_span
+
+
+@attrs.define
+class ConfigValue:
+    """!
+    A value, that should be set on the device.
+    @param getter Used to read the current value. Can be None, if the device has no getter for it. Then the value is always set
+    """
+    field_name: IEFieldName = attrs.field()
+    value: Any = attrs.field()
+    setter: Command = attrs.field()
+    getter: Command | None = attrs.field(default=None)
+
+
+def create_at_config_values(index: int, atf: int, atk: float, att: float) -> List[ConfigValue]:
+    """! The values of one transducer config entry. index starts at 1 """
+    return [
+        ConfigValue(EFieldName.ATF, atf, commands.SetAtf(index, atf), commands.GetAtf(index)),
+        ConfigValue(EFieldName.ATK, atk, commands.SetAtk(index, atk), commands.GetAtk(index)),
+        ConfigValue(EFieldName.ATT, att, commands.SetAtt(index, att), commands.GetAtt(index)),
+    ]
+
+
+@attrs.define
+class ApplyResult:
+    sent_setters: List[Command] = attrs.field(factory=list)
+    unchanged_count: int = attrs.field(default=0)
+    #! The values that did not match after applying them, together with the value read back from the device
+    mismatches: List[Tuple[ConfigValue, Any]] = attrs.field(factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return len(self.mismatches) == 0
+
+
+class ConfigApplier:
+    """!
+    Applies a configuration by sending only the setters of values, that differ from the values on the device.
+    The current values are read in one pass, from the state cache of the device if it has one,
+    and the changed values are verified with a single read-back pass.
+    """
+    def __init__(self, device: SonicDevice, float_tolerance: float = 1e-6, logger: logging.Logger = logging.getLogger()) -> None:
+        self._device = device
+        self._float_tolerance = float_tolerance
+        self._logger = logging.getLogger(logger.name + "." + ConfigApplier.__name__)
+
+    def values_equal(self, expected: Any, actual: Any) -> bool:
+        if isinstance(expected, SIVar):
+            expected = expected.to_prefix(SIPrefix.NONE)
+        if isinstance(actual, SIVar):
+            actual = actual.to_prefix(SIPrefix.NONE)
+        if isinstance(expected, numbers.Real) and isinstance(actual, numbers.Real) and not isinstance(expected, bool):
+            return math.isclose(float(expected), float(actual), rel_tol=0., abs_tol=self._float_tolerance)
+        return expected == actual
+
+    async def _execute(self, command: Command, use_cache: bool) -> Answer:
+        return await self._device.execute_command(command, should_log=False, raise_exception=False, use_cache=use_cache)
+
+    async def _read(self, config_values: List[ConfigValue], use_cache: bool) -> List[Any | None]:
+        """! Reads the values with their getters. None for values, that could not be read """
+        async def read_value(config_value: ConfigValue) -> Any | None:
+            if config_value.getter is None or not self._device.has_command(config_value.getter):
+                return None
+            answer = await self._execute(config_value.getter, use_cache)
+            return answer.field_value_dict.get(config_value.field_name) if answer.valid else None
+
+        return list(await asyncio.gather(*(read_value(config_value) for config_value in config_values)))
+
+    def compute_diff(self, config_values: List[ConfigValue], current_values: List[Any | None]) -> List[ConfigValue]:
+        """! Returns the values that need to be set. Values that could not be read are always set """
+        return [
+            config_value for config_value, current_value in zip(config_values, current_values)
+            if current_value is None or not self.values_equal(config_value.value, current_value)
+        ]
+
+    async def apply(self, config_values: Iterable[ConfigValue]) -> ApplyResult:
+        config_values = list(config_values)
+        with trace_span("read_current_config", "config"):
+            current_values = await self._read(config_values, use_cache=True)
+        changed_values = self.compute_diff(config_values, current_values)
+        result = ApplyResult(unchanged_count=len(config_values) - len(changed_values))
+        self._logger.info("%d of %d config values changed", len(changed_values), len(config_values))
+        if not changed_values:
+            return result
+
+        with trace_span("send_config_setters", "config", count=len(changed_values)):
+            setter_answers = await asyncio.gather(*(self._execute(value.setter, use_cache=False) for value in changed_values))
+        result.sent_setters = [value.setter for value in changed_values]
+
+        with trace_span("verify_config", "config"):
+            read_back_values = await self._read(changed_values, use_cache=False)
+        for config_value, setter_answer, read_back_value in zip(changed_values, setter_answers, read_back_values):
+            actual_value = read_back_value
+            if actual_value is None and setter_answer.valid:
+                # Without a getter, the answer of the setter is the best we know
+                actual_value = setter_answer.field_value_dict.get(config_value.field_name)
+            if actual_value is None or not self.values_equal(config_value.value, actual_value):
+                self._logger.warning("%s should be %s, but is %s", config_value.field_name.name, config_value.value, actual_value)
+                result.mismatches.append((config_value, actual_value))
+        return result
@@ -7,11 +7,14 @@ from typing import Any, Dict
 from async_tkinter_loop import async_handler
 
 from sonic_protocol.field_names import EFieldName
+from soniccontrol.broadcast_channel import DropPolicy, Subscription
 from soniccontrol.data_capturing.capture_target import CaptureFree, CaptureTarget
 from soniccontrol.data_capturing.data_provider import DataProvider
 from soniccontrol.data_capturing.experiment import Experiment
 from soniccontrol.data_capturing.experiment_store import ExperimentWriter, HDF5ExperimentWriter
 from soniccontrol.events import Event, EventManager
+from soniccontrol.tracing import trace_span
+from soniccontrol.updater import Updater
 
 
 
@@ -29,6 +32,8 @@ class Capture(EventManager):
         self._experiment: Experiment | None = None
         self._experiment_writer: ExperimentWriter | None = None
         self._metadata_written = False
+        self._updater: Updater | None = None
+        self._update_subscription: Subscription[Event] | None = None
         self._completed_capturing.set()
 
     @property 
@@ -41,6 +46,22 @@ class Capture(EventManager):
     @property
     def data_provider(self) -> DataProvider:
         return self._data_provider
+
+    def subscribe_to_updates(self, updater: Updater) -> None:
+        """!
+        Captures the updates of the updater. The subscription uses backpressure, so no updates are lost,
+        and the updates, that are still queued, are captured before the capture ends.
+        """
+        self._updater = updater
+        self._update_subscription = updater.subscribe_update_channel(
+            lambda e: self.on_update(e.data["status"], e.data.get("timestamp")), DropPolicy.BACKPRESSURE
+        )
+
+    async def unsubscribe_from_updates(self) -> None:
+        if self._updater is not None and self._update_subscription is not None:
+            await self._updater.unsubscribe_update_channel(self._update_subscription)
+        self._updater = None
+        self._update_subscription = None
     
     async def start_capture(self, experiment: Experiment, capture_target: CaptureTarget = CaptureFree()):
         assert self._completed_capturing.is_set()
@@ -77,9 +98,16 @@ class Capture(EventManager):
         assert not self._completed_capturing.is_set()
         assert self._target
 
+        if self._update_subscription is not None:
+            await self._update_subscription.drain()
         self._completed_capturing.set()        
 
         if self._experiment_writer:
+            if self._target.writes_result_block:
+                result_block = self._target.get_result_block()
+                if result_block is not None:
+                    with trace_span("capture.add_block", "capture", rows=len(result_block)):
+                        self._experiment_writer.add_block(result_block)
             self._experiment_writer.close()
             self._experiment_writer = None
 
@@ -90,16 +118,20 @@ class Capture(EventManager):
         self._target.unsubscribe(CaptureTarget.COMPLETED_EVENT, self.capture_target_completed_callback)
 
 
-    def on_update(self, status: Dict[EFieldName, Any]):
+    def on_update(self, status: Dict[EFieldName, Any], timestamp: datetime.datetime | None = None):
+        """!
+        @param timestamp The time the status was received. Used, if the status itself has no timestamp. Defaults to now.
+        """
         if not self._completed_capturing.is_set():
             assert self._experiment_writer
 
-            attrs: Dict[str, Any] = { k.name: v for k, v in status.items() }
-            
-            # TODO: Maybe it would be better to move this into updater?
-            timestamp_col = EFieldName.TIMESTAMP.name
-            if EFieldName.TIMESTAMP not in status.keys():
-                attrs[timestamp_col] = datetime.datetime.now()
-            
-            self._data_provider.add_row(attrs)
-            self._experiment_writer.add_row(attrs)
+            with trace_span("capture.on_update", "capture"):
+                attrs: Dict[str, Any] = { k.name: v for k, v in status.items() }
+                
+                timestamp_col = EFieldName.TIMESTAMP.name
+                if EFieldName.TIMESTAMP not in status.keys():
+                    attrs[timestamp_col] = datetime.datetime.now() if timestamp is None else timestamp
+                
+                self._data_provider.add_row(attrs)
+                if self._target is None or not self._target.writes_result_block:
+                    self._experiment_writer.add_row(attrs)
@@ -3,6 +3,7 @@ import abc
 from enum import Enum
 from typing import Any, Dict
 import attrs
+import numpy as np
 from soniccontrol.procedures.procs.spectrum_measure import SpectrumMeasure, SpectrumMeasureArgs
 from soniccontrol.updater import Updater
 from soniccontrol.events import Event, EventManager, PropertyChangeEvent
@@ -17,6 +18,7 @@ class CaptureTargets(Enum):
     SCRIPT = "Script"
     PROCEDURE = "Procedure"
     SPECTRUM_MEASURE = "Spectrum Measure"
+    RESONANCE_SWEEP = "Resonance Sweep"
 
 
 class CaptureTarget(abc.ABC, EventManager):
@@ -38,6 +40,14 @@ class CaptureTarget(abc.ABC, EventManager):
     @abc.abstractmethod
     async def after_end_capture(self) -> None: ...
 
+    @property
+    def writes_result_block(self) -> bool:
+        """! If True, the updates are not written row by row, but the result block is written at the end of the capture """
+        return False
+
+    def get_result_block(self) -> np.ndarray | None:
+        return None
+
 
 class CaptureFree(CaptureTarget):
     def __init__(self):
@@ -166,12 +176,17 @@ class CaptureSpectrumArgs:
         ...
 
 class CaptureSpectrumMeasure(CaptureTarget):
-    def __init__(self, updater: Updater, procedure_controller: ProcedureController, spectrum_args: CaptureSpectrumArgs):
+    def __init__(self, updater: Updater, procedure_controller: ProcedureController, spectrum_args: CaptureSpectrumArgs,
+                 spectrum_measure: SpectrumMeasure | None = None, proc_type: ProcedureType = ProcedureType.SPECTRUM_MEASURE):
+        """!
+        @param spectrum_measure The procedure, that measures the spectrum. Defaults to a SpectrumMeasure. Can also be a ResonanceSweep
+        """
         super().__init__()
         self._updater = updater
         self._procedure_controller = procedure_controller
         self._spectrum_args = spectrum_args
-        self._spectrum_measure = SpectrumMeasure(self._updater)
+        self._spectrum_measure = SpectrumMeasure(self._updater) if spectrum_measure is None else spectrum_measure
+        self._proc_type = proc_type
         self._args: SpectrumMeasureArgs | None = None
         self._is_capturing = False
         self._procedure_controller.subscribe(
@@ -191,6 +206,14 @@ class CaptureSpectrumMeasure(CaptureTarget):
         
         self.emit(Event(CaptureTarget.COMPLETED_EVENT))
 
+    @property
+    def writes_result_block(self) -> bool:
+        return True
+
+    def get_result_block(self) -> np.ndarray | None:
+        spectrum = self._spectrum_measure.last_spectrum
+        return None if spectrum is None else spectrum[spectrum["measured"]]
+
     async def before_start_capture(self) -> None:
         self._args = self._spectrum_args.spectrum_args
         await self._updater.stop()
@@ -198,7 +221,7 @@ class CaptureSpectrumMeasure(CaptureTarget):
 
     def run_to_capturing_task(self) -> None:
         assert self._args is not None
-        self._procedure_controller.execute_procedure(self._spectrum_measure, ProcedureType.SPECTRUM_MEASURE, self._args)
+        self._procedure_controller.execute_procedure(self._spectrum_measure, self._proc_type, self._args)
 
     async def after_end_capture(self) -> None:
         self._is_capturing = False
@@ -111,7 +111,7 @@ def create_cattrs_converter_for_forms():
             typed_value = value  # Keep original if conversion fails
         
         # Create a direct SIVar instance with the metadata
-        return SIVar(value=typed_value, si_prefix=si_prefix, meta=meta)  # type: ignore
+        return SIVar.from_deserialization(value=typed_value, si_prefix=si_prefix, meta=meta)  # type: ignore
 
     def si_var_unstructure_hook(sivar: SIVar):
         return sivar
@@ -213,7 +213,7 @@ def create_cattrs_converter_for_basic_serialization():
             typed_value = value  # Keep original if conversion fails
         
         # Create a direct SIVar instance with the metadata
-        return SIVar(value=typed_value, si_prefix=si_prefix, meta=meta)  # type: ignore
+        return SIVar.from_deserialization(value=typed_value, si_prefix=si_prefix, meta=meta)  # type: ignore
 
     def si_var_unstructure_hook(sivar: SIVar):
         return {
@@ -24,6 +24,14 @@ class ExperimentWriter(abc.ABC):
     @abc.abstractmethod
     def add_row(self, data: Dict[str, Any]) -> None: ...
 
+    @abc.abstractmethod
+    def add_block(self, block: np.ndarray) -> None:
+        """!
+        Writes all rows of a structured array at once.
+        @param block Its field names are the lower case column names. The timestamp is a POSIX timestamp in seconds
+        """
+        ...
+
     @abc.abstractmethod
     def close(self) -> None: ...
 
@@ -128,6 +136,17 @@ class HDF5ExperimentWriter(ExperimentWriter):
         # filter data, so that it only contains the columns of the table
         filtered_data = { k.lower(): v for k, v in data.items() if k.lower() in self._data_table.colnames }
         HDF5SerializationHelper.add_rows_to_table(self._file, self._data_table, [filtered_data])
+
+    def add_block(self, block: np.ndarray) -> None:
+        rows = np.zeros(len(block), dtype=self._data_table.dtype)
+        timestamp_col = EFieldName.TIMESTAMP.name.lower()
+        for col in self._data_table.colnames:
+            if col == timestamp_col:
+                rows[col] = [datetime.datetime.fromtimestamp(timestamp).isoformat() for timestamp in block[col].tolist()]
+            elif col in block.dtype.names:
+                rows[col] = block[col]
+        self._data_table.append(rows)
+        self._data_table.flush()
         
     def close(self) -> None: 
         if self._file.isopen:
@@ -0,0 +1,136 @@
+import asyncio
+from enum import Enum
+import math
+import time
+from typing import Awaitable, Callable
+
+import attrs
+
+
+class OverrunPolicy(Enum):
+    """!
+    Defines what happens, if a poll takes so long, that the next deadline already passed.
+    """
+    SKIP = "skip" #! Skips the passed deadlines, so that all polls stay on the grid of deadlines
+    COMPENSATE = "compensate" #! Starts the next poll immediately, to catch up. Deadlines that are more than one interval behind are skipped
+
+
+@attrs.define
+class PollingStatistics:
+    """!
+    Statistics about how well the deadlines were met.
+    The intervals are measured between the starts of consecutive polls.
+    """
+    target_interval_s: float = attrs.field()
+    number_of_polls: int = attrs.field(default=0)
+    missed_deadlines: int = attrs.field(default=0)
+    mean_interval_s: float = attrs.field(default=0.)
+    max_lateness_s: float = attrs.field(default=0.)
+    _interval_square_deviations: float = attrs.field(default=0., init=False, repr=False)
+
+    @property
+    def target_rate_hz(self) -> float:
+        return 1 / self.target_interval_s
+
+    @property
+    def achieved_rate_hz(self) -> float:
+        return 1 / self.mean_interval_s if self.mean_interval_s > 0 else 0.
+
+    @property
+    def jitter_s(self) -> float:
+        """! Standard deviation of the intervals """
+        number_of_intervals = self.number_of_polls - 1
+        return math.sqrt(self._interval_square_deviations / number_of_intervals) if number_of_intervals > 0 else 0.
+
+    def add_interval(self, interval_s: float) -> None:
+        # Welford's algorithm, so that no intervals have to be stored
+        number_of_intervals = self.number_of_polls - 1
+        delta = interval_s - self.mean_interval_s
+        self.mean_interval_s += delta / number_of_intervals
+        self._interval_square_deviations += delta * (interval_s - self.mean_interval_s)
+
+
+class DeadlineScheduler:
+    """!
+    Schedules polls at a fixed rate against deadlines on a monotonic clock.
+    Unlike sleeping a fixed time after each poll, the rate does not drift with the duration of the polls.
+
+    Usage:
+        scheduler = DeadlineScheduler(1 / 20) # 20 Hz
+        while running:
+            await scheduler.wait_for_next_deadline()
+            await poll()
+    """
+    def __init__(
+        self,
+        interval_s: float,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> None:
+        if interval_s <= 0:
+            raise ValueError(f"The interval has to be positive, but is {interval_s}")
+        self._interval_s = interval_s
+        self._overrun_policy = overrun_policy
+        self._clock = clock
+        self._sleep = sleep
+        self.reset()
+
+    @property
+    def interval_s(self) -> float:
+        return self._interval_s
+
+    @property
+    def overrun_policy(self) -> OverrunPolicy:
+        return self._overrun_policy
+
+    @property
+    def statistics(self) -> PollingStatistics:
+        return self._statistics
+
+    @property
+    def next_deadline(self) -> float | None:
+        """! None, if the next call of wait_for_next_deadline returns immediately """
+        return self._next_deadline
+
+    def reset(self) -> None:
+        """! The next call of wait_for_next_deadline returns immediately and starts a new grid of deadlines """
+        self._next_deadline: float | None = None
+        self._last_poll_start: float | None = None
+        self._statistics = PollingStatistics(self._interval_s)
+
+    async def wait_for_next_deadline(self) -> float:
+        """!
+        Waits until the next deadline and returns it.
+        """
+        now = self._clock()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        elif now > self._next_deadline:
+            self._skip_passed_deadlines(now)
+
+        deadline = self._next_deadline
+        if now < deadline:
+            await self._sleep(deadline - now)
+            now = self._clock()
+
+        self._record_poll_start(now, deadline)
+        self._next_deadline = deadline + self._interval_s
+        return deadline
+
+    def _skip_passed_deadlines(self, now: float) -> None:
+        assert self._next_deadline is not None
+        behind_s = now - self._next_deadline
+        if self._overrun_policy is OverrunPolicy.SKIP:
+            skipped_deadlines = math.ceil(behind_s / self._interval_s)
+        else:
+            skipped_deadlines = math.floor(behind_s / self._interval_s)
+        self._next_deadline += skipped_deadlines * self._interval_s
+        self._statistics.missed_deadlines += skipped_deadlines
+
+    def _record_poll_start(self, now: float, deadline: float) -> None:
+        self._statistics.number_of_polls += 1
+        self._statistics.max_lateness_s = max(self._statistics.max_lateness_s, now - deadline)
+        if self._last_poll_start is not None:
+            self._statistics.add_interval(now - self._last_poll_start)
+        self._last_poll_start = now
@@ -0,0 +1,183 @@
+import contextlib
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, Iterator
+
+import attrs
+
+from sonic_protocol.schema import DeviceType, ProtocolType, Version
+from soniccontrol.communication.connection import Connection, SerialConnection
+from soniccontrol.device_data import FirmwareInfo
+
+
+# Increase this, if the layout of the profiles changes, so that old profiles are ignored
+DEVICE_PROFILE_FORMAT_VERSION = 1
+
+
+def get_port_of_connection(connection: Connection) -> str:
+    if isinstance(connection, SerialConnection):
+        return str(connection.url)
+    return connection.connection_name
+
+
+@attrs.define
+class DeviceProfile:
+    """!
+    Everything that was found out about a device on connecting, so that it does not need to be asked again on a reconnect.
+    """
+    port: str = attrs.field()
+    device_type: DeviceType = attrs.field(converter=DeviceType)
+    protocol_version: Version = attrs.field(converter=Version.to_version)
+    is_release: bool = attrs.field()
+    baudrate: int | None = attrs.field(default=None)
+    serial_number: str = attrs.field(default="unknown")
+    firmware_version: Version = attrs.field(default=Version(0, 0, 0), converter=Version.to_version)
+    hardware_version: Version = attrs.field(default=Version(0, 0, 0), converter=Version.to_version)
+    firmware_info: str = attrs.field(default="")
+    #! Time until the device sent its first message after the connection was opened. None if it did not send anything
+    boot_time_s: float | None = attrs.field(default=None)
+
+    @property
+    def protocol_type(self) -> ProtocolType:
+        return ProtocolType(self.protocol_version, self.device_type, self.is_release)
+
+    @staticmethod
+    def from_info(port: str, info: FirmwareInfo, baudrate: int | None = None, boot_time_s: float | None = None) -> "DeviceProfile":
+        return DeviceProfile(
+            port=port,
+            device_type=info.device_type,
+            protocol_version=info.protocol_version,
+            is_release=info.is_release,
+            baudrate=baudrate,
+            serial_number=info.serial_number,
+            firmware_version=info.firmware_version,
+            hardware_version=info.hardware_version,
+            firmware_info=info.firmware_info,
+            boot_time_s=boot_time_s,
+        )
+
+    def to_info(self) -> FirmwareInfo:
+        return FirmwareInfo(
+            serial_number=self.serial_number,
+            device_type=self.device_type,
+            hardware_version=self.hardware_version,
+            firmware_info=self.firmware_info,
+            firmware_version=self.firmware_version,
+            protocol_version=self.protocol_version,
+            is_release=self.is_release,
+        )
+
+    def matches(self, other: "DeviceProfile") -> bool:
+        """! Checks if both profiles describe the same device with the same firmware. The connection details are ignored """
+        serial_numbers_known = "unknown" not in (self.serial_number, other.serial_number)
+        return (
+            self.protocol_type == other.protocol_type
+            and self.firmware_version == other.firmware_version
+            and self.hardware_version == other.hardware_version
+            and (not serial_numbers_known or self.serial_number == other.serial_number)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "port": self.port,
+            "device_type": self.device_type.value,
+            "protocol_version": str(self.protocol_version),
+            "is_release": self.is_release,
+            "baudrate": self.baudrate,
+            "serial_number": self.serial_number,
+            "firmware_version": str(self.firmware_version),
+            "hardware_version": str(self.hardware_version),
+            "firmware_info": self.firmware_info,
+            "boot_time_s": self.boot_time_s,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "DeviceProfile":
+        return DeviceProfile(**data)
+
+
+class DeviceProfileCache:
+    """!
+    Persists a DeviceProfile per port in a json file.
+    A profile only states what the device on that port was the last time, so it has to be verified after using it.
+    """
+    FILE_NAME = "device_profiles.json"
+
+    def __init__(self, cache_dir: Path, logger: logging.Logger = logging.getLogger()) -> None:
+        self._cache_file = cache_dir / DeviceProfileCache.FILE_NAME
+        self._logger = logging.getLogger(logger.name + "." + DeviceProfileCache.__name__)
+        self._profiles: Dict[str, DeviceProfile] | None = None
+
+    def _load(self) -> Dict[str, DeviceProfile]:
+        if self._profiles is not None:
+            return self._profiles
+
+        self._profiles = {}
+        if not self._cache_file.exists():
+            return self._profiles
+        try:
+            data = json.loads(self._cache_file.read_text())
+            if data.get("format_version") != DEVICE_PROFILE_FORMAT_VERSION:
+                return self._profiles
+            self._profiles = {
+                port: DeviceProfile.from_dict(profile_data) for port, profile_data in data["profiles"].items()
+            }
+        except Exception as e:
+            self._logger.warning("Could not read the device profiles from %s, ignoring them: %s", self._cache_file, e)
+        return self._profiles
+
+    def _save(self) -> None:
+        profiles = self._load()
+        data = {
+            "format_version": DEVICE_PROFILE_FORMAT_VERSION,
+            "profiles": { port: profile.to_dict() for port, profile in profiles.items() },
+        }
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_file.write_text(json.dumps(data, indent=2))
+        except OSError as e:
+            self._logger.warning("Could not save the device profiles to %s: %s", self._cache_file, e)
+
+    def get(self, port: str) -> DeviceProfile | None:
+        return self._load().get(port)
+
+    def put(self, profile: DeviceProfile) -> None:
+        profiles = self._load()
+        if profiles.get(profile.port) == profile:
+            return
+        profiles[profile.port] = profile
+        self._save()
+
+    def invalidate(self, port: str) -> None:
+        profiles = self._load()
+        if port in profiles:
+            del profiles[port]
+            self._save()
+
+
+@attrs.define
+class ConnectTimings:
+    """!
+    Measures how long the phases of connecting to a device take.
+    """
+    phases_s: Dict[str, float] = attrs.field(factory=dict)
+    used_profile: bool = attrs.field(default=False)
+    clock: Callable[[], float] = attrs.field(default=time.perf_counter, repr=False)
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.phases_s[phase] = self.phases_s.get(phase, 0.) + self.clock() - start
+
+    @property
+    def total_s(self) -> float:
+        return sum(self.phases_s.values())
+
+    def __str__(self) -> str:
+        phases = ", ".join(f"{phase}: {duration * 1000:.1f} ms" for phase, duration in self.phases_s.items())
+        return f"{self.total_s * 1000:.1f} ms ({phases})"
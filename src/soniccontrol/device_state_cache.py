@@ -0,0 +1,137 @@
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Tuple
+
+import attrs
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.field_names import IEFieldName
+from sonic_protocol.python_parser.answer import Answer
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import ICommandCode
+
+
+# The codes of setters are the codes of their getters plus this offset
+SETTER_CODE_OFFSET = 1000
+
+# Getters that only return state, that gets changed by their setters or shows up in ?update.
+# GET_DATETIME is missing on purpose, because the time changes on its own
+CACHEABLE_GETTER_CODES: FrozenSet[ICommandCode] = frozenset({
+    CommandCode.GET_INFO,
+    CommandCode.GET_SWF,
+    CommandCode.GET_FREQ,
+    CommandCode.GET_GAIN,
+    CommandCode.GET_TRANSDUCER_ID,
+    CommandCode.GET_ATF, CommandCode.GET_ATF2, CommandCode.GET_ATF3, CommandCode.GET_ATF4,
+    CommandCode.GET_ATK, CommandCode.GET_ATK2, CommandCode.GET_ATK3, CommandCode.GET_ATK4,
+    CommandCode.GET_ATT, CommandCode.GET_ATT2, CommandCode.GET_ATT3, CommandCode.GET_ATT4,
+    CommandCode.GET_WAVEFORM,
+    CommandCode.GET_LOG_LEVEL,
+})
+
+# Commands after which nothing cached can be trusted anymore
+CACHE_CLEARING_CODES: FrozenSet[ICommandCode] = frozenset({
+    CommandCode.SET_DEFAULT,
+    CommandCode.RESTART_DEVICE,
+})
+
+_CacheKey = Tuple[ICommandCode, Tuple[Tuple[str, Any], ...]]
+
+
+@attrs.define
+class CachePolicy:
+    """!
+    Defines how long answers stay fresh. The time to live of an answer is the smallest time to live of its fields.
+    """
+    default_ttl_s: float = attrs.field(default=1.)
+    field_ttls_s: Dict[IEFieldName, float] = attrs.field(factory=dict)
+
+    def get_ttl(self, field_names: Iterable[IEFieldName]) -> float:
+        return min((self.field_ttls_s.get(field_name, self.default_ttl_s) for field_name in field_names), default=self.default_ttl_s)
+
+
+@attrs.define
+class _CacheEntry:
+    answer: Answer = attrs.field()
+    expires_at: float = attrs.field()
+
+
+class DeviceStateCache:
+    """!
+    A read-through cache for the answers of idempotent getters.
+    Answers are invalidated, when their time to live expires, when the matching setter (getter code + 1000) gets executed
+    or when a ?update answer contains a field with another value than the cached answer.
+    Commands that are not known to leave the cached state untouched, clear the whole cache.
+    """
+    def __init__(self, policy: CachePolicy = CachePolicy(), clock: Callable[[], float] = time.monotonic) -> None:
+        self._policy = policy
+        self._clock = clock
+        self._entries: Dict[_CacheKey, _CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def policy(self) -> CachePolicy:
+        return self._policy
+
+    @staticmethod
+    def _get_key(command: Command) -> _CacheKey:
+        return (command.code, tuple(sorted(command.args.items())))
+
+    def is_cacheable(self, command: Command) -> bool:
+        return command.code in CACHEABLE_GETTER_CODES
+
+    def get(self, command: Command) -> Answer | None:
+        """! Returns the cached answer, if it is still fresh """
+        key = DeviceStateCache._get_key(command)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.answer
+
+    def on_answer(self, command: Command | None, answer: Answer) -> None:
+        """!
+        Updates the cache with the answer of an executed command.
+        @param command None, if the command is not known, for example for raw strings that could not be deserialized
+        """
+        if command is None or command.code in CACHE_CLEARING_CODES:
+            self.clear()
+            return
+
+        code = command.code
+        if code in CACHEABLE_GETTER_CODES:
+            if answer.valid:
+                ttl = self._policy.get_ttl(answer.field_value_dict.keys())
+                self._entries[DeviceStateCache._get_key(command)] = _CacheEntry(answer, self._clock() + ttl)
+        elif code == CommandCode.GET_UPDATE:
+            if answer.valid:
+                self._invalidate_changed_fields(answer.field_value_dict)
+        elif code.value >= SETTER_CODE_OFFSET:
+            # also for invalid answers, because the device could have changed its state nevertheless
+            self._invalidate_getter_of_setter(code)
+        elif code.value < 0:
+            # the legacy commands start procedures and set their parameters, so we do not know, which state they change
+            self.clear()
+        # all other codes are getters, that do not change the state of the device
+
+    def _invalidate_getter_of_setter(self, setter_code: ICommandCode) -> None:
+        getter_code_value = setter_code.value - SETTER_CODE_OFFSET
+        if not any(getter_code.value == getter_code_value for getter_code in CACHEABLE_GETTER_CODES):
+            # we do not know, which state the setter changes
+            self.clear()
+            return
+        for key in [key for key in self._entries if key[0].value == getter_code_value]:
+            del self._entries[key]
+
+    def _invalidate_changed_fields(self, status: Dict[IEFieldName, Any]) -> None:
+        for key, entry in list(self._entries.items()):
+            cached_fields = entry.answer.field_value_dict
+            if any(field_name in status and status[field_name] != value for field_name, value in cached_fields.items()):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
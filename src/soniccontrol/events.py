@@ -9,7 +9,7 @@ class Event:
     _data: dict[str, Any] = attrs.field()
 
     def __init__(self, event_type: str, **kwargs) -> None:
-        self.__attrs_init__(event_type, dict(**kwargs)) #type: ignore
+        self.__attrs_init__(event_type, kwargs) #type: ignore
 
     @property
     def type_(self) -> str:
@@ -29,7 +29,7 @@ class PropertyChangeEvent(Event):
     PROPERTY_CHANGE_EVENT: Literal["<<PropertyChange>>"] = "<<PropertyChange>>"
 
     def __init__(self, property_name: str, old_value: Any, new_value: Any, sender: Any = None, **kwargs) -> None:
-        self.__attrs_init__(PropertyChangeEvent.PROPERTY_CHANGE_EVENT, dict(**kwargs), property_name, old_value, new_value, sender) #type: ignore
+        self.__attrs_init__(PropertyChangeEvent.PROPERTY_CHANGE_EVENT, kwargs, property_name, old_value, new_value, sender) #type: ignore
 
     @property
     def property_name(self) -> str:
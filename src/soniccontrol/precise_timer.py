@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable
+
+import attrs
+
+
+#! Busy waiting keeps a core busy, so it is off by default and only used by the procedures, that need precise timing
+DEFAULT_BUSY_WAIT_S = 0.
+#! asyncio.sleep can overshoot by up to the resolution of the system timer, which is about 15.6 ms on Windows
+PRECISE_BUSY_WAIT_S = 0.02 if sys.platform == "win32" else 0.002
+
+
+@attrs.define
+class DriftStatistics:
+    """!
+    How late the deadlines were met. Because the deadlines are absolute, lateness does not add up over the waits.
+    """
+    number_of_waits: int = attrs.field(default=0)
+    #! Waits, that were already too late, before the timer started to wait
+    missed_deadlines: int = attrs.field(default=0)
+    last_lateness_s: float = attrs.field(default=0.)
+    max_lateness_s: float = attrs.field(default=0.)
+    _total_lateness_s: float = attrs.field(default=0., init=False, repr=False)
+
+    @property
+    def mean_lateness_s(self) -> float:
+        return self._total_lateness_s / self.number_of_waits if self.number_of_waits > 0 else 0.
+
+    def add_wait(self, lateness_s: float, missed: bool) -> None:
+        self.number_of_waits += 1
+        self.missed_deadlines += int(missed)
+        self.last_lateness_s = lateness_s
+        self.max_lateness_s = max(self.max_lateness_s, lateness_s)
+        self._total_lateness_s += lateness_s
+
+
+class PreciseTimer:
+    """!
+    Sleeps to absolute deadlines on a monotonic clock. Shared by the procedures, that hold times locally.
+    The last busy_wait_s before a deadline are not slept, but spent yielding to the event loop until the deadline passed,
+    so that the overshoot of asyncio.sleep does not delay the deadline. With a busy_wait_s of 0 it only sleeps.
+
+    Usage:
+        timer = PreciseTimer()
+        timer.start()
+        for frequency in frequencies:
+            await device.execute_command(commands.SetFrequency(frequency))
+            await timer.hold(t_on_s) # the time of the command is part of t_on_s
+    """
+    def __init__(
+        self,
+        busy_wait_s: float = DEFAULT_BUSY_WAIT_S,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> None:
+        if busy_wait_s < 0:
+            raise ValueError(f"The busy wait time cannot be negative, but is {busy_wait_s}")
+        self._busy_wait_s = busy_wait_s
+        self._clock = clock
+        self._sleep = sleep
+        self._deadline: float | None = None
+        self._statistics = DriftStatistics()
+
+    @property
+    def statistics(self) -> DriftStatistics:
+        return self._statistics
+
+    @property
+    def deadline(self) -> float | None:
+        """! The deadline of the last hold. None, if the timer is not started """
+        return self._deadline
+
+    def start(self) -> None:
+        """! Starts a new chain of deadlines from now and resets the statistics """
+        self._deadline = self._clock()
+        self._statistics = DriftStatistics()
+
+    async def hold(self, duration_s: float) -> float:
+        """!
+        Waits until duration_s after the previous deadline. Starts the timer, if it was not started yet.
+        If the hold is more than duration_s late, the chain is re-anchored to now,
+        so that the following holds are not shortened to catch up with the passed deadlines.
+        @return The lateness in seconds
+        """
+        if self._deadline is None:
+            self.start()
+        assert self._deadline is not None
+        self._deadline += duration_s
+        lateness_s = await self.sleep_until(self._deadline)
+        if lateness_s > duration_s:
+            self._deadline = self._clock()
+        return lateness_s
+
+    async def sleep_for(self, duration_s: float) -> float:
+        """! Waits duration_s from now, without a chain of deadlines. Returns the lateness in seconds """
+        return await self.sleep_until(self._clock() + duration_s)
+
+    async def sleep_until(self, deadline: float) -> float:
+        """! Returns the lateness in seconds """
+        now = self._clock()
+        missed = now > deadline
+        if not missed:
+            sleep_s = deadline - now - self._busy_wait_s
+            if sleep_s > 0:
+                await self._sleep(sleep_s)
+                now = self._clock()
+            while self._busy_wait_s > 0 and now < deadline:
+                await self._sleep(0)
+                now = self._clock()
+        lateness_s = now - deadline
+        self._statistics.add_wait(lateness_s, missed)
+        return lateness_s
@@ -1,11 +1,13 @@
 
-import asyncio
 from typing import Any, Literal, Tuple, Union, cast
 
 import attrs
 from attrs import validators
 import re
 
+from soniccontrol.precise_timer import PreciseTimer
+from soniccontrol.tracing import trace_span
+
 TimeUnit = Literal["ms", "s"]
 
 @attrs.define(auto_attribs=True)
@@ -73,5 +75,14 @@ class Holder:
     @staticmethod 
     async def execute(
         args: HolderArgs,
+        timer: PreciseTimer | None = None,
     ) -> None:
-        await asyncio.sleep(args.duration_in_ms / 1000)
\ No newline at end of file
+        """!
+        @param timer If given, the hold ends at the previous deadline of the timer plus the duration,
+            so that the time of the commands sent since then is part of the hold. Otherwise the hold starts now
+        """
+        with trace_span("hold", "procedure", planned_ms=args.duration_in_ms):
+            if timer is None:
+                await PreciseTimer().sleep_for(args.duration_in_ms / 1000)
+            else:
+                await timer.hold(args.duration_in_ms / 1000)
\ No newline at end of file
@@ -20,6 +20,7 @@ def custom_validator_factory(data_type, min, max):
 
 class ProcedureType(Enum):
     SPECTRUM_MEASURE = "Spectrum Measure"
+    RESONANCE_SWEEP = "Resonance Sweep"
     RAMP = "Ramp"
     SCAN = "Scan"
     TUNE = "Tune"
@@ -10,6 +10,7 @@ from soniccontrol.procedures.procedure_instantiator import ProcedureInstantiator
 from soniccontrol.procedures.remote_procedure_state import RemoteProcedureState
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol.logging_utils import get_base_logger
+from soniccontrol.tracing import trace_span
 from soniccontrol.events import Event, EventManager
 
 class ProcedureController(EventManager):
@@ -73,7 +74,8 @@ class ProcedureController(EventManager):
                     await self._device.execute_command(cmds.SetOff(), raise_exception=False)
 
             try:
-                await procedure.execute(self._device, args)
+                with trace_span("procedure", "procedure", proc_type=proc_type.name):
+                    await procedure.execute(self._device, args)
                 if procedure.is_remote:
                     await self._remote_procedure_state.wait_till_procedure_halted()          
             except Exception as e:
@@ -121,6 +123,9 @@ class ProcedureController(EventManager):
         self.emit(Event(ProcedureController.PROCEDURE_STOPPED))
 
     def _on_update(self, event: Event) -> None:
+        changed_fields = event.data.get("changed_fields")
+        if changed_fields is not None and EFieldName.PROCEDURE not in changed_fields:
+            return
         try:
             procedure: protocol_defs.Procedure = event.data["status"][EFieldName.PROCEDURE]
         except KeyError:
@@ -5,10 +5,12 @@ from attrs import validators
 
 from sonic_protocol.field_names import EFieldName
 from sonic_protocol.schema import SIPrefix
+from soniccontrol.precise_timer import PRECISE_BUSY_WAIT_S, DriftStatistics, PreciseTimer
 from soniccontrol.procedures.holder import Holder, HolderArgs, convert_to_holder_args
 from soniccontrol.procedures.procedure import Procedure, ProcedureArgs, custom_validator_factory
 from sonic_protocol.python_parser import commands
 from soniccontrol.sonic_device import CommandExecutionError, CommandValidationError, SonicDevice
+from soniccontrol.tracing import trace_span
 from sonic_protocol.si_unit import AbsoluteFrequencySIVar, RelativeFrequencySIVar
 
 
@@ -59,8 +61,14 @@ class Ramper(Procedure):
 
 
 class RamperLocal(Ramper):
-    def __init__(self) -> None:
+    def __init__(self, timer: PreciseTimer | None = None) -> None:
         super().__init__()
+        self._timer = timer if timer is not None else PreciseTimer(PRECISE_BUSY_WAIT_S)
+
+    @property
+    def timing_statistics(self) -> DriftStatistics:
+        """! How late the holds of the last ramp ended """
+        return self._timer.statistics
 
     async def execute(
         self,
@@ -91,17 +99,20 @@ class RamperLocal(Ramper):
     ) -> None:
         i: int = 0
         await device.set_signal_on()
+        # The holds are chained to absolute deadlines, so that the time of the commands does not add up over the steps
+        self._timer.start()
         while i < len(values):
             value = values[i]
 
-            await device.execute_command(commands.SetFrequency(int(value))) 
-            if hold_off.duration:
-                await device.set_signal_on()
-            await Holder.execute(hold_on)
+            with trace_span("ramp_step", "procedure", index=i, frequency=value):
+                await device.execute_command(commands.SetFrequency(int(value))) 
+                if hold_off.duration:
+                    await device.set_signal_on()
+                await Holder.execute(hold_on, self._timer)
 
-            if hold_off.duration:
-                await device.set_signal_off()
-                await Holder.execute(hold_off)
+                if hold_off.duration:
+                    await device.set_signal_off()
+                    await Holder.execute(hold_off, self._timer)
 
             i += 1
 
@@ -0,0 +1,153 @@
+import math
+from typing import Type
+
+import attrs
+from attrs import validators
+import numpy as np
+
+from sonic_protocol.python_parser import commands
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import ABSOLUTE_FREQUENCY_META, convert_array_to_prefix
+from soniccontrol.procedures.procs.spectrum_measure import SpectrumMeasure, SpectrumMeasureArgs
+from soniccontrol.sonic_device import SonicDevice
+
+
+@attrs.define(auto_attribs=True)
+class ResonanceSweepArgs(SpectrumMeasureArgs):
+    @classmethod
+    def get_description(cls) -> str:
+        return """Resonance Sweep finds the resonances of the connected add-on in a fraction of the time of a full Spectrum Measure.
+It measures the whole range with a coarse step first and then measures only around the strongest resonances with smaller steps,
+down to f_step. The number of measured points never exceeds point_budget.
+"""
+
+    point_budget: int = attrs.field(default=200, validator=[validators.instance_of(int), validators.ge(10)])
+    #! Part of the point budget, that is used for the coarse sweep
+    coarse_fraction: float = attrs.field(default=0.5, validator=[validators.gt(0), validators.lt(1)])
+    max_peaks: int = attrs.field(default=3, validator=[validators.instance_of(int), validators.ge(1)])
+
+
+def find_resonance_candidates(spectrum: np.ndarray, max_peaks: int) -> np.ndarray:
+    """!
+    Finds the local maxima of the resonance score in a spectrum and returns their commanded frequencies, the strongest first.
+    The score is the sum of the normalized admittance IRMS / URMS and the normalized slope of the phase,
+    because at a resonance the current peaks and the phase changes fastest.
+    """
+    measured = np.sort(spectrum[spectrum["measured"]], order="commanded_frequency")
+    if len(measured) == 0:
+        return np.array([], dtype=np.int64)
+    score = resonance_score(measured)
+    padded = np.concatenate(([-np.inf], score, [-np.inf]))
+    is_peak = (score >= padded[:-2]) & (score > padded[2:])
+    peak_indices = np.flatnonzero(is_peak)
+    strongest_first = peak_indices[np.argsort(-score[peak_indices], kind="stable")]
+    return measured["commanded_frequency"][strongest_first[:max_peaks]].astype(np.int64)
+
+
+def resonance_score(spectrum: np.ndarray) -> np.ndarray:
+    """! @param spectrum Measured rows sorted by the commanded frequency """
+    def normalize(values: np.ndarray) -> np.ndarray:
+        value_range = np.ptp(values)
+        return (values - values.min()) / value_range if value_range > 0 else np.zeros_like(values)
+
+    frequencies = spectrum["commanded_frequency"].astype(np.float64)
+    admittance = spectrum["irms"].astype(np.float64) / np.maximum(spectrum["urms"].astype(np.float64), 1.)
+    if len(spectrum) < 2:
+        return normalize(admittance)
+    phase_slope = np.abs(np.gradient(spectrum["phase"].astype(np.float64), frequencies))
+    return normalize(admittance) + normalize(phase_slope)
+
+
+class ResonanceSweep(SpectrumMeasure):
+    """!
+    Coarse to fine spectrum measurement. The coarse and the refinement sweep are returned as one spectrum,
+    in the order they were measured.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_resonance_frequency: int | None = None
+
+    @classmethod
+    def get_args_class(cls) -> Type:
+        return ResonanceSweepArgs
+
+    @property
+    def last_resonance_frequency(self) -> int | None:
+        """! The commanded frequency with the highest resonance score of the last sweep """
+        return self._last_resonance_frequency
+
+    @staticmethod
+    def create_coarse_plan(args: ResonanceSweepArgs) -> np.ndarray:
+        """!
+        Returns the frequencies of the coarse sweep. The coarse step is a multiple of f_step.
+        If the full sweep fits into the point budget, it is the full sweep.
+        """
+        full_plan = SpectrumMeasure.create_sweep_plan(args)
+        if len(full_plan) <= args.point_budget:
+            return full_plan
+        coarse_points = max(int(args.point_budget * args.coarse_fraction), 3)
+        step_factor = math.ceil(len(full_plan) / coarse_points)
+        return full_plan[::step_factor]
+
+    @staticmethod
+    def create_refinement_plan(args: ResonanceSweepArgs, coarse_frequencies: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """!
+        Returns the frequencies, that are not measured yet, in a window of one coarse step around each candidate.
+        The step is the smallest multiple of f_step, so that the windows fit into the rest of the point budget.
+        The points nearest to the candidates are kept, if they still do not fit.
+        """
+        points_left = args.point_budget - len(coarse_frequencies)
+        if len(candidates) == 0 or len(coarse_frequencies) < 2 or points_left <= 0:
+            return np.array([], dtype=np.int64)
+
+        f_start = args.f_start.to_prefix(SIPrefix.NONE)
+        f_stop = args.f_stop.to_prefix(SIPrefix.NONE)
+        f_step = args.f_step.to_prefix(SIPrefix.NONE)
+        coarse_step = int(coarse_frequencies[1] - coarse_frequencies[0])
+        points_per_peak = max(points_left // len(candidates), 1)
+        fine_step = f_step * max(math.ceil(2 * coarse_step / f_step / (points_per_peak + 1)), 1)
+        half_window = coarse_step // fine_step
+
+        offsets = np.arange(-half_window, half_window + 1) * fine_step
+        frequencies = (candidates[:, np.newaxis] + offsets[np.newaxis, :]).ravel()
+        frequencies = frequencies[(frequencies >= f_start) & (frequencies < f_stop)]
+        frequencies = np.setdiff1d(frequencies, coarse_frequencies)
+        if len(frequencies) > points_left:
+            distances = np.min(np.abs(frequencies[:, np.newaxis] - candidates[np.newaxis, :]), axis=1)
+            frequencies = np.sort(frequencies[np.argsort(distances, kind="stable")[:points_left]])
+        return convert_array_to_prefix(frequencies, SIPrefix.NONE, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META)
+
+    @staticmethod
+    def merge_spectra(coarse: np.ndarray, fine: np.ndarray) -> np.ndarray:
+        spectrum = np.concatenate((coarse, fine))
+        spectrum["step_index"] = np.arange(len(spectrum))
+        return spectrum
+
+    async def measure_spectrum(self, device: SonicDevice, args: SpectrumMeasureArgs) -> np.ndarray:
+        assert isinstance(args, ResonanceSweepArgs)
+        self._last_resonance_frequency = None
+        try:
+            await device.execute_command(commands.SetGain(args.gain.to_prefix(SIPrefix.NONE)))
+            coarse_frequencies = ResonanceSweep.create_coarse_plan(args)
+            coarse = await self._sweep(device, args, coarse_frequencies)
+
+            candidates = find_resonance_candidates(coarse, args.max_peaks)
+            fine_frequencies = ResonanceSweep.create_refinement_plan(args, coarse_frequencies, candidates)
+            self._logger.info("Refine %d points around the candidates %s", len(fine_frequencies), candidates.tolist())
+            spectrum = coarse
+            if len(fine_frequencies) > 0:
+                try:
+                    await self._sweep(device, args, fine_frequencies)
+                finally:
+                    # Keep the coarse sweep in the result, even if the refinement got cancelled
+                    assert self._last_spectrum is not None
+                    spectrum = ResonanceSweep.merge_spectra(coarse, self._last_spectrum)
+                    self._last_spectrum = spectrum
+        finally:
+            await device.set_signal_off()
+
+        measured = np.sort(spectrum[spectrum["measured"]], order="commanded_frequency")
+        if len(measured) > 0:
+            self._last_resonance_frequency = int(measured["commanded_frequency"][np.argmax(resonance_score(measured))])
+            self._logger.info("Resonance found at %d Hz", self._last_resonance_frequency)
+        return spectrum
@@ -1,16 +1,20 @@
 
-import asyncio
-from typing import Any, List, Type, Union
+import datetime
+import logging
+from typing import Any, Dict, Type
 import attrs
 from attrs import validators
+import numpy as np
 
+from sonic_protocol.field_names import EFieldName
 from sonic_protocol.python_parser import commands
 from sonic_protocol.schema import SIPrefix
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol.updater import Updater
-from soniccontrol.procedures.holder import Holder, HolderArgs, convert_to_holder_args
+from soniccontrol.procedures.holder import HolderArgs, convert_to_holder_args
+from soniccontrol.procedures.sweep_engine import SweepEngine, SweepPlan, SweepReport
 from soniccontrol.procedures.procedure import Procedure, custom_validator_factory
-from sonic_protocol.si_unit import AbsoluteFrequencySIVar, GainSIVar, RelativeFrequencySIVar
+from sonic_protocol.si_unit import ABSOLUTE_FREQUENCY_META, AbsoluteFrequencySIVar, GainSIVar, RelativeFrequencySIVar, convert_array_to_prefix
 
 
 @attrs.define(auto_attribs=True)
@@ -46,9 +50,38 @@ This is very useful in an explorative study to find the optimal driving frequenc
     )
 
 
+SPECTRUM_MEASURED_FIELDS = [EFieldName.FREQUENCY, EFieldName.GAIN, EFieldName.URMS, EFieldName.IRMS, EFieldName.PHASE, EFieldName.TEMPERATURE]
+#! One row per sweep step. The measured fields use the same types as the data table of the experiment files
+SPECTRUM_RESULT_DTYPE = np.dtype([
+    ("step_index", np.int32),
+    ("commanded_frequency", np.uint32),
+    #! False, if the step was not reached or its measurement failed
+    ("measured", np.bool_),
+    #! POSIX timestamp in seconds
+    ("timestamp", np.float64),
+    ("frequency", np.uint32),
+    ("gain", np.uint8),
+    ("urms", np.uint32),
+    ("irms", np.uint32),
+    ("phase", np.uint32),
+    ("temperature", np.uint32),
+])
+
+
+def create_spectrum_result(frequencies: np.ndarray) -> np.ndarray:
+    result = np.zeros(len(frequencies), dtype=SPECTRUM_RESULT_DTYPE)
+    result["step_index"] = np.arange(len(frequencies))
+    result["commanded_frequency"] = frequencies
+    return result
+
+
 class SpectrumMeasure(Procedure):
-    def __init__(self, updater: Updater) -> None:
+    def __init__(self, updater: Updater, sweep_engine: SweepEngine | None = None, logger: logging.Logger = logging.getLogger()) -> None:
         self._updater = updater        
+        self._sweep_engine = sweep_engine if sweep_engine is not None else SweepEngine()
+        self._last_sweep_report: SweepReport | None = None
+        self._last_spectrum: np.ndarray | None = None
+        self._logger = logging.getLogger(logger.name + "." + SpectrumMeasure.__name__)
 
     @classmethod
     def get_args_class(cls) -> Type: 
@@ -58,41 +91,82 @@ class SpectrumMeasure(Procedure):
     def is_remote(self) -> bool:
         return False
 
+    @staticmethod
+    def create_sweep_plan(args: SpectrumMeasureArgs) -> np.ndarray:
+        """!
+        Returns the frequencies in Hz, that are measured, from f_start up to (excluding) f_stop.
+        The whole plan is validated against the allowed frequency range, before anything is sent to the device.
+        """
+        f_start = args.f_start.to_prefix(SIPrefix.NONE)
+        f_stop = args.f_stop.to_prefix(SIPrefix.NONE)
+        f_step = args.f_step.to_prefix(SIPrefix.NONE)
+        num_steps = max(int((f_stop - f_start) / f_step), 0)
+        return convert_array_to_prefix(
+            f_start + np.arange(num_steps) * f_step, SIPrefix.NONE, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META
+        )
+
+    @staticmethod
+    def create_timed_sweep_plan(args: SpectrumMeasureArgs, frequencies: np.ndarray | None = None) -> SweepPlan:
+        """! @param frequencies The frequencies to measure with the timing of args. Defaults to the sweep plan of args """
+        return SweepPlan.create(
+            SpectrumMeasure.create_sweep_plan(args) if frequencies is None else frequencies,
+            t_on_s=args.t_on.duration_in_ms / 1000,
+            t_off_s=args.t_off.duration_in_ms / 1000,
+            measure_offset_s=args.time_offset_measure.duration_in_ms / 1000,
+        )
+
+    @property
+    def last_sweep_report(self) -> SweepReport | None:
+        """! How accurate the timing of the last sweep was """
+        return self._last_sweep_report
+
+    @property
+    def last_spectrum(self) -> np.ndarray | None:
+        """! The result array of the last sweep with the dtype SPECTRUM_RESULT_DTYPE. Is also set, if the sweep got cancelled """
+        return self._last_spectrum
+
+    @staticmethod
+    def store_measurement(spectrum: np.ndarray, index: int, status: Dict[Any, Any] | None) -> None:
+        if status is None:
+            return
+        row = spectrum[index]
+        for field_name in SPECTRUM_MEASURED_FIELDS:
+            if field_name in status:
+                row[field_name.name.lower()] = status[field_name]
+        row["timestamp"] = datetime.datetime.now().timestamp()
+        row["measured"] = True
+
     async def execute(
         self,
         device: SonicDevice,
         args: SpectrumMeasureArgs
     ) -> None:
-        values = [args.f_start.to_prefix(SIPrefix.NONE) + i * args.f_step.to_prefix(SIPrefix.NONE) for i in range(int((args.f_stop.to_prefix(SIPrefix.NONE) - args.f_start.to_prefix(SIPrefix.NONE)) / args.f_step.to_prefix(SIPrefix.NONE))) ]
+        await self.measure_spectrum(device, args)
 
+    async def measure_spectrum(self, device: SonicDevice, args: SpectrumMeasureArgs) -> np.ndarray:
+        """! Measures exactly one sample per step into a preallocated array and returns it """
         try:
             # await device.get_overview() # FIXME I dont think we need this
             # I am removing it for now because we can't send commands to the crystal device that have no command code
             await device.execute_command(commands.SetGain(args.gain.to_prefix(SIPrefix.NONE)))
-            await self._ramp(device, list(values), args.t_on, args.t_off, args.time_offset_measure)
+            return await self._sweep(device, args, SpectrumMeasure.create_sweep_plan(args))
         finally:
             await device.set_signal_off()
 
-    async def _ramp(
-        self,
-        device: SonicDevice,
-        values: List[Union[int, float]],
-        hold_on: HolderArgs,
-        hold_off: HolderArgs,
-        time_offset_measure: HolderArgs
-    ) -> None:
-        for i, value in enumerate(values):
-            await device.execute_command(commands.SetFrequency(int(value)))
-            if hold_off.duration or i == 0:
-                await device.set_signal_on()
-
-            await Holder.execute(time_offset_measure)
-            asyncio.get_running_loop().create_task(self._updater.update())
-            await Holder.execute(hold_on - time_offset_measure)
-
-            if hold_off.duration:
-                await device.set_signal_off()
-                await Holder.execute(hold_off)
+    async def _sweep(self, device: SonicDevice, args: SpectrumMeasureArgs, frequencies: np.ndarray) -> np.ndarray:
+        plan = SpectrumMeasure.create_timed_sweep_plan(args, frequencies)
+        spectrum = create_spectrum_result(plan.frequencies)
+        self._last_spectrum = spectrum
+        self._last_sweep_report = SweepReport.for_plan(plan)
+
+        async def measure_step(index: int, _frequency: int) -> None:
+            SpectrumMeasure.store_measurement(spectrum, index, await self._updater.update())
+
+        try:
+            await self._sweep_engine.run(device, plan, measure_step, self._last_sweep_report)
+        finally:
+            self._logger.info("Sweep over %d frequencies %s", len(plan), self._last_sweep_report)
+        return spectrum
 
     async def fetch_args(self, device: SonicDevice) -> dict[str, Any]:
         return {}
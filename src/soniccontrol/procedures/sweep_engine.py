@@ -0,0 +1,159 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import attrs
+import numpy as np
+
+from sonic_protocol.python_parser import commands
+from soniccontrol.precise_timer import PRECISE_BUSY_WAIT_S, DriftStatistics, PreciseTimer
+from soniccontrol.sonic_device import SonicDevice
+from soniccontrol.tracing import trace_span
+
+
+@attrs.define
+class SweepPlan:
+    """!
+    All frequencies and times of a sweep, computed before the sweep starts.
+    The times are offsets in seconds from the start of the sweep.
+    """
+    frequencies: np.ndarray = attrs.field()
+    step_offsets_s: np.ndarray = attrs.field()
+    measure_offsets_s: np.ndarray = attrs.field()
+    #! None, if the signal stays on between the steps
+    signal_off_offsets_s: np.ndarray | None = attrs.field()
+    nominal_duration_s: float = attrs.field()
+
+    @staticmethod
+    def create(frequencies: np.ndarray, t_on_s: float, t_off_s: float, measure_offset_s: float) -> "SweepPlan":
+        """!
+        @param measure_offset_s Time after the start of a step, when the measurement is taken. Is clipped to t_on_s
+        """
+        step_duration_s = t_on_s + t_off_s
+        step_offsets_s = np.arange(len(frequencies)) * step_duration_s
+        return SweepPlan(
+            frequencies=np.asarray(frequencies, dtype=np.int64),
+            step_offsets_s=step_offsets_s,
+            measure_offsets_s=step_offsets_s + min(measure_offset_s, t_on_s),
+            signal_off_offsets_s=step_offsets_s + t_on_s if t_off_s > 0 else None,
+            nominal_duration_s=len(frequencies) * step_duration_s,
+        )
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+
+@attrs.define
+class SweepReport:
+    """!
+    The planned and actual times of the steps and measurements, as offsets from the start of the sweep.
+    Actual times of steps that were not reached, because the sweep got cancelled, are NaN.
+    """
+    planned_step_s: np.ndarray = attrs.field()
+    actual_step_s: np.ndarray = attrs.field()
+    planned_measure_s: np.ndarray = attrs.field()
+    actual_measure_s: np.ndarray = attrs.field()
+    nominal_duration_s: float = attrs.field()
+    duration_s: float = attrs.field(default=float("nan"))
+
+    @staticmethod
+    def for_plan(plan: SweepPlan) -> "SweepReport":
+        return SweepReport(
+            planned_step_s=plan.step_offsets_s,
+            actual_step_s=np.full(len(plan), np.nan),
+            planned_measure_s=plan.measure_offsets_s,
+            actual_measure_s=np.full(len(plan), np.nan),
+            nominal_duration_s=plan.nominal_duration_s,
+        )
+
+    @property
+    def step_errors_s(self) -> np.ndarray:
+        return self.actual_step_s - self.planned_step_s
+
+    @property
+    def measure_errors_s(self) -> np.ndarray:
+        return self.actual_measure_s - self.planned_measure_s
+
+    @property
+    def max_measure_error_s(self) -> float:
+        errors = self.measure_errors_s
+        return float(np.nanmax(np.abs(errors))) if np.any(~np.isnan(errors)) else 0.
+
+    @property
+    def mean_measure_error_s(self) -> float:
+        errors = self.measure_errors_s
+        return float(np.nanmean(np.abs(errors))) if np.any(~np.isnan(errors)) else 0.
+
+    def __str__(self) -> str:
+        return (
+            f"took {self.duration_s:.3f} s of nominal {self.nominal_duration_s:.3f} s, "
+            f"measurement timing error mean {self.mean_measure_error_s * 1000:.2f} ms, max {self.max_measure_error_s * 1000:.2f} ms"
+        )
+
+
+class SweepEngine:
+    """!
+    Executes a SweepPlan against absolute deadlines on a monotonic clock.
+    Unlike sleeping for the hold times, the time the commands take does not add up over the steps.
+    If a step starts late, its hold time is shortened, so that the sweep finishes in its nominal time.
+    """
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        busy_wait_s: float = PRECISE_BUSY_WAIT_S
+    ) -> None:
+        self._clock = clock
+        self._timer = PreciseTimer(busy_wait_s, clock, sleep)
+
+    @property
+    def timing_statistics(self) -> DriftStatistics:
+        """! How late the deadlines of the last sweep were met """
+        return self._timer.statistics
+
+    async def _sleep_until(self, deadline: float) -> float:
+        await self._timer.sleep_until(deadline)
+        return self._clock()
+
+    async def run(
+        self, device: SonicDevice, plan: SweepPlan, measure: Callable[[int, int], Awaitable[None]], report: SweepReport | None = None
+    ) -> SweepReport:
+        """!
+        @param measure Is called with the step index and the commanded frequency exactly once per step.
+            It is started as a task at the measurement time, so that it does not delay the next step.
+            All measurements are awaited, before the sweep returns
+        @param report Is filled while the sweep runs, so that it is also available, if the sweep gets cancelled
+        """
+        report = SweepReport.for_plan(plan) if report is None else report
+        measurements: List[asyncio.Task] = []
+        frequencies = plan.frequencies.tolist()
+        self._timer.start()
+        start = self._clock()
+        try:
+            for i, frequency in enumerate(frequencies):
+                with trace_span("sweep_step", "procedure", index=i, frequency=frequency):
+                    now = await self._sleep_until(start + plan.step_offsets_s[i])
+                    report.actual_step_s[i] = now - start
+
+                    # The signal must only be switched on, if the frequency got set
+                    await device.execute_command(commands.SetFrequency(frequency))
+                    if i == 0 or plan.signal_off_offsets_s is not None:
+                        await device.set_signal_on()
+
+                    now = await self._sleep_until(start + plan.measure_offsets_s[i])
+                    report.actual_measure_s[i] = now - start
+                    measurements.append(asyncio.create_task(measure(i, frequency)))
+
+                    if plan.signal_off_offsets_s is not None:
+                        await self._sleep_until(start + plan.signal_off_offsets_s[i])
+                        await device.set_signal_off()
+
+            await self._sleep_until(start + plan.nominal_duration_s)
+            await asyncio.gather(*measurements)
+        except BaseException:
+            for measurement in measurements:
+                measurement.cancel()
+            raise
+        finally:
+            report.duration_s = self._clock() - start
+        return report
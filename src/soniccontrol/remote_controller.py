@@ -5,7 +5,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 import attrs
 
 from sonic_protocol.field_names import EFieldName
-from sonic_protocol.protocol_list import ProtocolList
+from sonic_protocol.protocol_list import IProtocolFactory
 from sonic_protocol.python_parser.commands import Command
 from sonic_protocol.schema import DeviceType
 from soniccontrol.app_config import PLATFORM, SOFTWARE_VERSION
@@ -16,6 +16,7 @@ from soniccontrol.data_capturing.capture_target import CaptureSpectrumArgs, Capt
 from soniccontrol.data_capturing.experiment import Experiment, ExperimentMetaData
 from soniccontrol.logging_utils import create_logger_for_connection
 from soniccontrol.procedures.procedure_controller import ProcedureController, ProcedureType
+from soniccontrol.procedures.procs.resonance_sweep import ResonanceSweep, ResonanceSweepArgs
 from soniccontrol.procedures.procs.spectrum_measure import SpectrumMeasureArgs
 from soniccontrol.scripting.interpreter_engine import InterpreterEngine
 from soniccontrol.scripting.new_scripting import NewScriptingFacade
@@ -31,12 +32,13 @@ class SpectrumArgsAdapter(CaptureSpectrumArgs):
 class RemoteController:
     NOT_CONNECTED = "Controller is not connected to a device"
 
-    def __init__(self, log_path: Optional[Path]=None, protocol_factories: Dict[DeviceType, ProtocolList] = {}):
+    def __init__(self, log_path: Optional[Path]=None, protocol_factories: Dict[DeviceType, IProtocolFactory] = {}):
         self._device: Optional[SonicDevice] = None
         self._scripting: Optional[ScriptingFacade] = None
         self._proc_controller: Optional[ProcedureController] = None
         self._log_path: Optional[Path] = log_path
         self._updater: Optional[Updater] = None
+        self._capture_unsubscription: Optional[asyncio.Task] = None
         self._protocol_factories = protocol_factories
 
     # TODO: make the connect functions classmethods and they give back a RemoteController
@@ -129,26 +131,46 @@ class RemoteController:
 
     async def measure_spectrum(self, output_dir: Path, spectrum_args: SpectrumMeasureArgs, 
                                experiment_metadata: ExperimentMetaData, blocking: bool=True) -> None:
+        """! @param spectrum_args If they are ResonanceSweepArgs, a coarse to fine ResonanceSweep is done instead of a full sweep """
         assert self._device is not None,    RemoteController.NOT_CONNECTED
         assert self._updater
         assert self._proc_controller
 
 
         capture = Capture(output_dir)
-        capture_target = CaptureSpectrumMeasure(self._updater, self._proc_controller, SpectrumArgsAdapter(spectrum_args))
-        self._updater.subscribe("update", lambda e: capture.on_update(e.data["status"]))
+        if isinstance(spectrum_args, ResonanceSweepArgs):
+            capture_target = CaptureSpectrumMeasure(
+                self._updater, self._proc_controller, SpectrumArgsAdapter(spectrum_args),
+                ResonanceSweep(self._updater), ProcedureType.RESONANCE_SWEEP
+            )
+            target_type = CaptureTargets.RESONANCE_SWEEP
+        else:
+            capture_target = CaptureSpectrumMeasure(self._updater, self._proc_controller, SpectrumArgsAdapter(spectrum_args))
+            target_type = CaptureTargets.SPECTRUM_MEASURE
+        capture.subscribe_to_updates(self._updater)
 
         experiment = Experiment(experiment_metadata, self._device.info,
                                  SOFTWARE_VERSION, PLATFORM.value, 
-                                 CaptureTargets.SPECTRUM_MEASURE)
+                                 target_type)
 
-        await capture.start_capture(experiment, capture_target)
+        try:
+            await capture.start_capture(experiment, capture_target)
+        except BaseException:
+            await capture.unsubscribe_from_updates()
+            raise
         if blocking:
-            await capture.wait_for_capture_to_complete()
+            await self._unsubscribe_after_capture(capture)
+        else:
+            self._capture_unsubscription = asyncio.create_task(self._unsubscribe_after_capture(capture))
+
+    @staticmethod
+    async def _unsubscribe_after_capture(capture: Capture) -> None:
+        await capture.wait_for_capture_to_complete()
+        await capture.unsubscribe_from_updates()
 
     async def disconnect(self) -> None:
         if self._updater is not None:
-            await self._updater.stop()
+            await self._updater.close()
             self._updater = None
 
         if self._device is not None:
@@ -8,6 +8,7 @@ import asyncio
 import sonic_protocol.python_parser.commands as cmds
 from sonic_protocol.schema import Version
 from sonic_protocol.si_unit import SIVar
+from soniccontrol.precise_timer import PreciseTimer
 from soniccontrol.procedures.holder import convert_to_holder_args, HolderArgs
 from soniccontrol.procedures.legacy_procs.auto import AutoLegacyArgs
 from soniccontrol.procedures.legacy_procs.wipe import WipeLegacyArgs
@@ -47,7 +48,7 @@ class HoldCommand(Function):
         duration = amount_time.duration if amount_time.unit == "s" else amount_time.duration / 1000
 
         async def hold(_device: SonicDevice, _proc_controller: ProcedureController, duration=duration):
-            await asyncio.sleep(duration)
+            await PreciseTimer().sleep_for(duration)
         
         return f"hold amount_time={str(amount_time)}", hold
     
@@ -136,16 +137,16 @@ class Timer():
 
     def wrap_command_func(self, func: CommandFunc) -> CommandFunc:
         async def _func(device: SonicDevice, proc_controller: ProcedureController):
-            time_now = time.time()
+            time_now = time.monotonic()
             await func(device, proc_controller)
-            self._time_passed += time.time() - time_now
+            self._time_passed += time.monotonic() - time_now
         return _func
     
     def create_wait_remaining_time_execution_step(self) -> ExecutionStep:
         time_remaining = self._duration_s - self._time_passed
         async def _func(device: SonicDevice, proc_controller: ProcedureController, time_remaining=time_remaining):
             if time_remaining >= 0.:
-                await asyncio.sleep(time_remaining)
+                await PreciseTimer().sleep_for(time_remaining)
             else:
                 pass # TODO: throw error or log warning
         
@@ -1,4 +1,5 @@
 import logging
+from typing import Dict
 
 import attrs
 from sonic_protocol.command_codes import CommandCode
@@ -8,9 +9,13 @@ from sonic_protocol.python_parser.answer_validator_builder import AnswerValidato
 from sonic_protocol.python_parser.command_deserializer import CommandDeserializer
 from sonic_protocol.python_parser.command_serializer import CommandSerializer
 from sonic_protocol.python_parser.commands import Command, SetOff, SetOn
+from sonic_protocol.python_parser.protocol_compiler import CompiledAnswerValidator, CompiledProtocol, ProtocolCompiler
 from sonic_protocol.schema import ICommandCode, Protocol
+from soniccontrol.app_config import PROTOCOL_CACHE_DIR
 from soniccontrol.device_data import FirmwareInfo
+from soniccontrol.device_state_cache import DeviceStateCache
 from soniccontrol.communication.serial_communicator import Communicator
+from soniccontrol.tracing import trace_span
 
 class CommandValidationError(Exception):
     """Raised when a command's response fails validation."""
@@ -26,18 +31,37 @@ class CommandExecutionError(Exception):
 
 class SonicDevice:
     def __init__(self, communicator: Communicator, protocol: Protocol, info: FirmwareInfo, 
-                 should_validate_answers: bool = True, logger: logging.Logger=logging.getLogger()) -> None:
+                 should_validate_answers: bool = True, logger: logging.Logger=logging.getLogger(),
+                 use_compiled_protocol: bool = True, state_cache: DeviceStateCache | None = None) -> None:
+        """!
+        @param state_cache If set, the answers of idempotent getters are answered from the cache, while they are fresh.
+        """
         self._info = info
+        self._state_cache = state_cache
         self._logger = logging.getLogger(logger.name + "." + SonicDevice.__name__)
         self._communicator = communicator
         self._protocol = protocol
-        answer_validators = { code: AnswerValidatorBuilder.create_answer_validator(command_contract.answer_def, protocol.field_name_cls) 
-                                   for code, command_contract in self._protocol.command_contracts.items() }
-        self._answer_validators = answer_validators
+        self._answer_validators: Dict[ICommandCode, AnswerValidator | CompiledAnswerValidator] = {}
+        self._command_serializer: CommandSerializer | CompiledProtocol = CommandSerializer(self._protocol)
+        compiled_protocol = self._load_compiled_protocol() if use_compiled_protocol else None
+        if compiled_protocol is not None:
+            self._answer_validators.update(compiled_protocol.answer_validators)
+            self._command_serializer = compiled_protocol
+        else:
+            self._answer_validators.update({ 
+                code: AnswerValidatorBuilder.create_answer_validator(command_contract.answer_def, protocol.field_name_cls) 
+                for code, command_contract in self._protocol.command_contracts.items() 
+            })
         self._command_deserializer = CommandDeserializer(self._protocol)
-        self._command_serializer = CommandSerializer(self._protocol)
         self._should_validate_answers = should_validate_answers
 
+    def _load_compiled_protocol(self) -> CompiledProtocol | None:
+        try:
+            return ProtocolCompiler(PROTOCOL_CACHE_DIR).load_or_compile(self._protocol)
+        except Exception as e:
+            self._logger.warning("Could not compile the protocol, falling back to the regex validators: %s", e)
+            return None
+
     @property
     def info(self) -> FirmwareInfo:
         return self._info
@@ -50,6 +74,14 @@ class SonicDevice:
     def protocol(self) -> Protocol:
         return self._protocol
 
+    @property
+    def state_cache(self) -> DeviceStateCache | None:
+        return self._state_cache
+
+    @property
+    def command_deserializer(self) -> CommandDeserializer:
+        return self._command_deserializer
+
     def has_command(self, command: CommandCode | Command) -> bool:
         command_code = command.code if isinstance(command, Command) else command
         return command_code in self._protocol.command_contracts and self._protocol.command_contracts[command_code].command_def is not None
@@ -60,7 +92,8 @@ class SonicDevice:
         assert command_contract.command_def is not None, f"For the command_code of {command} exists a message (notify or error), but there exists no command" 
         assert not isinstance(command_contract.command_def.sonic_text_attrs, list)
 
-        request_str = self._command_serializer.serialize_command(command)
+        with trace_span("serialize", "device"):
+            request_str = self._command_serializer.serialize_command(command)
         
         answer = await self._send_message(
             request_str, 
@@ -72,8 +105,10 @@ class SonicDevice:
 
         return answer
 
-    async def _send_message(self, message: str, answer_validator: AnswerValidator| None = None, try_deduce_answer_validator: bool = False, **kwargs) -> Answer:
+    async def _send_message(self, message: str, answer_validator: AnswerValidator | CompiledAnswerValidator | None = None, try_deduce_answer_validator: bool = False, **kwargs) -> Answer:
         response_str = await self._communicator.send_and_wait_for_response(message, **kwargs)
+        # The legacy communicator returns the answer lines together with their line terminators
+        response_str = response_str.rstrip("\r\n")
         
         code: ICommandCode | None = None
         if "#" in response_str:
@@ -86,7 +121,7 @@ class SonicDevice:
         
         if try_deduce_answer_validator and answer_validator is None:
             command_code = self._command_deserializer.get_deserialized_command_code(message.strip())
-            if command_code:
+            if command_code is not None:
                 answer_validator = self._answer_validators[command_code]
         
         if answer_validator is None or not self._should_validate_answers:
@@ -94,7 +129,8 @@ class SonicDevice:
             # So in rescue mode, we skip the validation of the answers
             answer = Answer(response_str, False, was_validated=False)
         else:
-            answer = answer_validator.validate(response_str)
+            with trace_span("validate", "device"):
+                answer = answer_validator.validate(response_str)
         
         answer.command_code = code
         return answer
@@ -111,6 +147,7 @@ class SonicDevice:
         should_log: bool = True,
         try_deduce_command_if_str: bool = True,
         raise_exception: bool = True,
+        use_cache: bool = True,
         **kwargs
     ) -> Answer:
         """
@@ -120,6 +157,7 @@ class SonicDevice:
             message (Union[str, Command]): The command message to execute. It can be either a string or a Command object.
             argument (Any, optional): The argument to pass to the command. Defaults to an empty string.
             **status_kwargs_if_valid_command: Additional keyword arguments to update the status if the command is valid.
+            use_cache (bool): If False, the state cache is bypassed and the answer is always fetched from the device.
 
         Returns:
             str: The string representation of the command's answer.
@@ -137,18 +175,24 @@ class SonicDevice:
             >>> await sonicamp.execute_command("!ON", raise_exception=True)
             "Device powered on."
         """
+        if use_cache and self._state_cache is not None and isinstance(command, Command) and self._state_cache.is_cacheable(command):
+            cached_answer = self._state_cache.get(command)
+            if cached_answer is not None:
+                return cached_answer
+
         if should_log:
             command_str = command if isinstance(command, str) else str(command.__class__)
             self._logger.info("Execute command %s", command_str)
         
         try:
-            if isinstance(command, str):
-                answer = await self._send_message(
-                    command, 
-                    try_deduce_answer_validator=try_deduce_command_if_str
-                )
-            else:
-                answer = await self._send_command(command)
+            with trace_span("execute_command", "device", command=command if isinstance(command, str) else type(command).__name__):
+                if isinstance(command, str):
+                    answer = await self._send_message(
+                        command, 
+                        try_deduce_answer_validator=try_deduce_command_if_str
+                    )
+                else:
+                    answer = await self._send_command(command)
         except Exception as e:
             self._logger.error(e)
             await self.disconnect()
@@ -157,6 +201,10 @@ class SonicDevice:
                 raise e
             return Answer(str(e), False, True)
 
+        if self._state_cache is not None:
+            executed_command = self._command_deserializer.deserialize_command(command.strip()) if isinstance(command, str) else command
+            self._state_cache.on_answer(executed_command, answer)
+
         if raise_exception and answer.was_validated and not answer.valid:
             raise CommandValidationError(answer.message)
         
@@ -0,0 +1,173 @@
+import asyncio
+import concurrent.futures
+import threading
+from pathlib import Path
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.protocol_list import IProtocolFactory
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import DeviceType
+from soniccontrol.data_capturing.experiment import ExperimentMetaData
+from soniccontrol.procedures.procedure_controller import ProcedureType
+from soniccontrol.procedures.procs.spectrum_measure import SpectrumMeasureArgs
+from soniccontrol.remote_controller import RemoteController
+
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """!
+    Runs an asyncio event loop in its own daemon thread, so that tasks like the updater keep running,
+    while the thread that submits coroutines does something else.
+    """
+    def __init__(self, name: str = "EventLoopThread") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        assert self._loop is not None, "The event loop thread is not started"
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop() -> None:
+            assert self._loop is not None
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(started.set)
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run_loop, name=self._name, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """!
+        Runs the coroutine in the event loop thread and blocks until it is finished.
+        @param timeout If the coroutine does not finish in time, it gets cancelled and a TimeoutError is raised
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("run cannot be called from the event loop thread, because it would block the loop")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def call(self, func: Callable[[], T], timeout: float | None = None) -> T:
+        """! Calls a synchronous function in the event loop thread. Needed for functions that create tasks """
+        async def call_in_loop() -> T:
+            return func()
+        return self.run(call_in_loop(), timeout)
+
+    def stop(self) -> None:
+        if self._loop is None or self._thread is None:
+            return
+        if self._thread.is_alive():
+            self.run(self._cancel_remaining_tasks())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    @staticmethod
+    async def _cancel_remaining_tasks() -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __enter__(self) -> "EventLoopThread":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+class SyncRemoteController:
+    """!
+    Synchronous facade of the RemoteController for the CLI and robot tests.
+    All calls are executed in a dedicated event loop thread, that keeps running between the calls.
+    So the updater and the message fetcher keep on running, while the caller waits for user input.
+    """
+    def __init__(self, log_path: Optional[Path] = None, protocol_factories: Dict[DeviceType, IProtocolFactory] = {},
+                 loop_thread: EventLoopThread | None = None) -> None:
+        self._loop_thread = loop_thread if loop_thread is not None else EventLoopThread("RemoteControllerLoop")
+        self._loop_thread.start()
+        self._controller = RemoteController(log_path=log_path, protocol_factories=protocol_factories)
+
+    @property
+    def controller(self) -> RemoteController:
+        """! The asynchronous controller. Its coroutines have to be executed with run """
+        return self._controller
+
+    @property
+    def loop_thread(self) -> EventLoopThread:
+        return self._loop_thread
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        return self._loop_thread.run(coroutine, timeout)
+
+    def connect_via_serial(self, url: Path, baudrate: int = 9600) -> None:
+        self.run(self._controller.connect_via_serial(url, baudrate))
+
+    def connect_via_process(self, process_file: Path, cmd_args: List[str] = []) -> None:
+        self.run(self._controller.connect_via_process(process_file, cmd_args))
+
+    def is_connected(self) -> bool:
+        return self._controller.is_connected()
+
+    def start_updater(self) -> None:
+        self._loop_thread.call(self._controller.start_updater)
+
+    def stop_updater(self) -> None:
+        self.run(self._controller.stop_updater())
+
+    def send_command(self, command: str | Command, timeout: float | None = None) -> Tuple[str, Dict[EFieldName, Any], bool]:
+        return self.run(self._controller.send_command(command), timeout)
+
+    def execute_script(self, text: str, callback: Callable[[str], None] = lambda _: None) -> None:
+        self.run(self._controller.execute_script(text, callback))
+
+    def execute_procedure(self, procedure: ProcedureType, args: dict) -> None:
+        self._loop_thread.call(lambda: self._controller.execute_procedure(procedure, args, self._loop_thread.loop))
+
+    def wait_for_procedure_to_finish(self) -> None:
+        self.run(self._controller.wait_for_procedure_to_finish())
+
+    def stop_procedure(self) -> None:
+        self.run(self._controller.stop_procedure())
+
+    def measure_spectrum(self, output_dir: Path, spectrum_args: SpectrumMeasureArgs,
+                         experiment_metadata: ExperimentMetaData, blocking: bool = True) -> None:
+        self.run(self._controller.measure_spectrum(output_dir, spectrum_args, experiment_metadata, blocking))
+
+    def disconnect(self) -> None:
+        self.run(self._controller.disconnect())
+
+    def close(self) -> None:
+        """! Disconnects and stops the event loop thread """
+        if self._loop_thread.is_running:
+            self.disconnect()
+        self._loop_thread.stop()
+
+    def __enter__(self) -> "SyncRemoteController":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import attrs
+
+from sonic_protocol.python_parser.commands import Command
+from soniccontrol.deadline_scheduler import DeadlineScheduler, OverrunPolicy, PollingStatistics
+
+
+@attrs.define()
+class TelemetryEntry:
+    command: Command = attrs.field()
+    period_s: float = attrs.field()
+
+    @period_s.validator
+    def _check_period(self, _attribute, period_s: float) -> None:
+        if period_s <= 0:
+            raise ValueError(f"The period of {self.command} has to be positive, but is {period_s}")
+
+
+class TelemetrySchedule:
+    """!
+    Interleaves several getter commands with different periods on the single link to the device.
+    Fast changing values, like the electrical measurements, can be polled often,
+    while slow changing values, like the temperature, only take up a small part of the bandwidth.
+
+    Example:
+        TelemetrySchedule([
+            TelemetryEntry(commands.GetUipt(), period_s=0.05),
+            TelemetryEntry(commands.GetTemp(), period_s=5),
+        ])
+
+    Each entry has its own grid of deadlines. The entry with the earliest deadline is polled next.
+    Because the commands have to wait for each other, polls are often a bit late.
+    So the entries use OverrunPolicy.COMPENSATE by default, which polls late entries as soon as the link is free.
+    """
+    def __init__(
+        self,
+        entries: List[TelemetryEntry],
+        overrun_policy: OverrunPolicy = OverrunPolicy.COMPENSATE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> None:
+        if len(entries) == 0:
+            raise ValueError("The telemetry schedule needs at least one entry")
+        self._entries = entries
+        self._schedulers = [
+            DeadlineScheduler(entry.period_s, overrun_policy, clock=clock, sleep=sleep) for entry in entries
+        ]
+
+    @property
+    def entries(self) -> List[TelemetryEntry]:
+        return self._entries
+
+    def get_statistics(self) -> List[PollingStatistics]:
+        """! Returns the statistics in the same order as the entries """
+        return [ scheduler.statistics for scheduler in self._schedulers ]
+
+    def reset(self) -> None:
+        for scheduler in self._schedulers:
+            scheduler.reset()
+
+    async def wait_for_next_command(self) -> Command:
+        """! Waits until the deadline of the next entry and returns its command """
+        next_index = 0
+        next_deadline = self._schedulers[0].next_deadline
+        for index, scheduler in enumerate(self._schedulers):
+            deadline = scheduler.next_deadline
+            if deadline is None:
+                # entries that were not polled yet, are polled immediately
+                next_index = index
+                break
+            if next_deadline is not None and deadline < next_deadline:
+                next_index, next_deadline = index, deadline
+
+        await self._schedulers[next_index].wait_for_next_deadline()
+        return self._entries[next_index].command
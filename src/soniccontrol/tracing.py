@@ -0,0 +1,153 @@
+"""!
+Optional tracing of where the time goes, when commands are executed, updates are polled and procedures run.
+Tracing is disabled by default. Then trace_span returns a shared no-op context manager, so that it costs next to nothing.
+When enabled, finished spans are recorded into a ring buffer and can be exported as Chrome trace-event JSON,
+that can be opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+import asyncio
+from collections import deque
+import contextlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, ContextManager, Deque, Dict, List, NamedTuple, Tuple
+
+
+DEFAULT_TRACE_CAPACITY = 100_000
+
+
+class TraceSpan(NamedTuple):
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    #! The id of the asyncio task, that recorded the span, or 0 if it was recorded outside of a task
+    task_id: int
+    task_name: str
+    args: Dict[str, Any] | None
+
+
+class _ActiveSpan:
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any] | None) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._start_ns = self._tracer.clock()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer.record(self._name, self._category, self._start_ns, self._tracer.clock(), self._args)
+
+
+class Tracer:
+    """!
+    Records spans into a ring buffer. If the buffer is full, the oldest spans are dropped.
+    """
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        if capacity <= 0:
+            raise ValueError(f"The capacity has to be positive, but is {capacity}")
+        self.clock = clock
+        self._spans: Deque[TraceSpan] = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        assert self._spans.maxlen is not None
+        return self._spans.maxlen
+
+    def span(self, name: str, category: str = "", args: Dict[str, Any] | None = None) -> ContextManager:
+        return _ActiveSpan(self, name, category, args)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, args: Dict[str, Any] | None = None) -> None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        # deque.append is atomic, so spans can be recorded from several threads
+        self._spans.append(TraceSpan(
+            name, category, start_ns, end_ns - start_ns, threading.get_ident(),
+            0 if task is None else id(task), "" if task is None else task.get_name(), args
+        ))
+
+    def get_spans(self) -> List[TraceSpan]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """!
+        Converts the spans into complete events ("ph": "X") of the Chrome trace-event format.
+        Each asyncio task gets its own track, because spans of concurrent tasks do not nest.
+        """
+        pid = os.getpid()
+        tracks: Dict[Tuple[int, int], int] = {}
+        events: List[Dict[str, Any]] = []
+        for span in sorted(self._spans, key=lambda span: span.start_ns):
+            track_key = (span.thread_id, span.task_id)
+            tid = tracks.get(track_key)
+            if tid is None:
+                tid = len(tracks) + 1
+                tracks[track_key] = tid
+                events.append({
+                    "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                    "args": { "name": span.task_name or f"thread {span.thread_id}" },
+                })
+            event: Dict[str, Any] = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if span.args:
+                event["args"] = { key: str(value) for key, value in span.args.items() }
+            events.append(event)
+        return { "traceEvents": events, "displayTimeUnit": "ms" }
+
+    def export_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+_NO_SPAN: ContextManager = contextlib.nullcontext()
+_tracer: Tracer | None = None
+
+
+def enable_tracing(capacity: int = DEFAULT_TRACE_CAPACITY) -> Tracer:
+    """! Starts recording spans. If tracing is already enabled, the existing tracer is returned """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(capacity)
+    return _tracer
+
+
+def disable_tracing() -> None:
+    global _tracer
+    _tracer = None
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def trace_span(name: str, category: str = "", **args: Any) -> ContextManager:
+    """!
+    Measures the duration of the with block, if tracing is enabled.
+    @param args Are shown in the details of the span. They are converted to strings only on export
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, category, args)
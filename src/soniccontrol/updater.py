@@ -1,24 +1,63 @@
 
 import asyncio
-from typing import Optional
+import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional
+from sonic_protocol.field_names import IEFieldName
 from sonic_protocol.python_parser import commands
+from soniccontrol.broadcast_channel import BroadcastChannel, DropPolicy, Subscription
+from soniccontrol.deadline_scheduler import DeadlineScheduler, OverrunPolicy, PollingStatistics
+from soniccontrol.telemetry_schedule import TelemetrySchedule
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol.events import Event, EventManager
+from soniccontrol.tracing import trace_span
 
 
 class Updater(EventManager):
-    def __init__(self, device: SonicDevice, time_waiting_between_updates_ms: int = 0) -> None:
+    """!
+    Polls the device with ?update and emits an "update" event for each valid answer.
+    The event contains the full status, the set of fields, that changed since the previous update,
+    so that listeners can skip the work for unchanged fields, and the time the answer was received:
+
+        Event("update", status=Dict[IEFieldName, Any], changed_fields=FrozenSet[IEFieldName], timestamp=datetime.datetime)
+
+    The first update after starting the updater reports all fields as changed.
+
+    By default the updater waits a fixed time after each update. If a target rate is set,
+    the updates are instead scheduled against deadlines, so that they are evenly spaced at the target rate.
+    If a telemetry schedule is set, the updater polls the getters of the schedule instead of ?update
+    and merges their answers into the status, so the status always contains the latest value of each field.
+
+    Listeners subscribed with subscribe are called synchronously in update and delay the next poll.
+    Slow listeners should use subscribe_update_channel instead, where each listener gets its own queue and task.
+    """
+    def __init__(self, device: SonicDevice, time_waiting_between_updates_ms: int = 0, target_rate_hz: float | None = None) -> None:
         super().__init__()
         self._device = device
         self._time_waiting_between_updates_ms = time_waiting_between_updates_ms
+        self._scheduler: DeadlineScheduler | None = None
+        self._telemetry_schedule: TelemetrySchedule | None = None
+        if target_rate_hz is not None:
+            self.set_target_rate(target_rate_hz)
         self._running: asyncio.Event = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
+        self._last_status: Dict[IEFieldName, Any] = {}
+        self._update_channel: BroadcastChannel[Event] = BroadcastChannel()
 
     @property
     def running(self) -> asyncio.Event:
         return self._running
 
+    @property
+    def last_status(self) -> Dict[IEFieldName, Any]:
+        """! The full status of the last valid update. Empty, if there was none yet """
+        return self._last_status
+
     def start(self) -> None:
+        self._last_status = {}
+        if self._scheduler is not None:
+            self._scheduler.reset()
+        if self._telemetry_schedule is not None:
+            self._telemetry_schedule.reset()
         self._running.set()
         self._task = asyncio.create_task(self._loop())
 
@@ -27,27 +66,119 @@ class Updater(EventManager):
         if self._task is not None:
             await self._task
 
+    async def close(self) -> None:
+        """! Stops the updater and the tasks of the update channel subscriptions """
+        await self.stop()
+        await self._update_channel.close()
+
+    def subscribe_update_channel(
+        self,
+        listener: Callable[[Event], None | Awaitable[None]],
+        drop_policy: DropPolicy = DropPolicy.KEEP_LATEST,
+        max_queue_size: int = 100
+    ) -> Subscription[Event]:
+        """!
+        Subscribes to the update events without delaying the polling, unless the drop policy is DropPolicy.BACKPRESSURE.
+        With DropPolicy.KEEP_LATEST the changed fields of dropped events are merged into the next event, so no changes get lost.
+        With DropPolicy.DROP_OLDEST the changed fields of the dropped events are lost.
+        """
+        return self._update_channel.subscribe(listener, drop_policy, max_queue_size, coalesce=Updater.coalesce_update_events)
+
+    async def unsubscribe_update_channel(self, subscription: Subscription[Event]) -> None:
+        await self._update_channel.unsubscribe(subscription)
+
+    @staticmethod
+    def coalesce_update_events(older_event: Event, newer_event: Event) -> Event:
+        changed_fields = older_event.data["changed_fields"] | newer_event.data["changed_fields"]
+        return Event("update", **{ **newer_event.data, "changed_fields": changed_fields })
+
     def get_update_interval(self) -> int:
         return self._time_waiting_between_updates_ms
 
     def set_update_interval(self, time_waiting_between_updates_ms: int) -> None:
         self._time_waiting_between_updates_ms = time_waiting_between_updates_ms
 
-    async def update(self) -> None:
-        # HINT: If ever needed to update different device attributes, we can do that, by checking what components the device has
-        # and then additionally call other commands to get this information
-        if self._device.has_command(commands.GetUpdate()):
+    def get_target_rate(self) -> float | None:
+        return None if self._scheduler is None else 1 / self._scheduler.interval_s
+
+    def set_target_rate(self, target_rate_hz: float | None, overrun_policy: OverrunPolicy = OverrunPolicy.SKIP) -> None:
+        """!
+        @param target_rate_hz The number of updates per second. If None, the updater waits the update interval after each update instead.
+        """
+        if target_rate_hz is None:
+            self._scheduler = None
+            return
+        if target_rate_hz <= 0:
+            raise ValueError(f"The target rate has to be positive, but is {target_rate_hz}")
+        self._scheduler = DeadlineScheduler(1 / target_rate_hz, overrun_policy)
+
+    @property
+    def polling_statistics(self) -> PollingStatistics | None:
+        """! The achieved rate, jitter and missed deadlines since the start. None, if no target rate is set """
+        return None if self._scheduler is None else self._scheduler.statistics
+
+    @property
+    def telemetry_schedule(self) -> TelemetrySchedule | None:
+        return self._telemetry_schedule
+
+    def set_telemetry_schedule(self, telemetry_schedule: TelemetrySchedule | None) -> None:
+        """!
+        @param telemetry_schedule The getters to poll with their periods. If None, the updater polls ?update again.
+        """
+        if telemetry_schedule is not None:
+            for entry in telemetry_schedule.entries:
+                if not self._device.has_command(entry.command):
+                    raise ValueError(f"The device does not support the command {entry.command} of the telemetry schedule")
+        self._telemetry_schedule = telemetry_schedule
+
+    async def update(self, command: commands.Command | None = None) -> Dict[IEFieldName, Any] | None:
+        """!
+        @param command The getter to poll. ?update, if None
+        @return The status, that was emitted, or None if the answer was not valid
+        """
+        command = commands.GetUpdate() if command is None else command
+        if not self._device.has_command(command):
+            self._running.clear()
+            return None
+
+        with trace_span("update", "updater", command=type(command).__name__):
             # Configurator does not have update but uses Device so for now I fix it like this
-            answer = await self._device.execute_command(commands.GetUpdate(), should_log=False, raise_exception=False)
+            answer = await self._device.execute_command(command, should_log=False, raise_exception=False)
             if answer.valid:
-                self.emit(Event("update", status=answer.field_value_dict))
-        else:
-            self._running.clear()
+                field_values = answer.field_value_dict
+                changed_fields = Updater.get_changed_fields(self._last_status, field_values)
+                status = field_values if self._telemetry_schedule is None else { **self._last_status, **field_values }
+                self._last_status = status
+                event = Event("update", status=status, changed_fields=changed_fields, timestamp=datetime.datetime.now())
+                with trace_span("emit_update", "updater"):
+                    self.emit(event)
+                    await self._update_channel.publish(event)
+                return status
+        return None
+
+    @staticmethod
+    def get_changed_fields(previous_status: Dict[IEFieldName, Any], status: Dict[IEFieldName, Any]) -> FrozenSet[IEFieldName]:
+        return frozenset(
+            field_name for field_name, value in status.items() 
+            if field_name not in previous_status or previous_status[field_name] != value
+        )
 
     async def _loop(self) -> None:
         try:
             open_connection_flag = self._device.communicator.connection_opened
             while self._running.is_set() and open_connection_flag.is_set():
+                telemetry_schedule = self._telemetry_schedule
+                if telemetry_schedule is not None:
+                    command = await telemetry_schedule.wait_for_next_command()
+                    await self.update(command)
+                    continue
+
+                scheduler = self._scheduler
+                if scheduler is not None:
+                    await scheduler.wait_for_next_deadline()
+                    await self.update()
+                    continue
+
                 await self.update()
                 if self._time_waiting_between_updates_ms > 0:
                     await asyncio.sleep(self._time_waiting_between_updates_ms / 1000)
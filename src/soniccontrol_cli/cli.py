@@ -5,12 +5,12 @@ import click
 from soniccontrol.data_capturing.converter import create_cattrs_converter_for_basic_serialization
 from soniccontrol.data_capturing.experiment import ExperimentMetaData
 from soniccontrol.procedures.procs.spectrum_measure import SpectrumMeasureArgs
-from soniccontrol.remote_controller import RemoteController
+from soniccontrol.sync_remote_controller import SyncRemoteController
+from soniccontrol.tracing import enable_tracing, get_tracer
 from soniccontrol_cli.monitor import Monitor
 from soniccontrol_cli.procedures import add_procedure_commands, create_click_option
 from soniccontrol_gui.constants import files
 import pathlib
-import asyncio
 from enum import Enum
 import logging
 import io
@@ -22,51 +22,60 @@ class ConnectionType(Enum):
     SERIAL = "serial"
 
 REMOTE_CONTROLLER = "REMOTE_CONTROLLER"
-ASYNC_LOOP = "ASYNC_LOOP"
+TRACE_FILE = "TRACE_FILE"
 
 @click.group()
 @click.option("--log-dir", type=click.Path(path_type=pathlib.Path, file_okay=False), default=files.LOG_DIR)
 @click.argument("port", type=click.Path(path_type=pathlib.Path, dir_okay=False))
 @click.option("--connection", type=click.Choice([ConnectionType.PROCESS.value, ConnectionType.SERIAL.value]), default=ConnectionType.SERIAL.value)
 @click.option("--baudrate", type=click.Choice(["9600", "112500"]), default="112500")
+@click.option("--trace-file", type=click.Path(path_type=pathlib.Path, dir_okay=False), default=None,
+              help="Records where the time goes and writes it as Chrome trace-event JSON to this file on exit")
 @click.pass_context
-def cli(ctx: click.Context, log_dir: pathlib.Path, port: pathlib.Path, connection: str, baudrate: str):        
+def cli(ctx: click.Context, log_dir: pathlib.Path, port: pathlib.Path, connection: str, baudrate: str, trace_file: pathlib.Path | None):        
     logging.getLogger().handlers.clear()
+    if trace_file is not None:
+        enable_tracing()
 
     click.echo("Connecting to the device...")
 
-    remote_controller = RemoteController(log_path=log_dir)
-    async_loop = asyncio.get_event_loop()
+    # The event loop runs in its own thread, so that the updater keeps running between the commands
+    remote_controller = SyncRemoteController(log_path=log_dir)
 
     match ConnectionType(connection):
         case ConnectionType.PROCESS:
-            async_loop.run_until_complete(remote_controller.connect_via_process(port))
+            remote_controller.connect_via_process(port)
         case ConnectionType.SERIAL:
-            async_loop.run_until_complete(remote_controller.connect_via_serial(port, int(baudrate)))
+            remote_controller.connect_via_serial(port, int(baudrate))
 
     click.echo("Connected to device")
 
     ctx.ensure_object(dict)
     ctx.obj[REMOTE_CONTROLLER] = remote_controller
-    ctx.obj[ASYNC_LOOP] = async_loop
+    ctx.obj[TRACE_FILE] = trace_file
     
 @cli.result_callback()
 @click.pass_context
 def disconnect(ctx: click.Context, *args, **kwargs):
-    remote_controller: RemoteController = ctx.obj[REMOTE_CONTROLLER]
-    async_loop: asyncio.AbstractEventLoop = ctx.obj[ASYNC_LOOP]
+    remote_controller: SyncRemoteController = ctx.obj[REMOTE_CONTROLLER]
     if remote_controller.is_connected():
         click.echo("Disconnecting from the device...")
-        async_loop.run_until_complete(remote_controller.disconnect())
+        remote_controller.disconnect()
         click.echo("Disconnected from device")
+    remote_controller.close()
+
+    tracer = get_tracer()
+    trace_file: pathlib.Path | None = ctx.obj[TRACE_FILE]
+    if tracer is not None and trace_file is not None:
+        tracer.export_chrome_trace(trace_file)
+        click.echo(f"Wrote trace to {trace_file}")
 
 @cli.command()
 @click.pass_context
 def monitor(ctx: click.Context):
-    remote_controller: RemoteController = ctx.obj[REMOTE_CONTROLLER]
-    async_loop: asyncio.AbstractEventLoop = ctx.obj[ASYNC_LOOP]
-    async_loop.run_until_complete(remote_controller.stop_updater())
-    monitor = Monitor(remote_controller, async_loop)
+    remote_controller: SyncRemoteController = ctx.obj[REMOTE_CONTROLLER]
+    remote_controller.stop_updater()
+    monitor = Monitor(remote_controller)
     monitor.cmdloop()
 
 @cli.group()
@@ -77,13 +86,12 @@ def procedure(ctx: click.Context):
 @procedure.result_callback()
 @click.pass_context
 def procedure_result_callback(ctx: click.Context, *args, **kwargs):
-    remote_controller: RemoteController = ctx.obj[REMOTE_CONTROLLER]
-    async_loop: asyncio.AbstractEventLoop = ctx.obj[ASYNC_LOOP]
+    remote_controller: SyncRemoteController = ctx.obj[REMOTE_CONTROLLER]
     
     # TODO: print updates until proc finished
     click.echo("Procedure is being executed")
 
-    async_loop.run_until_complete(remote_controller.wait_for_procedure_to_finish())
+    remote_controller.wait_for_procedure_to_finish()
     click.echo("Procedure finished")
 
 add_procedure_commands(procedure)
@@ -92,13 +100,12 @@ add_procedure_commands(procedure)
 @click.argument("script-file", type=click.File("r"))
 @click.pass_context
 def script(ctx: click.Context, script_file: io.IOBase):
-    remote_controller: RemoteController = ctx.obj[REMOTE_CONTROLLER]
-    async_loop: asyncio.AbstractEventLoop = ctx.obj[ASYNC_LOOP]
+    remote_controller: SyncRemoteController = ctx.obj[REMOTE_CONTROLLER]
     
     script_text = script_file.read()
-    async_loop.run_until_complete(remote_controller.execute_script(script_text, 
+    remote_controller.execute_script(script_text, 
         callback=lambda task_desc: click.echo(task_desc)
-    ))
+    )
 
 
 @cli.command(
@@ -113,8 +120,7 @@ def script(ctx: click.Context, script_file: io.IOBase):
 @click.option("--out-dir", type=click.Path(path_type=pathlib.Path, file_okay=False), default=files.MEASUREMENTS_DIR)
 @click.pass_context
 def spectrum(ctx: click.Context, metadata_file: pathlib.Path, *args, **kwargs):
-    remote_controller: RemoteController = ctx.obj[REMOTE_CONTROLLER]
-    async_loop: asyncio.AbstractEventLoop = ctx.obj[ASYNC_LOOP]
+    remote_controller: SyncRemoteController = ctx.obj[REMOTE_CONTROLLER]
 
     out_dir: pathlib.Path = kwargs.pop("out_dir") # type: ignore
 
@@ -127,9 +133,7 @@ def spectrum(ctx: click.Context, metadata_file: pathlib.Path, *args, **kwargs):
     experiment_metadata = converter.structure(json_data, ExperimentMetaData)
 
     click.echo("Measuring spectrum")
-    async_loop.run_until_complete(
-        remote_controller.measure_spectrum(out_dir, spectrum_args, experiment_metadata)
-    )
+    remote_controller.measure_spectrum(out_dir, spectrum_args, experiment_metadata)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 from cmd import Cmd
 import click
-import asyncio
+from typing import List, Tuple
 
-from soniccontrol import RemoteController
+from soniccontrol.sync_remote_controller import SyncRemoteController
+from soniccontrol.builder import operator_protocol_factory
 from sonic_protocol.user_manual_compiler.manual_compiler import MarkdownManualCompiler
-from sonic_protocol.protocol import protocol
 from soniccontrol_gui.utils.animator import Animator, DotAnimationSequence, load_animation
 
 class Monitor(Cmd): 
@@ -12,10 +12,12 @@ class Monitor(Cmd):
     Input 'help' to get the manual for the device and 
     input 'exit' to leave the monitor."""
 
-    def __init__(self, remote_controller: RemoteController, event_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()):
+    def __init__(self, sync_remote_controller: SyncRemoteController):
         super().__init__()
-        self._remote_controller = remote_controller
-        self._event_loop = event_loop
+        self._sync_remote_controller = sync_remote_controller
+        self._remote_controller = sync_remote_controller.controller
+        # the compiler caches the manual, so that it is only compiled on the first call of help
+        self._manual_compiler = MarkdownManualCompiler(operator_protocol_factory)
 
         assert (self._remote_controller._device)
         self._info = self._remote_controller._device.info
@@ -41,9 +43,32 @@ class Monitor(Cmd):
     def emptyline(self) -> bool:
         return False
 
+    def _complete_command_identifier(self, line: str, begidx: int, endidx: int) -> List[str]:
+        # readline treats ? and ! as delimiters, so we complete the whole identifier and cut off the part before the text
+        assert (self._remote_controller._device)
+        # the indices refer to the line including its leading whitespace
+        stripped_line = line.lstrip()
+        offset = len(line) - len(stripped_line)
+        prefix = stripped_line[:endidx - offset]
+        identifier_trie = self._remote_controller._device.command_deserializer.identifier_trie
+        return [identifier[begidx - offset:] for identifier in identifier_trie.find_completions(prefix)]
+
+    # Cmd.complete uses parseline, that turns ?... into help ... and !... into shell ..., like onecmd.
+    # So commands starting with ? or ! are passed unchanged to completedefault
+    def parseline(self, line: str) -> Tuple[str | None, str | None, str]:
+        stripped_line = line.strip()
+        if stripped_line.startswith("?") or stripped_line.startswith("!"):
+            return "", stripped_line, stripped_line
+        return super().parseline(line)
+
+    def completenames(self, text: str, *ignored) -> List[str]:
+        return super().completenames(text, *ignored) + self._complete_command_identifier(text, 0, len(text))
+
+    def completedefault(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
+        return self._complete_command_identifier(line, begidx, endidx)
+
     def do_help(self, arg: str) -> bool | None:
-        manual_compiler = MarkdownManualCompiler()
-        manual: str = manual_compiler.compile_manual_for_specific_device(self._info.device_type, self._info.protocol_version, self._info.is_release)
+        manual: str = self._manual_compiler.compile_manual_for_specific_device(self._info.device_type, self._info.protocol_version, self._info.is_release)
         click.echo_via_pager(manual)
 
     def do_exit(self, arg: str) -> bool | None:
@@ -56,7 +81,7 @@ class Monitor(Cmd):
         return colored_delimiter.join(colored_tokens)
 
     def default(self, line: str):
-        answer_str, _, answer_valid = self._event_loop.run_until_complete(self._send_command(line))
+        answer_str, _, answer_valid = self._sync_remote_controller.run(self._send_command(line))
         if answer_valid:
             answer_colorized = self._lint_output(answer_str)
             click.echo(answer_colorized)
@@ -1,4 +1,3 @@
-import asyncio
 import attrs
 from typing import Any, Dict, Tuple, Type
 import click
@@ -10,7 +9,7 @@ from soniccontrol.procedures.procs.ramper import RamperArgs
 from soniccontrol.procedures.procs.scan import ScanArgs
 from soniccontrol.procedures.procs.tune import TuneArgs
 from soniccontrol.procedures.procs.wipe import WipeArgs
-from soniccontrol.remote_controller import RemoteController
+from soniccontrol.sync_remote_controller import SyncRemoteController
 
 
 class HolderParam(click.ParamType):
@@ -37,9 +36,8 @@ def create_procedure_command(command_str: str, procedure_type: ProcedureType,
                             proc_arg_class: Type) -> click.Command:
     @click.pass_context
     def callback(ctx: click.Context, **kwargs):
-        remote_controller: RemoteController = ctx.obj["REMOTE_CONTROLLER"]
-        async_loop: asyncio.AbstractEventLoop = ctx.obj["ASYNC_LOOP"]
-        remote_controller.execute_procedure(procedure_type, kwargs, async_loop)
+        remote_controller: SyncRemoteController = ctx.obj["REMOTE_CONTROLLER"]
+        remote_controller.execute_procedure(procedure_type, kwargs)
     
     return click.Command(
         name=command_str,
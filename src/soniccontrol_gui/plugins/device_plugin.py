@@ -4,9 +4,9 @@ import attrs
 import abc
 import tkinter as tk
 
-from sonic_protocol.protocol_list import ProtocolList
-from sonic_protocol.protocol import LatestProtocol
+from sonic_protocol.protocol_list import IProtocolFactory
 from sonic_protocol.schema import DeviceType
+from soniccontrol.builder import operator_protocol_factory
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol_gui.ui_component import UIComponent
 from soniccontrol_gui.view import View
@@ -28,7 +28,7 @@ class KnownDeviceWindowFactory(WindowFactoryBase):
 class DevicePlugin:
     device_type: DeviceType
     window_factory: WindowFactoryBase
-    protocol_factory: ProtocolList
+    protocol_factory: IProtocolFactory
 
 
 class DevicePluginRegistry:
@@ -43,7 +43,7 @@ class DevicePluginRegistry:
         return list(DevicePluginRegistry._registered_plugins)
 
 
-_operator_protocol_factory = LatestProtocol()
+_operator_protocol_factory = operator_protocol_factory
 
 DevicePluginRegistry.register_device_plugin(
     DevicePlugin(DeviceType.MVP_WORKER, KnownDeviceWindowFactory(), _operator_protocol_factory)
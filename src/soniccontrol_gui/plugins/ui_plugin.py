@@ -8,7 +8,6 @@ import ttkbootstrap as ttk
 
 # --- your existing imports (kept as-is even if unused in this snippet) ---
 from sonic_protocol.protocol_list import ProtocolList
-from sonic_protocol.protocol import LatestProtocol
 from sonic_protocol.schema import DeviceType
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol_gui.ui_component import UIComponent
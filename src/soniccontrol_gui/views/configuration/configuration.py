@@ -8,8 +8,8 @@ from tkinter import filedialog
 from typing import Callable, List, Iterable, Optional, Tuple, Any, cast
 import ttkbootstrap as ttk
 import json
-from sonic_protocol.python_parser import commands
 from sonic_protocol.schema import SIPrefix, SIUnit, Version
+from soniccontrol.config_applier import ConfigApplier, create_at_config_values
 from soniccontrol.data_capturing.converter import create_cattrs_converter_for_basic_serialization
 from soniccontrol.scripting.interpreter_engine import InterpreterEngine
 from soniccontrol.scripting.new_scripting import NewScriptingFacade
@@ -291,14 +291,21 @@ class Configuration(UIComponent):
         )
         animation.run(num_repeats=-1)
         
-        # Send data
+        # Send only the values that differ from the ones on the device
         config: TransducerConfig = self._form.attrs_object
-        for i, atconfig in enumerate(config.atconfigs):
+        config_values = [
             # i+1 because atfs start at 1 and not 0.
             # SIVar holds the primitive in .value; device commands expect primitives.
-            await self._device.execute_command(commands.SetAtf(i+1, atconfig.atf.to_prefix(SIPrefix.NONE) if atconfig.atf else 0))
-            await self._device.execute_command(commands.SetAtk(i+1, atconfig.atk))
-            await self._device.execute_command(commands.SetAtt(i+1, atconfig.att.to_prefix(SIPrefix.NONE)))
+            config_value
+            for i, atconfig in enumerate(config.atconfigs)
+            for config_value in create_at_config_values(
+                i+1, atconfig.atf.to_prefix(SIPrefix.NONE) if atconfig.atf else 0, atconfig.atk, atconfig.att.to_prefix(SIPrefix.NONE)
+            )
+        ]
+        result = await ConfigApplier(self._device, logger=self._logger).apply(config_values)
+        if not result.succeeded:
+            mismatches = ", ".join(f"{value.setter.__class__.__name__}: {actual}" for value, actual in result.mismatches)
+            MessageBox.show_error(self._view.root, f"The device did not take over all values of the transducer config ({mismatches})")
 
         if config.init_script_path is not None:
             await self._execute_init_script(config.init_script_path)
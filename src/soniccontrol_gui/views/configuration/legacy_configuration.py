@@ -8,7 +8,8 @@ import attrs
 import ttkbootstrap as ttk
 from ttkbootstrap.scrolled import ScrolledFrame
 import json
-from sonic_protocol.python_parser import commands
+from sonic_protocol.field_names import EFieldName
+from soniccontrol.config_applier import ConfigApplier, create_at_config_values
 from soniccontrol.procedures.procedure_controller import ProcedureController
 from soniccontrol.scripting.new_scripting import NewScriptingFacade
 from soniccontrol_gui.ui_component import UIComponent
@@ -319,12 +320,17 @@ class LegacyConfiguration(UIComponent):
         )
         animation.run(num_repeats=-1)
         
-        # Send data
-        for i, atconfig in enumerate(self._view.atconfigs, start=1):
-            await self._device.execute_command(commands.SetAtf(i, atconfig.atf))
-            await self._device.execute_command(commands.SetAtk(i, atconfig.atk))
-
-        await self._device.execute_command(commands.SetAtt(1, self._view.att))
+        # Send only the values that differ from the ones on the device
+        config_values = [
+            config_value
+            for i, atconfig in enumerate(self._view.atconfigs, start=1)
+            for config_value in create_at_config_values(i, atconfig.atf, atconfig.atk, self._view.att)
+            if config_value.field_name != EFieldName.ATT or i == 1 # legacy devices have only one att
+        ]
+        result = await ConfigApplier(self._device, logger=self._logger).apply(config_values)
+        if not result.succeeded:
+            mismatches = ", ".join(f"{value.setter.__class__.__name__}: {actual}" for value, actual in result.mismatches)
+            MessageBox.show_error(self._view.root, f"The device did not take over all values of the transducer config ({mismatches})")
 
         task = asyncio.create_task(self._interpreter_engine())
 
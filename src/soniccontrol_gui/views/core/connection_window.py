@@ -12,8 +12,10 @@ from soniccontrol_gui.plugins.ui_plugin import UIPluginRegistry, UIPluginSlotCom
 from soniccontrol_gui.ui_component import UIComponent
 from soniccontrol_gui.utils.widget_registry import WidgetRegistry
 from soniccontrol_gui.view import View
+from soniccontrol.app_config import PROTOCOL_CACHE_DIR
 from soniccontrol.builder import DeviceBuilder
 from soniccontrol.communication.connection import CLIConnection, Connection, SerialConnection
+from soniccontrol.device_profile_cache import DeviceProfileCache
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol.logging_utils import create_logger_for_connection
 from soniccontrol_gui.utils.animator import Animator, DotAnimationSequence, load_animation
@@ -60,7 +62,10 @@ class DeviceWindowManager:
         logger.debug("Established serial connection")
 
         protocol_factories = { plugin.device_type: plugin.protocol_factory for plugin in DevicePluginRegistry.get_device_plugins() }
-        device_builder = DeviceBuilder(protocol_factories=protocol_factories, logger=logger)
+        # The views ask often for the same values, so they are cached. The updater invalidates them, if they change
+        # Devices that were connected before are built immediately from their cached profile
+        device_builder = DeviceBuilder(protocol_factories=protocol_factories, logger=logger, use_state_cache=True,
+                                       profile_cache=DeviceProfileCache(PROTOCOL_CACHE_DIR, logger))
 
         try:
             logger.debug("Build SonicDevice for device")
@@ -101,7 +106,12 @@ class DeviceWindowManager:
             device_window = device_plugin.window_factory(sonicamp, self._root, connection.connection_name, is_legacy_device=is_legacy_device)
             self._open_device_window(device_window, connection)
         else:
-            self.open_rescue_window(sonicamp, connection)
+            device_window = self.open_rescue_window(sonicamp, connection)
+
+        profile_verification = device_builder.profile_verification
+        if profile_verification is not None and not await profile_verification:
+            # The device changed since the last connection, so it gets built again with the updated profile
+            await device_window.reconnect()
 
 
     def set_attempt_connection_callback(self, callback: Callable[[Connection], Awaitable[None]]):
@@ -5,6 +5,7 @@ import ttkbootstrap as ttk
 import tkinter as tk
 
 from sonic_protocol.command_codes import CommandCode
+from soniccontrol.broadcast_channel import DropPolicy
 from soniccontrol.data_capturing.capture import Capture
 from soniccontrol.data_capturing.capture_target import CaptureFree, CaptureProcedure, CaptureScript, CaptureSpectrumMeasure, CaptureTargets
 from soniccontrol.scripting.new_scripting import NewScriptingFacade
@@ -78,16 +79,21 @@ class DeviceWindow(UIComponent):
         else:
             self.close()
 
+    async def _close_models(self) -> None:
+        """! Stops the tasks of the models, before the communication gets closed """
+        pass
+
     @async_handler
     async def close(self) -> None:
         self._logger.info("Close window")
         self.emit(Event(DeviceWindow.CLOSE_EVENT))
         self._view.close()
+        await self._close_models()
         await self._communicator.close_communication()
 
-    @async_handler
     async def reconnect(self) -> None:
         self._logger.info("Close window")
+        await self._close_models()
         await self._communicator.close_communication(True)
         self.emit(Event(DeviceWindow.RECONNECT_EVENT))
         self._view.close()
@@ -215,8 +221,11 @@ class KnownDeviceWindow(DeviceWindow):
 
             
             self._logger.debug("add callbacks and listeners to event emitters")
-            self._updater.subscribe("update", lambda e: self._capture.on_update(e.data["status"]))
-            self._updater.subscribe("update", lambda e: self._status_bar.on_update_status(e.data["status"]))
+            # The capture must not lose any updates, but the status bar only needs to show the latest status
+            self._capture.subscribe_to_updates(self._updater)
+            self._updater.subscribe_update_channel(
+                lambda e: self._status_bar.on_update_status(e.data["status"], e.data.get("changed_fields")), DropPolicy.KEEP_LATEST
+            )
             self._updater.start()
             self.app_state.subscribe_property_listener(AppState.APP_EXECUTION_CONTEXT_PROP_NAME, self._serialmonitor.on_execution_state_changed)
             self.app_state.subscribe_property_listener(AppState.APP_EXECUTION_CONTEXT_PROP_NAME, self._configuration.on_execution_state_changed)
@@ -226,6 +235,9 @@ class KnownDeviceWindow(DeviceWindow):
             MessageBox.show_error(root, str(e))
             raise
 
+    async def _close_models(self) -> None:
+        await self._updater.close()
+
     @async_handler
     async def reconnect_after_flashing(self, success: bool):
         if success:
@@ -234,7 +246,7 @@ class KnownDeviceWindow(DeviceWindow):
             message = ui_labels.DEVICE_FLASHED_FAILED_MSG
         message_box = MessageBox.show_ok(self.view.root, message, ui_labels.DEVICE_FLASHED_TITLE)
         await message_box.wait_for_answer()
-        self.reconnect()
+        await self.reconnect()
 
 
 class DeviceWindowView(tk.Toplevel, View):
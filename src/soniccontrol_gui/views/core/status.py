@@ -1,12 +1,11 @@
 import copy
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Tuple
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Tuple
 import ttkbootstrap as ttk
 from sonic_protocol.schema import Anomaly, AnswerFieldDef, IEFieldName, Signal
 from sonic_protocol.python_parser.answer_field_converter import AnswerFieldToStringConverter
 from sonic_protocol.field_names import EFieldName
-from sonic_protocol.protocols.protocol_v1_0_0.transducer_commands.transducer_fields import field_temperature_celsius
 from soniccontrol_gui.ui_component import UIComponent
 from soniccontrol_gui.view import View
 from soniccontrol_gui.constants import (color, events, fonts, sizes,
@@ -17,6 +16,32 @@ from soniccontrol_gui.resources import images
 from soniccontrol_gui.utils.widget_registry import WidgetRegistry
 from soniccontrol_gui.views.core.custom_meter import CustomMeter
 
+
+def _get_field_temperature_celsius() -> AnswerFieldDef:
+    # imported here, so that importing the gui does not import all protocol definitions
+    from sonic_protocol.protocols.protocol_v1_0_0.transducer_commands.transducer_fields import field_temperature_celsius
+    return field_temperature_celsius
+
+
+_FIELD_LABELS: Dict[IEFieldName, str] = {
+    EFieldName.FREQUENCY: "Frequency",
+    EFieldName.SWF: "Switching Freq",
+    EFieldName.GAIN: "Gain",
+    EFieldName.IRMS: "Irms",
+    EFieldName.URMS: "Urms",
+    EFieldName.PHASE: "Phase",
+    EFieldName.TEMPERATURE: "Temperature",
+    EFieldName.TS_FLAG: "Transducer Shorted",
+    EFieldName.SIGNAL: "Signal",
+    EFieldName.PROCEDURE: "Procedure",
+    EFieldName.ERROR_CODE: "Error Code",
+    EFieldName.UNDEFINED: "Undefined",
+    EFieldName.ANOMALY_DETECTION: "Anomaly",
+    EFieldName.TRANSDUCER_STATE: "Transducer State",
+    EFieldName.SYSTEM_STATE: "System State"
+}
+
+
 class StatusBar(UIComponent):
     def __init__(self, parent: UIComponent, parent_slot: View, answer_field_defs: List[AnswerFieldDef]):
         self._logger = logging.getLogger(parent.logger.name + "." + StatusBar.__name__)
@@ -27,12 +52,13 @@ class StatusBar(UIComponent):
         }
         if EFieldName.TEMPERATURE in self._field_converters:
             # Convert mK to °C
-            self._field_converters[EFieldName.TEMPERATURE] = AnswerFieldToStringConverter(field_temperature_celsius)
+            self._field_converters[EFieldName.TEMPERATURE] = AnswerFieldToStringConverter(_get_field_temperature_celsius())
 
         self._logger.debug("Create Statusbar")
         self._view = StatusBarView(parent_slot, self._field_converters.keys())
         self._status_panel = StatusPanel(self, self._view.panel_frame, answer_field_defs)
         self._status_panel_expanded = False
+        self._status_panel_outdated = True
         super().__init__(parent, self._view, self._logger)
         self._view.set_status_clicked_command(self.on_expand_status_panel)
         self._view.expand_panel_frame(self._status_panel_expanded)
@@ -42,7 +68,11 @@ class StatusBar(UIComponent):
         self._status_panel_expanded = not self._status_panel_expanded
         self._view.expand_panel_frame(self._status_panel_expanded)
 
-    def on_update_status(self, status: Dict[IEFieldName, Any]):
+    def on_update_status(self, status: Dict[IEFieldName, Any], changed_fields: AbstractSet[IEFieldName] | None = None):
+        """!
+        @param changed_fields The fields that changed since the last update. Only their labels get updated.
+            If None, all labels get updated.
+        """
         status = copy.copy(status)
         if EFieldName.TEMPERATURE in status and (status[EFieldName.TEMPERATURE] == 404 or status[EFieldName.TEMPERATURE] == 0):
             status[EFieldName.TEMPERATURE] = float("nan")
@@ -50,32 +80,16 @@ class StatusBar(UIComponent):
             # Convert mK to °C
             temp_mC = status[EFieldName.TEMPERATURE] - 273150.0
             status[EFieldName.TEMPERATURE] = temp_mC / 1000
-        field_labels: Dict[IEFieldName, str] = {
-            EFieldName.FREQUENCY: "Frequency",
-            EFieldName.SWF: "Switching Freq",
-            EFieldName.GAIN: "Gain",
-            EFieldName.IRMS: "Irms",
-            EFieldName.URMS: "Urms",
-            EFieldName.PHASE: "Phase",
-            EFieldName.TEMPERATURE: "Temperature",
-            EFieldName.TS_FLAG: "Transducer Shorted",
-            EFieldName.SIGNAL: "Signal",
-            EFieldName.PROCEDURE: "Procedure",
-            EFieldName.ERROR_CODE: "Error Code",
-            EFieldName.UNDEFINED: "Undefined",
-            EFieldName.ANOMALY_DETECTION: "Anomaly",
-            EFieldName.TRANSDUCER_STATE: "Transducer State",
-            EFieldName.SYSTEM_STATE: "System State"
-        }
+        fields_to_update = self._field_converters.keys() if changed_fields is None else self._field_converters.keys() & changed_fields
         status_field_text_representations = {
-            field: field_labels[field] + ": " + converter.convert(status[field])
-            for field, converter in  self._field_converters.items()
+            field: _FIELD_LABELS[field] + ": " + self._field_converters[field].convert(status[field])
+            for field in fields_to_update
         }
 
         self._view.update_labels(status_field_text_representations)
 
         # update background of anomaly detection label
-        if EFieldName.ANOMALY_DETECTION in status.keys():
+        if EFieldName.ANOMALY_DETECTION in status.keys() and (changed_fields is None or EFieldName.ANOMALY_DETECTION in changed_fields):
             background = color.PRIMARY_BLUE
             anomaly_val = status[EFieldName.ANOMALY_DETECTION]
             match anomaly_val:
@@ -87,8 +101,9 @@ class StatusBar(UIComponent):
                     background = color.WARNING_ORANGE
             self._view.set_label_background(EFieldName.ANOMALY_DETECTION, background)
 
-        if self._status_panel_expanded:
+        if self._status_panel_expanded and (changed_fields is None or changed_fields or self._status_panel_outdated):
             self._status_panel.on_update_status(status)
+        self._status_panel_outdated = not self._status_panel_expanded
 
 
 class StatusPanel(UIComponent):
@@ -100,7 +115,7 @@ class StatusPanel(UIComponent):
         }
         if EFieldName.TEMPERATURE in self._field_converters:
             # Convert mK to °C
-            self._field_converters[EFieldName.TEMPERATURE] = AnswerFieldToStringConverter(field_temperature_celsius)
+            self._field_converters[EFieldName.TEMPERATURE] = AnswerFieldToStringConverter(_get_field_temperature_celsius())
         self._field_names = self._field_converters.keys()
 
         self._view = StatusPanelView(parent_slot)
@@ -538,7 +538,7 @@ class SITypeFieldView(FieldViewBase[Union[SIVar, Optional[SIVar]]]):
                     try:
                         scaled_value = self._value_type(float(value))
                         if self._abstract_si_var:
-                            self._value = self._si_var_class(value=scaled_value, si_prefix=SIPrefix.NONE, si_meta=self._si_var_meta)
+                            self._value = self._si_var_class(value=scaled_value, si_prefix=SIPrefix.NONE, meta=self._si_var_meta)
                         else:
                             self._value = self._si_var_class(value=scaled_value, si_prefix=SIPrefix.NONE)
                         self._update_str_value_without_trace(str(scaled_value))
@@ -861,7 +861,7 @@ class SITypeFieldView(FieldViewBase[Union[SIVar, Optional[SIVar]]]):
                 if self._abstract_si_var:
                     self._value.meta = self._si_var_meta
             elif self._abstract_si_var:
-                self._value = self._si_var_class(value, current_prefix, si_meta=self._si_var_meta)
+                self._value = self._si_var_class(value, current_prefix, meta=self._si_var_meta)
             else:
                 self._value = self._si_var_class(value, current_prefix)
 
@@ -1420,7 +1420,9 @@ class DynamicFieldViewFactory:
                 # The concrete subclasses like AtfSiVar, AttSiVar have defaults, but we'll be explicit
                 if hasattr(field_type, '_si_meta') or (inspect.isclass(field_type) and issubclass(field_type, SIVar)):
                     # It's a concrete SIVar subclass - create with explicit defaults
-                    kwargs['default_value'] = field_type(value=0, si_prefix=SIPrefix.NONE)
+                    # SIVar itself has no meta, which is fine for generic fields, like the ones of DictFieldView
+                    with SIVar.allow_missing_meta():
+                        kwargs['default_value'] = field_type(value=0, si_prefix=SIPrefix.NONE)
             return SITypeFieldView(slot, field_name, parent_widget_name=parent_widget_name, top_scroll_frame=top_scroll_frame, **kwargs)
         elif get_origin(field_type) is Union and len(get_args(field_type)) == 2 and type(None) in get_args(field_type):
             # Handle Optional[SomeType] which is Union[SomeType, None]
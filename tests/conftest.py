@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+
+class FakeClock:
+    """ Monotonic clock, that only advances by setting now, sleeping or by tick on every read """
+    def __init__(self, start: float = 0., tick: float = 0.) -> None:
+        self.now = start
+        self.tick = tick
+
+    def __call__(self) -> float:
+        self.now += self.tick
+        return self.now
+
+    async def sleep(self, duration_s: float) -> None:
+        self.now += duration_s
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def fake_clock_start() -> float:
+    """ Override this fixture in a test module to start the fake clock at another time """
+    return 0.
+
+
+@pytest.fixture
+def fake_clock_tick() -> float:
+    """ Override this fixture in a test module to advance the fake clock on every read """
+    return 0.
+
+
+@pytest.fixture
+def fake_clock(fake_clock_start: float, fake_clock_tick: float) -> FakeClock:
+    return FakeClock(fake_clock_start, fake_clock_tick)
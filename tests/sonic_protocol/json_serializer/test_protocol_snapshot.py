@@ -0,0 +1,69 @@
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.json_serializer.protocol_snapshot import (
+    LazyCommandContracts, ProtocolSnapshotDecoder, ProtocolSnapshotStore, dump_protocol_snapshot, load_protocol_snapshot
+)
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.schema import DeviceType, ProtocolType, Version
+
+
+@pytest.mark.parametrize("protocol_type", [
+    ProtocolType(protocol_list.version, DeviceType.MVP_WORKER),
+    ProtocolType(protocol_list.version, DeviceType.DESCALE, is_release=True),
+    ProtocolType(Version(1, 0, 0), DeviceType.CRYSTAL),
+    ProtocolType(Version(1, 0, 0), DeviceType.UNKNOWN, is_release=True),
+])
+def test_protocol_snapshot_round_trip(protocol_type):
+    protocol = protocol_list.build_protocol_for(protocol_type)
+
+    loaded_protocol = load_protocol_snapshot(dump_protocol_snapshot(protocol))
+
+    assert isinstance(loaded_protocol.command_contracts, LazyCommandContracts)
+    assert list(loaded_protocol.command_contracts) == list(protocol.command_contracts)
+    assert loaded_protocol == protocol
+
+
+def test_lazy_command_contracts_decode_on_access():
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    loaded_protocol = load_protocol_snapshot(dump_protocol_snapshot(protocol))
+    command_contracts = loaded_protocol.command_contracts
+
+    command_contract = command_contracts[CommandCode.GET_UPDATE]
+
+    assert command_contract == protocol.command_contracts[CommandCode.GET_UPDATE]
+    assert command_contracts[CommandCode.GET_UPDATE] is command_contract
+    del command_contracts[CommandCode.GET_UPDATE]
+    assert CommandCode.GET_UPDATE not in command_contracts
+
+
+@pytest.mark.parametrize("type_name, encoded_value", [
+    ("builtins:exec", {"a": 0, "f": {}}),
+    ("builtins:eval", {"s": 0, "v": "1"}),
+    ("builtins:exec", {"c": 0}),
+    ("builtins:str", {"a": 0, "f": {}}),
+    ("builtins:float", {"s": 0, "v": "1"}),
+    ("sonic_protocol.json_serializer.protocol_snapshot:load_protocol_snapshot", {"a": 0, "f": {}}),
+    ("os:system", {"s": 0, "v": "true"}),
+])
+def test_snapshot_decoder_rejects_tampered_types(type_name, encoded_value):
+    decoder = ProtocolSnapshotDecoder([type_name])
+
+    with pytest.raises(ValueError):
+        decoder.decode_value(encoded_value)
+
+
+def test_snapshot_store_builds_protocol_only_once(tmp_path):
+    build_calls = []
+    class CountingProtocolList:
+        def build_protocol_for(self, protocol_type):
+            build_calls.append(protocol_type)
+            return protocol_list.build_protocol_for(protocol_type)
+    protocol_type = ProtocolType(protocol_list.version, DeviceType.MVP_WORKER)
+
+    protocol = ProtocolSnapshotStore(tmp_path, CountingProtocolList).build_protocol_for(protocol_type)
+    loaded_protocol = ProtocolSnapshotStore(tmp_path, CountingProtocolList).build_protocol_for(protocol_type)
+
+    assert len(build_calls) == 1
+    assert len(list(tmp_path.iterdir())) == 1
+    assert loaded_protocol == protocol
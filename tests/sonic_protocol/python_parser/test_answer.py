@@ -0,0 +1,22 @@
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser.answer import Answer
+
+
+def test_answers_do_not_share_their_field_value_dict():
+    first_answer = Answer("error", False, True)
+    second_answer = Answer("error", False, True)
+
+    first_answer.field_value_dict[EFieldName.FREQUENCY] = 1000
+
+    assert second_answer.field_value_dict == {}
+
+
+def test_answer_from_field_values_creates_dict_on_demand():
+    field_indices = {EFieldName.FREQUENCY: 0, EFieldName.GAIN: 1}
+    answer = Answer.from_field_values("1000#50", field_indices, (1000, 50))
+
+    assert answer.get_value(EFieldName.GAIN) == 50
+    assert answer.get_value(EFieldName.SWF, 3) == 3
+    assert answer.field_value_dict == {EFieldName.FREQUENCY: 1000, EFieldName.GAIN: 50}
+    assert answer.field_value_dict is answer.field_value_dict
+    assert answer == Answer("1000#50", True, True, field_value_dict={EFieldName.FREQUENCY: 1000, EFieldName.GAIN: 50})
@@ -0,0 +1,86 @@
+import re
+import time
+
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.answer import AnswerValidator
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.python_parser.converters import get_converter
+from sonic_protocol.schema import ConverterType, DeviceType, ProtocolType
+
+
+@pytest.fixture(scope="module")
+def update_validator() -> AnswerValidator:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    return AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls)
+
+
+UPDATE_ANSWER = "idle#1000000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok"
+
+
+def test_update_answer_gets_mapped_to_fields(update_validator: AnswerValidator):
+    answer = update_validator.validate(UPDATE_ANSWER)
+
+    assert answer.valid
+    assert answer.get_value(EFieldName.FREQUENCY) == 1000000
+    assert answer.get_value(EFieldName.GAIN) == 100
+
+
+@pytest.mark.parametrize("message", [
+    "garbage" + UPDATE_ANSWER,
+    UPDATE_ANSWER + "garbage",
+    UPDATE_ANSWER + "#ok",
+    UPDATE_ANSWER.replace("idle", "id#le"),
+])
+def test_update_answer_must_match_completely(update_validator: AnswerValidator, message: str):
+    assert not update_validator.validate(message).valid
+
+
+@pytest.mark.parametrize("message", [
+    "#" * 5000,
+    "1" * 5000 + "#" * 5000,
+    "idle#" + " " * 5000 + "1 Hz",
+    ("idle#1000000 Hz#" * 500) + "\n",
+])
+def test_malformed_answers_are_rejected_fast(update_validator: AnswerValidator, message: str):
+    start = time.perf_counter()
+    answer = update_validator.validate(message)
+    duration = time.perf_counter() - start
+
+    assert not answer.valid
+    assert duration < 0.1
+
+
+def test_bool_fields_have_only_one_group():
+    validator = AnswerValidator(
+        r"\A(true|false|0|1)#([\+\-]?\d+)\Z",
+        EFieldName,
+        {
+            EFieldName.SIGNAL: get_converter(ConverterType.PRIMITIVE, bool),
+            EFieldName.FREQUENCY: get_converter(ConverterType.PRIMITIVE, int),
+        }
+    )
+
+    answer = validator.validate("TRUE#-5")
+
+    assert answer.valid
+    assert answer.field_value_dict == {EFieldName.SIGNAL: True, EFieldName.FREQUENCY: -5}
+
+
+def test_validator_raises_if_groups_and_converters_do_not_match():
+    with pytest.raises(ValueError):
+        AnswerValidator(r"\A((a)|(b))\Z", EFieldName, {EFieldName.SIGNAL: get_converter(ConverterType.PRIMITIVE, str)})
+
+
+def test_all_answer_regexes_have_one_group_per_field():
+    for device_type in DeviceType:
+        if not protocol_list.supports_device_type(device_type):
+            continue
+        protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, device_type))
+        for command_contract in protocol.command_contracts.values():
+            regex = AnswerValidatorBuilder._create_regex_for_answer(command_contract.answer_def)
+            assert re.compile(regex).groups == len(command_contract.answer_def.fields)
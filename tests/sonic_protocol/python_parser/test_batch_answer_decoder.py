@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.answer_validator_builder import AnswerValidatorBuilder
+from sonic_protocol.python_parser.batch_answer_decoder import BatchAnswerDecoder
+from sonic_protocol.schema import DeviceType, ProtocolType, TransducerState
+
+
+@pytest.fixture
+def protocol():
+    return protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+
+
+def test_batch_decoder_decodes_like_answer_validator(protocol):
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    lines = [
+        "idle#1000000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "BUSY#-5 Hz#+7 %#NONE#300000 mK#1000 uV#2000 uA#45000 u°#off#123 uV#submerged#ok",
+        "garbage idle#1000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle#1000000 HZ#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle#1000000 Hz#300 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle#abc Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle#1000000 Hz#100 %#none",
+        # the units are only removed at the end of the values
+        "idle#1000 Hz Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle# Hz1000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "idle#1000000 Hz# %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+    ]
+    validator = AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls)
+    decoder = BatchAnswerDecoder(answer_def, protocol.field_name_cls)
+
+    result, valid = decoder.decode(lines)
+
+    for i, line in enumerate(lines):
+        answer = validator.validate(line)
+        assert valid[i] == answer.valid
+        if answer.valid:
+            for field_name, value in answer.field_value_dict.items():
+                assert result[field_name.name][i] == value
+
+
+def test_batch_decoder_creates_dataframe_of_valid_lines(protocol):
+    answer_def = protocol.command_contracts[CommandCode.GET_UPDATE].answer_def
+    lines = [
+        "idle#1000000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+        "invalid line",
+        "busy#2000000 Hz#50 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok",
+    ]
+    decoder = BatchAnswerDecoder(answer_def, protocol.field_name_cls)
+
+    df = decoder.decode_to_dataframe(lines)
+
+    assert len(df) == 2
+    assert df[EFieldName.FREQUENCY.name].tolist() == [1000000, 2000000]
+    assert df[EFieldName.FREQUENCY.name].dtype == np.uint32
+    assert df[EFieldName.TRANSDUCER_STATE.name].tolist() == [TransducerState.IDLE, TransducerState.BUSY]
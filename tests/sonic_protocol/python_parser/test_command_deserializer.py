@@ -0,0 +1,44 @@
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.command_deserializer import CommandDeserializer
+from sonic_protocol.schema import DeviceType, ProtocolType
+
+
+@pytest.fixture
+def deserializer():
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    return CommandDeserializer(protocol)
+
+
+@pytest.mark.parametrize("command_str, expected_code, expected_args", [
+    ("!f=1000", CommandCode.SET_FREQ, {"value": 1000}),
+    ("!frequency=1000", CommandCode.SET_FREQ, {"value": 1000}),
+    ("?atf2", CommandCode.GET_ATF, {"index": 2}),
+    ("!atf3=10000", CommandCode.SET_ATF, {"index": 3, "value": 10000}),
+    ("!ON", CommandCode.SET_ON, {}),
+    ("-", CommandCode.GET_UPDATE, {}),
+])
+def test_deserialize_command_returns_code_index_and_value(deserializer, command_str, expected_code, expected_args):
+    command = deserializer.deserialize_command(command_str)
+
+    assert command is not None
+    assert command.code == expected_code
+    assert command.args == expected_args
+    assert deserializer.get_deserialized_command_code(command_str) == expected_code
+
+
+def test_deserialize_command_returns_none_for_unknown_identifiers(deserializer):
+    assert deserializer.deserialize_command("!unknown_command=3") is None
+    assert deserializer.get_deserialized_command_code("!unknown_command=3") is None
+
+
+def test_identifier_trie_completes_prefixes(deserializer):
+    completions = deserializer.identifier_trie.find_completions("!fr")
+
+    assert completions == sorted(completions)
+    assert "!freq" in completions
+    assert "!frequency" in completions
+    assert all(completion.startswith("!fr") for completion in completions)
+    assert deserializer.identifier_trie.find_completions("!xyz") == []
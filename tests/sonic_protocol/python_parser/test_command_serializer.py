@@ -0,0 +1,25 @@
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser import commands as cmds
+from sonic_protocol.python_parser.command_deserializer import DeserializedCommand
+from sonic_protocol.python_parser.command_serializer import CommandSerializer
+from sonic_protocol.schema import DeviceType, ProtocolType
+
+
+@pytest.fixture
+def serializer():
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    return CommandSerializer(protocol)
+
+
+@pytest.mark.parametrize("command, expected", [
+    (cmds.SetFrequency(120000), "!f=120000"),
+    (cmds.SetAtf(2, 10000), "!atf2=10000"),
+    (cmds.GetAtf(3), "?atf3"),
+    (cmds.SetOn(), "!ON"),
+    (DeserializedCommand(CommandCode.SET_ATF, {"index": 1, "value": 500}), "!atf1=500"),
+])
+def test_serialize_command(serializer, command, expected):
+    assert serializer.serialize_command(command) == expected
@@ -0,0 +1,41 @@
+import pytest
+
+from sonic_protocol.protocols.protocol_v2_0_0.commands import DeviceState
+from sonic_protocol.python_parser.converters import EnumConverter, get_converter
+from sonic_protocol.schema import ConverterType, TransducerState
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("idle", TransducerState.IDLE),
+    ("IDLE", TransducerState.IDLE),
+    ("not connected", TransducerState.TRANSDUCER_NOT_CONNECTED),
+    ("Transducer_Not_Connected", TransducerState.TRANSDUCER_NOT_CONNECTED),
+])
+def test_enum_converter_matches_values_and_names_case_insensitive(text, expected):
+    converter = EnumConverter(TransducerState)
+
+    assert converter.validate_str(text)
+    assert converter.convert_str_to_val(text) is expected
+
+
+def test_enum_converter_converts_int_enums():
+    converter = EnumConverter(DeviceState)
+
+    assert converter.validate_str("2")
+    assert converter.convert_str_to_val("2") is DeviceState.READY
+
+
+def test_enum_converter_rejects_unknown_members():
+    converter = EnumConverter(TransducerState)
+
+    assert not converter.validate_str("exploded")
+    with pytest.raises(ValueError):
+        converter.convert_str_to_val("exploded")
+
+
+def test_get_converter_shares_converters_per_target_class():
+    converter = get_converter(ConverterType.ENUM, TransducerState)
+
+    assert get_converter(ConverterType.ENUM, TransducerState) is converter
+    assert get_converter(ConverterType.ENUM, DeviceState) is not converter
+    assert get_converter(ConverterType.PRIMITIVE, int) is get_converter(ConverterType.PRIMITIVE, int)
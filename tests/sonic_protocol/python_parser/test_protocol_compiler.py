@@ -0,0 +1,80 @@
+import pytest
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser import commands as cmds
+from sonic_protocol.python_parser.answer_validator_builder import MAX_DIGITS, MAX_VALUE_LENGTH, AnswerValidatorBuilder
+from sonic_protocol.python_parser.command_deserializer import CommandDeserializer
+from sonic_protocol.python_parser.command_serializer import CommandSerializer
+from sonic_protocol.python_parser.protocol_compiler import ProtocolCompiler
+from sonic_protocol.schema import DeviceType, ProtocolType
+
+
+@pytest.fixture
+def protocol():
+    return protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+
+
+@pytest.fixture
+def compiled_protocol(protocol, tmp_path):
+    return ProtocolCompiler(tmp_path).load_or_compile(protocol)
+
+
+UPDATE_ANSWER = "idle#1000000 Hz#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok"
+
+
+@pytest.mark.parametrize("code, message", [
+    (CommandCode.GET_UPDATE, UPDATE_ANSWER),
+    (CommandCode.GET_UPDATE, "IDLE#1000000 Hz#100 %#NONE#300000 mK#1000 uV#2000 uA#45000 u°#on#123 uV#submerged#ok"),
+    (CommandCode.GET_UPDATE, "garbage " + UPDATE_ANSWER),
+    (CommandCode.GET_UPDATE, "idle#1000000 HZ#100 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok"),
+    (CommandCode.GET_UPDATE, "idle#1000000 Hz#300 %#none#300000 mK#1000 uV#2000 uA#45000 u°#ON#123 uV#submerged#ok"),
+    (CommandCode.GET_UPDATE, "idle#1000000 Hz#100 %#none"),
+    # values beyond the bounds of the regexes
+    (CommandCode.GET_UPDATE, UPDATE_ANSWER.replace("#1000000 Hz#", "#" + "1" * (MAX_DIGITS + 1) + " Hz#")),
+    (CommandCode.GET_UPDATE, "x" * (MAX_VALUE_LENGTH + 1) + UPDATE_ANSWER[4:]),
+    (CommandCode.GET_ATK, "1" * MAX_DIGITS),
+    (CommandCode.GET_ATK, "1" * 25),
+    (CommandCode.GET_ATK, "1" * 5000),
+    (CommandCode.GET_ATK, "1." + "1" * (MAX_DIGITS + 1)),
+    (CommandCode.GET_HELP, "h" * MAX_VALUE_LENGTH),
+    (CommandCode.GET_HELP, "h" * 1100),
+    (CommandCode.GET_TRANSDUCER_ID, "t" * 1100),
+])
+def test_compiled_answer_validator_behaves_like_regex_validator(protocol, compiled_protocol, code, message):
+    answer_def = protocol.command_contracts[code].answer_def
+    regex_validator = AnswerValidatorBuilder.create_answer_validator(answer_def, protocol.field_name_cls)
+
+    assert compiled_protocol.answer_validators[code].validate(message) == regex_validator.validate(message)
+
+
+@pytest.mark.parametrize("command", [
+    cmds.SetFrequency(120000), cmds.SetAtf(2, 10000), cmds.GetAtf(3), cmds.SetOn(), cmds.GetUpdate(),
+])
+def test_compiled_serializer_behaves_like_command_serializer(protocol, compiled_protocol, command):
+    assert compiled_protocol.serialize_command(command) == CommandSerializer(protocol).serialize_command(command)
+
+
+def test_compiled_protocol_is_cached_by_protocol_hash(protocol, tmp_path):
+    compiled_protocol = ProtocolCompiler(tmp_path).load_or_compile(protocol)
+    cache_files = list(tmp_path.iterdir())
+
+    assert len(cache_files) == 1
+    assert compiled_protocol.protocol_hash in cache_files[0].name
+
+    ProtocolCompiler(tmp_path).load_or_compile(protocol)
+    assert list(tmp_path.iterdir()) == cache_files
+
+
+def test_compiled_protocol_is_reused_for_an_equal_protocol(protocol, tmp_path):
+    compiled_protocol = ProtocolCompiler(tmp_path).load_or_compile(protocol)
+    rebuilt_protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+
+    assert rebuilt_protocol is not protocol
+    assert ProtocolCompiler(tmp_path).load_or_compile(rebuilt_protocol) is compiled_protocol
+
+
+def test_compiled_serializer_serializes_deserialized_commands(protocol, compiled_protocol):
+    command = CommandDeserializer(protocol).deserialize_command("!f=120000")
+
+    assert compiled_protocol.serialize_command(command) == "!f=120000"
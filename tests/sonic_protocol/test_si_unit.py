@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import ABSOLUTE_FREQUENCY_META, AbsoluteFrequencySIVar, SIVar, convert_array_to_prefix
+
+
+def test_sivar_without_meta_raises():
+    with pytest.raises(ValueError):
+        SIVar(1000, SIPrefix.NONE)
+
+
+def test_sivar_without_meta_can_be_created_explicitly():
+    si_var = SIVar.from_deserialization(1000, SIPrefix.KILO)
+    assert si_var.meta is None
+    assert si_var.value == 1000
+
+    with SIVar.allow_missing_meta():
+        assert SIVar(5, SIPrefix.NONE).meta is None
+
+    with pytest.raises(ValueError):
+        SIVar(1000, SIPrefix.NONE)
+
+
+def test_sivar_subclasses_get_class_meta():
+    si_var = AbsoluteFrequencySIVar(2, SIPrefix.MEGA)
+
+    assert si_var.meta is ABSOLUTE_FREQUENCY_META
+    assert si_var.to_prefix(SIPrefix.KILO) == 2000
+    assert isinstance(si_var, SIVar)
+    assert issubclass(SIVar, SIVar)
+
+
+def test_si_prefix_ordering_and_factor():
+    assert SIPrefix.MILLI < SIPrefix.NONE <= SIPrefix.NONE < SIPrefix.KILO
+    assert SIPrefix.MEGA >= SIPrefix.KILO > SIPrefix.MICRO
+    assert SIPrefix.KILO.factor == 1000
+    assert SIPrefix.NONE.factor == 1
+    assert SIPrefix.MILLI.factor == 10 ** -3
+
+
+@pytest.mark.parametrize("from_prefix, to_prefix", [
+    (SIPrefix.MEGA, SIPrefix.NONE), (SIPrefix.NONE, SIPrefix.KILO), (SIPrefix.KILO, SIPrefix.KILO),
+])
+def test_convert_array_to_prefix_matches_scalar_conversion(from_prefix, to_prefix):
+    values = [1.0, 2.5, 5.0, 7.25]
+
+    result = convert_array_to_prefix(values, from_prefix, to_prefix)
+
+    expected = [SIVar.from_deserialization(value, from_prefix).to_prefix(to_prefix) for value in values]
+    assert result.tolist() == expected
+
+
+def test_convert_array_to_prefix_keeps_integers_for_smaller_prefix():
+    result = convert_array_to_prefix(np.array([1, 2]), SIPrefix.MEGA, SIPrefix.NONE)
+
+    assert np.issubdtype(result.dtype, np.integer)
+    assert result.tolist() == [1_000_000, 2_000_000]
+
+
+def test_convert_array_to_prefix_validates_range():
+    assert convert_array_to_prefix([100, 10_000], SIPrefix.KILO, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META).tolist() == [100_000, 10_000_000]
+
+    with pytest.raises(ValueError):
+        convert_array_to_prefix([100, 10_001], SIPrefix.KILO, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META)
+    with pytest.raises(ValueError):
+        convert_array_to_prefix([100], SIPrefix.MILLI, SIPrefix.NONE, ABSOLUTE_FREQUENCY_META)
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.schema import DeviceType, Version
+from sonic_protocol.user_manual_compiler import FileType, build_all_manuals, create_manual_compiler, get_all_manual_variants, get_manual_file_name
+
+
+class CountingProtocolFactory:
+    def __init__(self):
+        self.num_builds = 0
+
+    def build_protocol_for(self, protocol_type):
+        self.num_builds += 1
+        return protocol_list.build_protocol_for(protocol_type)
+
+
+@pytest.mark.parametrize("file_type", list(FileType))
+def test_compiled_manual_is_cached_per_protocol_type(file_type):
+    protocol_factory = CountingProtocolFactory()
+    compiler = create_manual_compiler(file_type, protocol_factory)
+
+    manual = compiler.compile_manual_for_specific_device(DeviceType.MVP_WORKER, Version(2, 0, 0), False)
+    assert compiler.compile_manual_for_specific_device(DeviceType.MVP_WORKER, Version(2, 0, 0), False) is manual
+    assert protocol_factory.num_builds == 1
+
+    compiler.compile_manual_for_specific_device(DeviceType.MVP_WORKER, Version(2, 0, 0), True)
+    assert protocol_factory.num_builds == 2
+
+
+@pytest.mark.parametrize("file_type", list(FileType))
+def test_written_manual_equals_compiled_manual(file_type):
+    stream = io.StringIO()
+
+    create_manual_compiler(file_type).write_manual_for_specific_device(stream, DeviceType.DESCALE, Version(2, 0, 0), True)
+
+    manual = create_manual_compiler(file_type).compile_manual_for_specific_device(DeviceType.DESCALE, Version(2, 0, 0), True)
+    assert stream.getvalue() == manual
+    assert not manual.startswith("Error")
+
+
+def test_build_all_manuals(tmp_path):
+    files = build_all_manuals(tmp_path, [FileType.MARKDOWN], max_workers=2)
+
+    assert len(files) == len(get_all_manual_variants())
+    assert (tmp_path / get_manual_file_name(DeviceType.CRYSTAL, Version(1, 0, 0), True, FileType.MARKDOWN)) in files
+    for file in files:
+        assert not file.read_text(encoding="utf-8").startswith("Error")
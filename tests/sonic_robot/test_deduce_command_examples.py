@@ -0,0 +1,49 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from sonic_protocol.command_codes import CommandCode
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.schema import DeviceType, ProtocolType, Version
+import sonic_robot.deduce_command_examples as deduce
+
+
+PROTOCOL_TYPE = ProtocolType(Version(1, 0, 0), DeviceType.MVP_WORKER)
+
+
+def test_command_examples_contain_expected_answers(tmp_path: Path):
+    command_examples = deduce.get_command_examples(PROTOCOL_TYPE, tmp_path)
+
+    get_gain_examples = [example for example in command_examples if example.command_code == CommandCode.GET_GAIN.value]
+    assert len(get_gain_examples) > 0
+    assert get_gain_examples[0].validate_answer("50 %") == {"GAIN": "50"}
+    assert get_gain_examples[0].validate_answer("garbage") is None
+
+
+def test_command_examples_are_loaded_from_cache(tmp_path: Path):
+    command_examples = deduce.get_command_examples(PROTOCOL_TYPE, tmp_path)
+    assert len(list(tmp_path.glob("command_examples_*.json"))) == 1
+
+    deduce._command_examples_cache.clear()
+    with patch.object(deduce, "_build_protocol") as build_protocol:
+        cached_command_examples = deduce.get_command_examples(PROTOCOL_TYPE, tmp_path)
+    
+    build_protocol.assert_not_called()
+    assert cached_command_examples == command_examples
+
+
+def test_generated_examples_match_deduced_examples():
+    protocol = protocol_list.build_protocol_for(PROTOCOL_TYPE)
+    command_examples = deduce.generate_command_examples(protocol)
+
+    assert [example.command for example in command_examples] \
+        == deduce.deduce_command_examples(PROTOCOL_TYPE.version, PROTOCOL_TYPE.device_type)
+
+
+def test_cache_is_not_used_after_the_answer_regex_builder_changed(tmp_path: Path):
+    deduce.get_command_examples(PROTOCOL_TYPE, tmp_path)
+
+    deduce._command_examples_cache.clear()
+    with patch.object(deduce, "_compute_answer_pattern_fingerprint", return_value="changed"):
+        deduce.get_command_examples(PROTOCOL_TYPE, tmp_path)
+
+    assert len(list(tmp_path.glob("command_examples_*.json"))) == 2
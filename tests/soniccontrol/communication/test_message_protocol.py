@@ -0,0 +1,18 @@
+from soniccontrol.communication.message_protocol import SonicMessageProtocol
+
+
+class NewlineMessageProtocol(SonicMessageProtocol):
+    @property
+    def separator(self) -> str:
+        return "\n"
+
+
+def test_encoded_request_is_the_parsed_request():
+    message_protocol = SonicMessageProtocol()
+
+    assert message_protocol.encode_request("!f=120000", 7) == message_protocol.parse_request("!f=120000", 7).encode()
+    assert message_protocol.encode_request(b"?atf1", 8) == b"COM#8=?atf1\r"
+
+
+def test_encoded_request_ends_with_the_separator_of_the_protocol():
+    assert NewlineMessageProtocol().encode_request("!ON", 1) == b"COM#1=!ON\n"
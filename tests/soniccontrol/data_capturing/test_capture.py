@@ -0,0 +1,60 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.schema import Version
+from soniccontrol.broadcast_channel import BroadcastChannel, DropPolicy
+from soniccontrol.data_capturing.capture import Capture
+from soniccontrol.data_capturing.experiment import Experiment, ExperimentMetaData
+from soniccontrol.device_data import FirmwareInfo
+from soniccontrol.events import Event
+
+
+class FakeUpdater:
+    def __init__(self) -> None:
+        self.channel: BroadcastChannel[Event] = BroadcastChannel()
+
+    def subscribe_update_channel(self, listener, drop_policy: DropPolicy = DropPolicy.KEEP_LATEST, max_queue_size: int = 100):
+        return self.channel.subscribe(listener, drop_policy, max_queue_size)
+
+    async def unsubscribe_update_channel(self, subscription) -> None:
+        await self.channel.unsubscribe(subscription)
+
+
+@pytest.mark.asyncio
+async def test_queued_updates_are_captured_before_the_capture_ends(tmp_path: Path):
+    updater = FakeUpdater()
+    capture = Capture(tmp_path)
+    capture.subscribe_to_updates(updater) # type: ignore
+    experiment = Experiment(
+        metadata=ExperimentMetaData(
+            experiment_name="Capture test", authors=["test"], transducer_id="T", add_on_id="A", connector_type="CABLE", medium="WATER"
+        ),
+        firmware_info=FirmwareInfo(),
+        sonic_control_version=Version(0, 0, 0),
+        operating_system="Linux"
+    )
+    await capture.start_capture(experiment)
+
+    start = datetime.datetime(2024, 1, 1)
+    for i in range(5):
+        status = {EFieldName.FREQUENCY: 100_000 + i, EFieldName.TIMESTAMP: start + datetime.timedelta(seconds=i)}
+        await updater.channel.publish(Event("update", status=status))
+    await capture.end_capture()
+
+    assert capture.data_provider.data[EFieldName.FREQUENCY.name].tolist() == [100_000 + i for i in range(5)]
+    await updater.channel.close()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_from_updates_removes_the_subscription(tmp_path: Path):
+    updater = FakeUpdater()
+    capture = Capture(tmp_path)
+    capture.subscribe_to_updates(updater) # type: ignore
+
+    await capture.unsubscribe_from_updates()
+
+    assert updater.channel.subscriptions == []
+    await updater.channel.close()
@@ -0,0 +1,23 @@
+import datetime
+from pathlib import Path
+
+import numpy as np
+
+from soniccontrol.data_capturing.experiment_store import HDF5ExperimentReader, HDF5ExperimentWriter
+from soniccontrol.procedures.procs.spectrum_measure import create_spectrum_result
+
+
+def test_add_block_writes_all_rows(tmp_path: Path):
+    spectrum = create_spectrum_result(np.array([100_000, 110_000, 120_000]))
+    spectrum["frequency"] = spectrum["commanded_frequency"]
+    spectrum["urms"] = [10, 20, 30]
+    spectrum["timestamp"] = datetime.datetime(2024, 5, 1, 12, 0, 0).timestamp()
+
+    writer = HDF5ExperimentWriter(tmp_path / "spectrum")
+    writer.add_block(spectrum)
+    writer.close()
+    data = HDF5ExperimentReader(tmp_path / "spectrum.h5").read_data()
+
+    assert data["frequency"].tolist() == [100_000, 110_000, 120_000]
+    assert data["urms"].tolist() == [10, 20, 30]
+    assert data["timestamp"][0] == b"2024-05-01T12:00:00"
@@ -0,0 +1,75 @@
+from typing import List
+
+import pytest
+
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import AbsoluteFrequencySIVar, RelativeFrequencySIVar
+from soniccontrol.precise_timer import PreciseTimer
+from soniccontrol.procedures.holder import HolderArgs
+from soniccontrol.procedures.procs.ramper import RamperArgs, RamperLocal
+
+
+class SlowDevice:
+    """ Every command takes 1 ms """
+    def __init__(self, clock) -> None:
+        self.clock = clock
+        self.frequency_set_at: List[float] = []
+
+    async def execute_command(self, command: Command, **kwargs) -> None:
+        if isinstance(command, commands.SetFrequency):
+            self.frequency_set_at.append(self.clock.now)
+        self.clock.now += 0.001
+
+    async def set_signal_on(self) -> None:
+        self.clock.now += 0.001
+
+    async def set_signal_off(self) -> None:
+        self.clock.now += 0.001
+
+
+@pytest.mark.asyncio
+async def test_local_ramp_holds_short_on_times_despite_command_latency(fake_clock):
+    device = SlowDevice(fake_clock)
+    ramper = RamperLocal(PreciseTimer(busy_wait_s=0., clock=fake_clock, sleep=fake_clock.sleep))
+    args = RamperArgs(
+        f_start=AbsoluteFrequencySIVar(100, SIPrefix.KILO),
+        f_stop=AbsoluteFrequencySIVar(109, SIPrefix.KILO),
+        f_step=RelativeFrequencySIVar(1, SIPrefix.KILO),
+        t_on=HolderArgs(3, "ms"),
+        t_off=HolderArgs(2, "ms"),
+    )
+
+    await ramper.execute(device, args) # type: ignore
+
+    # Each step sends two commands before the hold, but the steps stay on the 5 ms grid
+    assert device.frequency_set_at == pytest.approx([0.001 + i * 0.005 for i in range(10)])
+    assert ramper.timing_statistics.number_of_waits == 20
+    assert ramper.timing_statistics.missed_deadlines == 0
+
+
+@pytest.mark.asyncio
+async def test_local_ramp_is_reanchored_after_a_stall(fake_clock):
+    device = SlowDevice(fake_clock)
+    ramper = RamperLocal(PreciseTimer(busy_wait_s=0., clock=fake_clock, sleep=fake_clock.sleep))
+    args = RamperArgs(
+        f_start=AbsoluteFrequencySIVar(100, SIPrefix.KILO),
+        f_stop=AbsoluteFrequencySIVar(103, SIPrefix.KILO),
+        f_step=RelativeFrequencySIVar(1, SIPrefix.KILO),
+        t_on=HolderArgs(3, "ms"),
+        t_off=HolderArgs(0, "ms"),
+    )
+    execute_command = device.execute_command
+
+    async def stall_at_second_step(command: Command, **kwargs) -> None:
+        await execute_command(command, **kwargs)
+        if len(device.frequency_set_at) == 2:
+            fake_clock.now += 0.01
+
+    device.execute_command = stall_at_second_step # type: ignore
+    await ramper.execute(device, args) # type: ignore
+
+    # The step after the stall gets its full on time, instead of being sent right after the next one
+    steps = device.frequency_set_at
+    assert [later - earlier for earlier, later in zip(steps[1:], steps[2:])] == pytest.approx([0.011, 0.003])
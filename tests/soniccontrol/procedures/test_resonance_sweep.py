@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import AbsoluteFrequencySIVar, GainSIVar, RelativeFrequencySIVar
+from soniccontrol.procedures.procs.resonance_sweep import ResonanceSweep, ResonanceSweepArgs, find_resonance_candidates
+from soniccontrol.procedures.procs.spectrum_measure import create_spectrum_result
+from soniccontrol.procedures.sweep_engine import SweepEngine
+
+
+class ResonatorDevice:
+    """ The current peaks at the resonances """
+    def __init__(self, resonances_hz: List[int]) -> None:
+        self.resonances_hz = resonances_hz
+        self.frequency = 0
+        self.set_frequencies: List[int] = []
+
+    def irms(self, frequency: int) -> int:
+        return int(100 + sum(10_000 / (1 + ((frequency - resonance) / 2_000) ** 2) for resonance in self.resonances_hz))
+
+    async def execute_command(self, command: Command, **kwargs) -> None:
+        if isinstance(command, commands.SetFrequency):
+            self.frequency = command.args["value"]
+            self.set_frequencies.append(self.frequency)
+
+    async def set_signal_on(self) -> None: ...
+
+    async def set_signal_off(self) -> None: ...
+
+
+class FakeUpdater:
+    def __init__(self, device: ResonatorDevice) -> None:
+        self.device = device
+
+    async def update(self) -> Dict[EFieldName, Any] | None:
+        # the device answers with the state at the time of the request
+        frequency = self.device.frequency
+        await asyncio.sleep(0)
+        return {
+            EFieldName.FREQUENCY: frequency,
+            EFieldName.URMS: 1000,
+            EFieldName.IRMS: self.device.irms(frequency),
+            EFieldName.PHASE: 0,
+        }
+
+
+def create_args(point_budget: int) -> ResonanceSweepArgs:
+    return ResonanceSweepArgs(
+        gain=GainSIVar(100),
+        f_start=AbsoluteFrequencySIVar(1, SIPrefix.MEGA),
+        f_stop=AbsoluteFrequencySIVar(2, SIPrefix.MEGA),
+        f_step=RelativeFrequencySIVar(100),
+        point_budget=point_budget,
+    )
+
+
+def test_candidates_are_local_maxima_strongest_first():
+    spectrum = create_spectrum_result(np.arange(10) * 1000)
+    spectrum["measured"] = True
+    spectrum["urms"] = 1
+    spectrum["irms"] = [1, 5, 2, 1, 1, 9, 3, 1, 4, 1]
+
+    assert find_resonance_candidates(spectrum, max_peaks=2).tolist() == [5000, 1000]
+
+
+def test_full_sweep_is_used_if_it_fits_into_the_budget():
+    args = create_args(point_budget=10_000)
+
+    assert len(ResonanceSweep.create_coarse_plan(args)) == 10_000
+    assert ResonanceSweep.create_refinement_plan(args, ResonanceSweep.create_coarse_plan(args), np.array([1_500_000])).tolist() == []
+
+
+@pytest.mark.asyncio
+async def test_resonances_are_refined_within_the_point_budget():
+    device = ResonatorDevice([1_234_500, 1_700_300])
+    resonance_sweep = ResonanceSweep(FakeUpdater(device), SweepEngine(sleep=lambda _: asyncio.sleep(0), busy_wait_s=0)) # type: ignore
+    args = create_args(point_budget=200)
+
+    spectrum = await resonance_sweep.measure_spectrum(device, args) # type: ignore
+
+    assert len(spectrum) <= args.point_budget
+    assert len(device.set_frequencies) == len(spectrum)
+    assert len(set(device.set_frequencies)) == len(device.set_frequencies)
+    assert spectrum["step_index"].tolist() == list(range(len(spectrum)))
+    assert resonance_sweep.last_spectrum is spectrum
+    assert resonance_sweep.last_resonance_frequency is not None
+    # 100 points are left for 3 candidates around the 10 kHz coarse step, so the refinement step is 600 Hz
+    assert abs(resonance_sweep.last_resonance_frequency - 1_234_500) <= 300
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.commands import Command
+from sonic_protocol.schema import SIPrefix
+from sonic_protocol.si_unit import AbsoluteFrequencySIVar, GainSIVar, RelativeFrequencySIVar
+from soniccontrol.procedures.procs.spectrum_measure import SPECTRUM_RESULT_DTYPE, SpectrumMeasure, SpectrumMeasureArgs
+from soniccontrol.procedures.sweep_engine import SweepEngine
+
+
+def create_args(f_start: AbsoluteFrequencySIVar, f_stop: AbsoluteFrequencySIVar, f_step: RelativeFrequencySIVar) -> SpectrumMeasureArgs:
+    return SpectrumMeasureArgs(gain=GainSIVar(100), f_start=f_start, f_stop=f_stop, f_step=f_step)
+
+
+def test_sweep_plan_excludes_f_stop():
+    args = create_args(
+        AbsoluteFrequencySIVar(100, SIPrefix.KILO), AbsoluteFrequencySIVar(150, SIPrefix.KILO), RelativeFrequencySIVar(20, SIPrefix.KILO)
+    )
+
+    assert SpectrumMeasure.create_sweep_plan(args).tolist() == [100_000, 120_000]
+
+
+def test_sweep_plan_is_empty_if_f_stop_is_below_f_start():
+    args = create_args(
+        AbsoluteFrequencySIVar(200, SIPrefix.KILO), AbsoluteFrequencySIVar(150, SIPrefix.KILO), RelativeFrequencySIVar(10, SIPrefix.KILO)
+    )
+
+    assert SpectrumMeasure.create_sweep_plan(args).tolist() == []
+
+
+class FakeUpdater:
+    """ Answers with the last frequency, that was set. Fails for the frequencies in failing_frequencies """
+    def __init__(self, device: "FakeDevice") -> None:
+        self.device = device
+        self.failing_frequencies: List[int] = []
+
+    async def update(self) -> Dict[EFieldName, Any] | None:
+        # the device answers with the state at the time of the request
+        frequency = self.device.frequency
+        await asyncio.sleep(0)
+        if frequency in self.failing_frequencies:
+            return None
+        return { EFieldName.FREQUENCY: frequency, EFieldName.URMS: frequency // 100 }
+
+
+class FakeDevice:
+    def __init__(self) -> None:
+        self.frequency = 0
+
+    async def execute_command(self, command: Command, **kwargs) -> None:
+        if isinstance(command, commands.SetFrequency):
+            self.frequency = command.args["value"]
+
+    async def set_signal_on(self) -> None: ...
+
+    async def set_signal_off(self) -> None: ...
+
+
+@pytest.mark.asyncio
+async def test_spectrum_has_one_tagged_sample_per_step():
+    device = FakeDevice()
+    updater = FakeUpdater(device)
+    updater.failing_frequencies = [110_000]
+    spectrum_measure = SpectrumMeasure(updater, SweepEngine(sleep=lambda _: asyncio.sleep(0), busy_wait_s=0)) # type: ignore
+    args = create_args(
+        AbsoluteFrequencySIVar(100, SIPrefix.KILO), AbsoluteFrequencySIVar(130, SIPrefix.KILO), RelativeFrequencySIVar(10, SIPrefix.KILO)
+    )
+
+    spectrum = await spectrum_measure.measure_spectrum(device, args) # type: ignore
+
+    assert spectrum.dtype == SPECTRUM_RESULT_DTYPE
+    assert spectrum["step_index"].tolist() == [0, 1, 2]
+    assert spectrum["commanded_frequency"].tolist() == [100_000, 110_000, 120_000]
+    assert spectrum["measured"].tolist() == [True, False, True]
+    assert spectrum["frequency"][spectrum["measured"]].tolist() == [100_000, 120_000]
+    assert spectrum["urms"][spectrum["measured"]].tolist() == [1000, 1200]
+    assert spectrum_measure.last_spectrum is spectrum
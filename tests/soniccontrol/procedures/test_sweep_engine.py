@@ -0,0 +1,127 @@
+import asyncio
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from sonic_protocol.python_parser.commands import Command
+from soniccontrol.procedures.sweep_engine import SweepEngine, SweepPlan, SweepReport
+
+
+@pytest.fixture
+def fake_clock_start() -> float:
+    return 10.
+
+
+class FakeDevice:
+    """ Every command takes command_duration_s of fake time """
+    def __init__(self, clock, command_duration_s: float) -> None:
+        self.clock = clock
+        self.command_duration_s = command_duration_s
+        self.sent: List[Tuple[float, str]] = []
+
+    async def _send(self, name: str) -> None:
+        self.sent.append((self.clock.now, name))
+        self.clock.now += self.command_duration_s
+        await asyncio.sleep(0)
+
+    async def execute_command(self, command: Command, **kwargs) -> None:
+        await self._send(f"{type(command).__name__} {command.args['value']}")
+
+    async def set_signal_on(self) -> None:
+        await self._send("on")
+
+    async def set_signal_off(self) -> None:
+        await self._send("off")
+
+
+def test_plan_is_precomputed():
+    plan = SweepPlan.create(np.array([100_000, 110_000, 120_000]), t_on_s=0.1, t_off_s=0.05, measure_offset_s=0.2)
+
+    assert plan.step_offsets_s.tolist() == pytest.approx([0., 0.15, 0.3])
+    assert plan.measure_offsets_s.tolist() == pytest.approx([0.1, 0.25, 0.4])
+    assert plan.signal_off_offsets_s is not None
+    assert plan.signal_off_offsets_s.tolist() == pytest.approx([0.1, 0.25, 0.4])
+    assert plan.nominal_duration_s == pytest.approx(0.45)
+
+
+@pytest.mark.asyncio
+async def test_sweep_does_not_drift_with_command_durations(fake_clock):
+    device = FakeDevice(fake_clock, command_duration_s=0.01)
+    measured_steps: List[Tuple[int, int]] = []
+
+    async def measure(index: int, frequency: int) -> None:
+        measured_steps.append((index, frequency))
+
+    plan = SweepPlan.create(np.array([100_000 + i * 1000 for i in range(5)]), t_on_s=0.1, t_off_s=0., measure_offset_s=0.05)
+    report = await SweepEngine(clock=fake_clock, sleep=fake_clock.sleep, busy_wait_s=0).run(device, plan, measure) # type: ignore
+
+    assert measured_steps == [(i, 100_000 + i * 1000) for i in range(5)]
+    assert report.actual_measure_s.tolist() == pytest.approx([0.05, 0.15, 0.25, 0.35, 0.45])
+    assert report.duration_s == pytest.approx(plan.nominal_duration_s)
+    assert report.max_measure_error_s == pytest.approx(0., abs=1e-9)
+    assert [name for _, name in device.sent] == [
+        "SetFrequency 100000", "on", "SetFrequency 101000", "SetFrequency 102000", "SetFrequency 103000", "SetFrequency 104000"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_late_steps_are_reported_and_catch_up(fake_clock):
+    # The commands take longer than the measure offset, so the measurements are late, but the steps stay on time
+    device = FakeDevice(fake_clock, command_duration_s=0.03)
+
+    async def measure(index: int, frequency: int) -> None:
+        pass
+
+    plan = SweepPlan.create(np.array([100_000, 101_000, 102_000]), t_on_s=0.1, t_off_s=0.05, measure_offset_s=0.02)
+    report = await SweepEngine(clock=fake_clock, sleep=fake_clock.sleep, busy_wait_s=0).run(device, plan, measure) # type: ignore
+
+    assert report.step_errors_s.tolist() == pytest.approx([0., 0., 0.], abs=1e-9)
+    assert report.measure_errors_s.tolist() == pytest.approx([0.04, 0.04, 0.04])
+    assert report.max_measure_error_s == pytest.approx(0.04)
+    assert report.duration_s == pytest.approx(plan.nominal_duration_s)
+    signal_off_times = [time - 10. for time, name in device.sent if name == "off"]
+    assert signal_off_times == pytest.approx([0.1, 0.25, 0.4])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_sweep_keeps_partial_report(fake_clock):
+    device = FakeDevice(fake_clock, command_duration_s=0.)
+    measure_started = asyncio.Event()
+
+    async def measure(index: int, frequency: int) -> None:
+        measure_started.set()
+
+    plan = SweepPlan.create(np.array([100_000, 101_000, 102_000, 103_000]), t_on_s=0.1, t_off_s=0., measure_offset_s=0.)
+    report = SweepReport.for_plan(plan)
+    sweep = asyncio.create_task(SweepEngine(clock=fake_clock, sleep=fake_clock.sleep, busy_wait_s=0).run(device, plan, measure, report)) # type: ignore
+    await measure_started.wait()
+    sweep.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await sweep
+
+    assert not np.isnan(report.actual_step_s[0])
+    assert np.isnan(report.actual_step_s[-1])
+    assert not np.isnan(report.duration_s)
+
+
+@pytest.mark.asyncio
+async def test_signal_is_not_switched_on_if_setting_the_frequency_fails(fake_clock):
+    device = FakeDevice(fake_clock, command_duration_s=0.)
+
+    async def fail_to_set_frequency(command: Command, **kwargs) -> None:
+        raise ConnectionError("device disconnected")
+
+    async def measure(index: int, frequency: int) -> None:
+        pass
+
+    device.execute_command = fail_to_set_frequency # type: ignore
+    plan = SweepPlan.create(np.array([100_000, 101_000]), t_on_s=0.1, t_off_s=0.05, measure_offset_s=0.)
+
+    with pytest.raises(ConnectionError):
+        await SweepEngine(clock=fake_clock, sleep=fake_clock.sleep, busy_wait_s=0).run(device, plan, measure) # type: ignore
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert device.sent == []
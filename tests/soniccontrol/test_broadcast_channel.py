@@ -0,0 +1,104 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from soniccontrol.broadcast_channel import BroadcastChannel, DropPolicy
+
+
+class SlowListener:
+    def __init__(self) -> None:
+        self.items: List[int] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, item: int) -> None:
+        await self.release.wait()
+        self.items.append(item)
+
+
+async def publish_and_drain(channel: BroadcastChannel[int], listener: SlowListener, items: List[int]) -> None:
+    for item in items:
+        await channel.publish(item)
+        # lets the listener take the first item, where it waits until it gets released
+        await asyncio.sleep(0)
+    listener.release.set()
+    for _ in range(len(items) + 2):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_keep_latest_coalesces_pending_items():
+    channel: BroadcastChannel[int] = BroadcastChannel()
+    listener = SlowListener()
+    subscription = channel.subscribe(listener, DropPolicy.KEEP_LATEST, coalesce=lambda old, new: old + new)
+
+    await publish_and_drain(channel, listener, [1, 2, 3, 4])
+
+    # the first item is taken by the listener, the others are merged while it waits
+    assert listener.items == [1, 2 + 3 + 4]
+    assert subscription.statistics.dropped == 2
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_the_newest_items():
+    channel: BroadcastChannel[int] = BroadcastChannel()
+    listener = SlowListener()
+    subscription = channel.subscribe(listener, DropPolicy.DROP_OLDEST, max_queue_size=2)
+
+    await publish_and_drain(channel, listener, [1, 2, 3, 4, 5])
+
+    assert listener.items == [1, 4, 5]
+    assert subscription.statistics.dropped == 2
+    assert subscription.statistics.delivered == 3
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_loses_no_items():
+    channel: BroadcastChannel[int] = BroadcastChannel()
+    listener = SlowListener()
+    subscription = channel.subscribe(listener, DropPolicy.BACKPRESSURE, max_queue_size=2)
+    listener.release.set()
+
+    for item in range(10):
+        await channel.publish(item)
+    await asyncio.sleep(0.01)
+
+    assert listener.items == list(range(10))
+    assert subscription.statistics.dropped == 0
+    assert subscription.statistics.queue_length == 0
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_block_publisher():
+    channel: BroadcastChannel[int] = BroadcastChannel()
+    listener = SlowListener()
+    fast_items: List[int] = []
+    channel.subscribe(listener, DropPolicy.KEEP_LATEST)
+    channel.subscribe(fast_items.append, DropPolicy.DROP_OLDEST)
+
+    for item in range(50):
+        await asyncio.wait_for(channel.publish(item), timeout=1)
+        await asyncio.sleep(0)
+
+    assert fast_items == list(range(50))
+    assert listener.items == []
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_queued_items():
+    channel: BroadcastChannel[int] = BroadcastChannel()
+    items: List[int] = []
+    subscription = channel.subscribe(items.append, DropPolicy.BACKPRESSURE)
+
+    for item in range(5):
+        await channel.publish(item)
+    await asyncio.wait_for(subscription.drain(), timeout=1)
+
+    assert items == list(range(5))
+    await channel.close()
+    # a closed subscription has nothing left to wait for
+    await asyncio.wait_for(subscription.drain(), timeout=1)
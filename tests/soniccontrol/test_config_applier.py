@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.answer import Answer
+from sonic_protocol.python_parser.commands import Command
+from soniccontrol.config_applier import ConfigApplier, create_at_config_values
+
+
+class FakeDevice:
+    """ Stores the transducer values per (field name, index) and ignores setters in ignored_setters """
+    def __init__(self, values: Dict[Tuple[EFieldName, int], Any], has_getters: bool = True) -> None:
+        self.values = values
+        self.has_getters = has_getters
+        self.ignored_setters: List[type] = []
+        self.executed: List[Command] = []
+
+    def has_command(self, command: Command) -> bool:
+        return self.has_getters or not type(command).__name__.startswith("Get")
+
+    async def execute_command(self, command: Command, use_cache: bool = True, **kwargs) -> Answer:
+        self.executed.append(command)
+        field_name = {
+            "Atf": EFieldName.ATF, "Atk": EFieldName.ATK, "Att": EFieldName.ATT
+        }[type(command).__name__[3:]]
+        key = (field_name, command.args["index"])
+        if type(command).__name__.startswith("Set") and type(command) not in self.ignored_setters:
+            self.values[key] = command.args["value"]
+        return Answer("", True, True, field_value_dict={ field_name: self.values[key] })
+
+
+def create_device_values(atf: int, atk: float, att: float) -> Dict[Tuple[EFieldName, int], Any]:
+    return {
+        (field_name, index): value
+        for index in range(1, 5)
+        for field_name, value in [(EFieldName.ATF, np.uint32(atf)), (EFieldName.ATK, atk), (EFieldName.ATT, att)]
+    }
+
+
+def create_config(atf: int, atk: float, att: float):
+    return [config_value for index in range(1, 5) for config_value in create_at_config_values(index, atf, atk, att)]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_config_sends_no_setters():
+    device = FakeDevice(create_device_values(100000, 1.5, 20.))
+
+    result = await ConfigApplier(device).apply(create_config(100000, 1.5, 20.)) # type: ignore
+
+    assert result.sent_setters == []
+    assert result.unchanged_count == 12
+    assert all(type(command).__name__.startswith("Get") for command in device.executed)
+
+
+@pytest.mark.asyncio
+async def test_only_changed_values_are_sent_and_verified():
+    device = FakeDevice(create_device_values(100000, 1.5, 20.))
+    config = create_config(100000, 1.5, 20.)
+    config[3] = create_at_config_values(2, 200000, 1.5, 20.)[0]
+
+    result = await ConfigApplier(device).apply(config) # type: ignore
+
+    assert result.sent_setters == [commands.SetAtf(2, 200000)]
+    assert result.succeeded
+    assert device.values[(EFieldName.ATF, 2)] == 200000
+    # one read pass, the setter and one read back
+    assert len(device.executed) == 12 + 1 + 1
+
+
+@pytest.mark.asyncio
+async def test_values_the_device_did_not_take_over_are_reported():
+    device = FakeDevice(create_device_values(100000, 1.5, 20.))
+    device.ignored_setters.append(commands.SetAtk)
+
+    result = await ConfigApplier(device).apply(create_config(100000, 2.5, 20.)) # type: ignore
+
+    assert not result.succeeded
+    assert len(result.mismatches) == 4
+    assert all(actual == 1.5 for _, actual in result.mismatches)
+
+
+@pytest.mark.asyncio
+async def test_values_without_getters_are_always_set():
+    device = FakeDevice(create_device_values(100000, 1.5, 20.), has_getters=False)
+
+    result = await ConfigApplier(device).apply(create_config(100000, 1.5, 20.)) # type: ignore
+
+    assert len(result.sent_setters) == 12
+    assert result.succeeded
@@ -0,0 +1,57 @@
+from typing import List
+
+import pytest
+
+from soniccontrol.deadline_scheduler import DeadlineScheduler, OverrunPolicy
+
+
+@pytest.fixture
+def fake_clock_start() -> float:
+    return 100.
+
+
+async def run_polls(scheduler: DeadlineScheduler, clock, poll_durations_s: List[float]) -> List[float]:
+    poll_starts: List[float] = []
+    for poll_duration_s in poll_durations_s:
+        await scheduler.wait_for_next_deadline()
+        poll_starts.append(clock.now)
+        clock.now += poll_duration_s
+    return poll_starts
+
+
+@pytest.mark.asyncio
+async def test_polls_do_not_drift_with_their_duration(fake_clock):
+    scheduler = DeadlineScheduler(0.05, clock=fake_clock, sleep=fake_clock.sleep)
+
+    poll_starts = await run_polls(scheduler, fake_clock, [0.01, 0.03, 0.02, 0.04, 0.01])
+
+    assert poll_starts == pytest.approx([100., 100.05, 100.1, 100.15, 100.2])
+    assert scheduler.statistics.achieved_rate_hz == pytest.approx(20)
+    assert scheduler.statistics.jitter_s == pytest.approx(0, abs=1e-9)
+    assert scheduler.statistics.missed_deadlines == 0
+
+
+@pytest.mark.asyncio
+async def test_skip_policy_keeps_polls_on_the_grid(fake_clock):
+    scheduler = DeadlineScheduler(0.1, OverrunPolicy.SKIP, clock=fake_clock, sleep=fake_clock.sleep)
+
+    poll_starts = await run_polls(scheduler, fake_clock, [0.15, 0.01, 0.01])
+
+    assert poll_starts == pytest.approx([100., 100.2, 100.3])
+    assert scheduler.statistics.missed_deadlines == 1
+
+
+@pytest.mark.asyncio
+async def test_compensate_policy_catches_up(fake_clock):
+    scheduler = DeadlineScheduler(0.1, OverrunPolicy.COMPENSATE, clock=fake_clock, sleep=fake_clock.sleep)
+
+    poll_starts = await run_polls(scheduler, fake_clock, [0.15, 0.01, 0.01, 0.35, 0.01])
+
+    assert poll_starts == pytest.approx([100., 100.15, 100.2, 100.3, 100.65])
+    assert scheduler.statistics.missed_deadlines == 2
+    assert scheduler.statistics.max_lateness_s == pytest.approx(0.05)
+
+
+def test_interval_has_to_be_positive():
+    with pytest.raises(ValueError):
+        DeadlineScheduler(0)
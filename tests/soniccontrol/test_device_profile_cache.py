@@ -0,0 +1,142 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.schema import DeviceType, Protocol, ProtocolType, Version
+import soniccontrol.builder as builder
+from soniccontrol.builder import DeviceBuilder
+from soniccontrol.communication.communicator import Communicator
+from soniccontrol.communication.connection import SerialConnection
+from soniccontrol.device_profile_cache import ConnectTimings, DeviceProfile, DeviceProfileCache
+
+
+PORT = "/dev/ttyUSB0"
+
+
+def create_profile(**kwargs) -> DeviceProfile:
+    fields = dict(port=PORT, device_type=DeviceType.MVP_WORKER, protocol_version=Version(1, 0, 0), is_release=True, baudrate=9600)
+    fields.update(kwargs)
+    return DeviceProfile(**fields)
+
+
+def test_profiles_are_persisted(tmp_path: Path):
+    profile = create_profile(firmware_version=Version(1, 2, 3), boot_time_s=0.5)
+    DeviceProfileCache(tmp_path).put(profile)
+
+    assert DeviceProfileCache(tmp_path).get(PORT) == profile
+    assert DeviceProfileCache(tmp_path).get("/dev/ttyUSB1") is None
+
+
+def test_invalid_profile_file_is_ignored(tmp_path: Path):
+    (tmp_path / DeviceProfileCache.FILE_NAME).write_text("{ not json")
+
+    cache = DeviceProfileCache(tmp_path)
+
+    assert cache.get(PORT) is None
+    cache.put(create_profile())
+    assert DeviceProfileCache(tmp_path).get(PORT) == create_profile()
+
+
+def test_profile_matches_ignores_connection_details():
+    profile = create_profile()
+
+    assert profile.matches(create_profile(baudrate=115200, boot_time_s=3.))
+    assert not profile.matches(create_profile(firmware_version=Version(2, 0, 0)))
+    assert not profile.matches(create_profile(device_type=DeviceType.DESCALE))
+    assert not create_profile(serial_number="A").matches(create_profile(serial_number="B"))
+
+
+def test_connect_timings_sum_up_phases():
+    now = iter([0., 0.25, 1., 1.5])
+    timings = ConnectTimings(clock=lambda: next(now))
+
+    with timings.measure("open_connection"):
+        pass
+    with timings.measure("get_info"):
+        pass
+
+    assert timings.phases_s == {"open_connection": 0.25, "get_info": 0.5}
+    assert timings.total_s == 0.75
+
+
+@pytest.fixture
+def fake_device_setup(monkeypatch):
+    communicator = Mock(Communicator)
+    communicator.open_communication = AsyncMock()
+    communicator.send_and_wait_for_response = AsyncMock(return_value="")
+    monkeypatch.setattr(builder, "SerialCommunicator", Mock(return_value=communicator))
+
+    def build_protocol_for(protocol_type: ProtocolType) -> Protocol:
+        return Protocol(
+            info=protocol_type,
+            command_contracts={},
+            custom_data_types=protocol_list.custom_data_types,
+            command_code_cls=protocol_list.command_code_cls,
+            field_name_cls=protocol_list.field_name_cls
+        )
+    monkeypatch.setattr(builder, "operator_protocol_factory", Mock(build_protocol_for=build_protocol_for))
+    return communicator
+
+
+@pytest.mark.asyncio
+async def test_reconnect_uses_profile_and_verifies_it(tmp_path: Path, fake_device_setup, monkeypatch):
+    profile_cache = DeviceProfileCache(tmp_path)
+    profile_cache.put(create_profile())
+    device_builder = DeviceBuilder(profile_cache=profile_cache)
+    deduce_protocol_type = AsyncMock(return_value=ProtocolType(Version(1, 0, 0), DeviceType.MVP_WORKER, True))
+    monkeypatch.setattr(device_builder, "_deduce_protocol_type", deduce_protocol_type)
+
+    device = await device_builder.build_amp(SerialConnection(url=PORT, connection_name="ttyUSB0"))
+
+    assert device.info.device_type == DeviceType.MVP_WORKER
+    assert device_builder.connect_timings is not None and device_builder.connect_timings.used_profile
+    deduce_protocol_type.assert_not_called()
+    fake_device_setup.open_communication.assert_awaited_once()
+    assert fake_device_setup.open_communication.await_args.kwargs["baudrate"] == 9600
+
+    assert device_builder.profile_verification is not None
+    assert await device_builder.profile_verification
+    deduce_protocol_type.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_changed_device_fails_verification_and_updates_profile(tmp_path: Path, fake_device_setup, monkeypatch):
+    profile_cache = DeviceProfileCache(tmp_path)
+    profile_cache.put(create_profile())
+    device_builder = DeviceBuilder(profile_cache=profile_cache)
+    monkeypatch.setattr(device_builder, "_deduce_protocol_type", AsyncMock(return_value=ProtocolType(Version(1, 0, 0), DeviceType.DESCALE, True)))
+
+    await device_builder.build_amp(SerialConnection(url=PORT, connection_name="ttyUSB0"))
+
+    assert device_builder.profile_verification is not None
+    assert not await device_builder.profile_verification
+    updated_profile = DeviceProfileCache(tmp_path).get(PORT)
+    assert updated_profile is not None and updated_profile.device_type == DeviceType.DESCALE
+
+
+@pytest.mark.asyncio
+async def test_first_connect_stores_profile(tmp_path: Path, fake_device_setup, monkeypatch):
+    device_builder = DeviceBuilder(profile_cache=DeviceProfileCache(tmp_path))
+    monkeypatch.setattr(device_builder, "_deduce_protocol_type", AsyncMock(return_value=ProtocolType(Version(1, 0, 0), DeviceType.MVP_WORKER, True)))
+
+    await device_builder.build_amp(SerialConnection(url=PORT, connection_name="ttyUSB0"))
+
+    assert device_builder.profile_verification is None
+    assert device_builder.connect_timings is not None and "deduce_protocol" in device_builder.connect_timings.phases_s
+    assert DeviceProfileCache(tmp_path).get(PORT) == create_profile()
+
+
+@pytest.mark.asyncio
+async def test_failed_verification_invalidates_profile(tmp_path: Path, fake_device_setup, monkeypatch):
+    profile_cache = DeviceProfileCache(tmp_path)
+    profile_cache.put(create_profile())
+    device_builder = DeviceBuilder(profile_cache=profile_cache)
+    monkeypatch.setattr(device_builder, "_deduce_protocol_type", AsyncMock(side_effect=ConnectionError("device does not answer")))
+
+    await device_builder.build_amp(SerialConnection(url=PORT, connection_name="ttyUSB0"))
+
+    assert device_builder.profile_verification is not None
+    assert not await device_builder.profile_verification
+    assert DeviceProfileCache(tmp_path).get(PORT) is None
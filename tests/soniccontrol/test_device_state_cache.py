@@ -0,0 +1,67 @@
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.answer import Answer
+from soniccontrol.device_state_cache import CachePolicy, DeviceStateCache
+
+
+def gain_answer(gain: int) -> Answer:
+    return Answer(str(gain), True, True, field_value_dict={EFieldName.GAIN: gain})
+
+
+def test_fresh_answers_are_returned():
+    cache = DeviceStateCache()
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+
+    assert cache.get(commands.GetGain()) == gain_answer(50)
+    assert cache.hits == 1
+
+
+def test_answers_expire_after_ttl_of_field(fake_clock):
+    cache = DeviceStateCache(CachePolicy(default_ttl_s=10, field_ttls_s={EFieldName.GAIN: 1}), clock=fake_clock)
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+
+    fake_clock.now = 1.5
+
+    assert cache.get(commands.GetGain()) is None
+
+
+def test_matching_setter_invalidates_getter():
+    cache = DeviceStateCache()
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+    cache.on_answer(commands.GetAtf(1), Answer("100", True, True, field_value_dict={EFieldName.ATF: 100}))
+    cache.on_answer(commands.GetAtf(2), Answer("200", True, True, field_value_dict={EFieldName.ATF: 200}))
+
+    cache.on_answer(commands.SetAtf(1, 150), Answer("150", True, True))
+
+    assert cache.get(commands.GetAtf(1)) is None
+    assert cache.get(commands.GetAtf(2)) is None
+    assert cache.get(commands.GetGain()) is not None
+
+
+def test_update_invalidates_changed_fields_only():
+    cache = DeviceStateCache()
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+    cache.on_answer(commands.GetFreq(), Answer("1000", True, True, field_value_dict={EFieldName.FREQUENCY: 1000}))
+
+    cache.on_answer(commands.GetUpdate(), Answer("", True, True, field_value_dict={EFieldName.GAIN: 50, EFieldName.FREQUENCY: 2000}))
+
+    assert cache.get(commands.GetGain()) is not None
+    assert cache.get(commands.GetFreq()) is None
+
+
+def test_unknown_commands_clear_cache():
+    cache = DeviceStateCache()
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+
+    cache.on_answer(None, Answer("", False, False))
+
+    assert cache.get(commands.GetGain()) is None
+
+
+def test_legacy_commands_clear_cache():
+    cache = DeviceStateCache()
+    cache.on_answer(commands.GetGain(), gain_answer(50))
+
+    cache.on_answer(commands.SetAutoLegacy(), Answer("", True, True))
+
+    assert cache.get(commands.GetGain()) is None
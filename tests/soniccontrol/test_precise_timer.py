@@ -0,0 +1,74 @@
+import pytest
+
+from soniccontrol.precise_timer import PreciseTimer
+
+
+class OvershootingClock:
+    """ Every sleep overshoots by overshoot_s. Yielding to the loop with sleep(0) takes 0.1 ms """
+    def __init__(self, overshoot_s: float) -> None:
+        self.now = 50.
+        self.overshoot_s = overshoot_s
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, duration_s: float) -> None:
+        self.now += duration_s + self.overshoot_s if duration_s > 0 else 0.0001
+
+
+@pytest.mark.asyncio
+async def test_busy_wait_compensates_sleep_overshoot():
+    clock = OvershootingClock(overshoot_s=0.001)
+    timer = PreciseTimer(busy_wait_s=0.002, clock=clock, sleep=clock.sleep)
+
+    lateness_s = await timer.sleep_for(0.005)
+
+    assert 0 <= lateness_s < 0.0002
+
+
+@pytest.mark.asyncio
+async def test_holds_do_not_drift_with_the_work_between_them():
+    clock = OvershootingClock(overshoot_s=0.)
+    timer = PreciseTimer(busy_wait_s=0., clock=clock, sleep=clock.sleep)
+    timer.start()
+
+    for _ in range(10):
+        clock.now += 0.002 # sending commands
+        await timer.hold(0.005)
+
+    assert clock.now == pytest.approx(50.05)
+    assert timer.statistics.number_of_waits == 10
+    assert timer.statistics.missed_deadlines == 0
+
+
+@pytest.mark.asyncio
+async def test_missed_deadlines_are_counted():
+    clock = OvershootingClock(overshoot_s=0.)
+    timer = PreciseTimer(busy_wait_s=0., clock=clock, sleep=clock.sleep)
+    timer.start()
+
+    clock.now += 0.008
+    lateness_s = await timer.hold(0.005)
+    await timer.hold(0.005)
+
+    assert lateness_s == pytest.approx(0.003)
+    assert clock.now == pytest.approx(50.01)
+    assert timer.statistics.missed_deadlines == 1
+    assert timer.statistics.max_lateness_s == pytest.approx(0.003)
+
+
+@pytest.mark.asyncio
+async def test_chain_is_reanchored_after_a_stall_longer_than_a_hold():
+    clock = OvershootingClock(overshoot_s=0.)
+    timer = PreciseTimer(clock=clock, sleep=clock.sleep)
+    timer.start()
+
+    clock.now += 0.02 # the device stalled
+    lateness_s = await timer.hold(0.005)
+    await timer.hold(0.005)
+    await timer.hold(0.005)
+
+    assert lateness_s == pytest.approx(0.015)
+    # the holds after the stall are not shortened to catch up
+    assert clock.now == pytest.approx(50.03)
+    assert timer.statistics.missed_deadlines == 1
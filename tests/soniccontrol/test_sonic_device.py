@@ -7,8 +7,10 @@ from sonic_protocol.schema import AnswerDef, AnswerFieldDef, CommandContract, Co
 from sonic_protocol.field_names import EFieldName
 import sonic_protocol.python_parser.commands as cmds
 from soniccontrol.device_data import FirmwareInfo
+from soniccontrol.device_state_cache import DeviceStateCache
 from soniccontrol.sonic_device import SonicDevice
 from soniccontrol.communication.communicator import Communicator
+from soniccontrol.tracing import disable_tracing, enable_tracing
 
 
 @pytest.fixture
@@ -78,3 +80,54 @@ async def test_send_command_creates_correct_request(command, request_str, commun
     assert args == (request_str,)
 
 
+
+
+@pytest.mark.asyncio
+async def test_state_cache_answers_getter_until_setter_is_executed(communicator, simple_protocol):
+    sonic_device = SonicDevice(communicator, simple_protocol, FirmwareInfo(), state_cache=DeviceStateCache())
+    communicator.send_and_wait_for_response = AsyncMock(return_value="50")
+
+    first_answer = await sonic_device.execute_command(cmds.GetGain())
+    second_answer = await sonic_device.execute_command(cmds.GetGain())
+    assert communicator.send_and_wait_for_response.call_count == 1
+    assert second_answer is first_answer
+
+    await sonic_device.execute_command(cmds.SetGain(60))
+    await sonic_device.execute_command(cmds.GetGain())
+    assert communicator.send_and_wait_for_response.call_count == 3
+
+    await sonic_device.execute_command(cmds.GetGain(), use_cache=False)
+    assert communicator.send_and_wait_for_response.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_execute_command_records_trace_spans(communicator, sonic_device):
+    communicator.send_and_wait_for_response = AsyncMock(return_value="50")
+    tracer = enable_tracing()
+    try:
+        await sonic_device.execute_command(cmds.GetGain())
+    finally:
+        disable_tracing()
+
+    span_names = [span.name for span in tracer.get_spans()]
+    assert span_names == ["serialize", "validate", "execute_command"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("code, raw_answer, expected_values", [
+    (CommandCode.SET_GAIN, "100\r\n", {EFieldName.GAIN: 100}),
+    (CommandCode.SET_FREQ, "1000000 Hz\r\n", {EFieldName.FREQUENCY: 1000000}),
+    (CommandCode.LEGACY_PVAL, "rang:5000\r\nstep:100\r\nsing:20\r\npaus:10\r\n", {
+        EFieldName.LEGACY_RANG: 5000, EFieldName.LEGACY_STEP: 100, EFieldName.LEGACY_SING: 20, EFieldName.LEGACY_PAUS: 10
+    }),
+])
+async def test_legacy_crystal_answers_with_line_terminators_are_valid(code, raw_answer, expected_values, communicator):
+    protocol = protocol_list.build_protocol_for(ProtocolType(Version(1, 0, 0), DeviceType.CRYSTAL, True))
+    sonic_device = SonicDevice(communicator, protocol, FirmwareInfo())
+    # like the LegacyCommunicator, that prepends the code and returns the lines as they were read
+    communicator.send_and_wait_for_response = AsyncMock(return_value=f"{code.value}#{raw_answer}")
+
+    answer = await sonic_device._send_message("request", sonic_device._answer_validators[code])
+
+    assert answer.valid
+    assert { field_name: answer.field_value_dict[field_name] for field_name in expected_values } == expected_values
@@ -0,0 +1,83 @@
+import asyncio
+import concurrent.futures
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sonic_protocol.field_names import EFieldName
+from soniccontrol.sync_remote_controller import EventLoopThread, SyncRemoteController
+
+
+@pytest.fixture
+def loop_thread():
+    with EventLoopThread() as loop_thread:
+        yield loop_thread
+
+
+async def add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+def test_run_returns_result(loop_thread: EventLoopThread):
+    assert loop_thread.run(add(1, 2)) == 3
+
+
+def test_tasks_keep_running_between_calls(loop_thread: EventLoopThread):
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.001)
+
+    loop_thread.call(lambda: asyncio.create_task(tick()))
+    ticks_after_start = len(ticks)
+    time.sleep(0.05)
+
+    assert len(ticks) > ticks_after_start
+
+
+def test_timeout_cancels_coroutine(loop_thread: EventLoopThread):
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        loop_thread.run(wait_forever(), timeout=0.01)
+    time.sleep(0.01)
+    assert cancelled == [True]
+
+
+def test_run_from_loop_thread_raises(loop_thread: EventLoopThread):
+    async def run_nested():
+        return loop_thread.run(add(1, 2))
+
+    with pytest.raises(RuntimeError):
+        loop_thread.run(run_nested())
+
+
+def test_stop_cancels_remaining_tasks():
+    loop_thread = EventLoopThread()
+    loop_thread.start()
+    task = loop_thread.call(lambda: asyncio.create_task(asyncio.sleep(10)))
+
+    loop_thread.stop()
+
+    assert task.cancelled()
+    assert not loop_thread.is_running
+
+
+def test_facade_runs_controller_coroutines_in_loop_thread():
+    with SyncRemoteController() as sync_controller:
+        answer = ("1000", {EFieldName.FREQUENCY: 1000}, True)
+        sync_controller.controller.send_command = AsyncMock(return_value=answer)
+
+        assert sync_controller.send_command("?f") == answer
+        sync_controller.controller.send_command.assert_awaited_once_with("?f")
@@ -0,0 +1,45 @@
+from typing import List
+
+import pytest
+
+from sonic_protocol.python_parser import commands
+from soniccontrol.telemetry_schedule import TelemetryEntry, TelemetrySchedule
+
+
+@pytest.mark.asyncio
+async def test_schedule_interleaves_commands_by_period(fake_clock):
+    schedule = TelemetrySchedule([
+        TelemetryEntry(commands.GetUipt(), period_s=0.1),
+        TelemetryEntry(commands.GetTemp(), period_s=0.25),
+    ], clock=fake_clock, sleep=fake_clock.sleep)
+
+    polled: List[str] = []
+    while fake_clock.now < 0.5:
+        command = await schedule.wait_for_next_command()
+        polled.append(type(command).__name__)
+
+    assert polled == ["GetUipt", "GetTemp", "GetUipt", "GetUipt", "GetTemp", "GetUipt", "GetUipt", "GetUipt"]
+    uipt_statistics, temp_statistics = schedule.get_statistics()
+    assert uipt_statistics.number_of_polls == 6
+    assert temp_statistics.number_of_polls == 2
+
+
+@pytest.mark.asyncio
+async def test_late_entries_are_polled_when_the_link_is_free(fake_clock):
+    schedule = TelemetrySchedule([
+        TelemetryEntry(commands.GetUipt(), period_s=0.1),
+        TelemetryEntry(commands.GetTemp(), period_s=1),
+    ], clock=fake_clock, sleep=fake_clock.sleep)
+
+    poll_starts: List[float] = []
+    for poll_duration_s in [0.01, 0.15, 0.01, 0.01]:
+        await schedule.wait_for_next_command()
+        poll_starts.append(fake_clock.now)
+        fake_clock.now += poll_duration_s
+
+    assert poll_starts == pytest.approx([0., 0.01, 0.16, 0.2])
+
+
+def test_period_has_to_be_positive():
+    with pytest.raises(ValueError):
+        TelemetryEntry(commands.GetTemp(), period_s=0)
@@ -0,0 +1,77 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from soniccontrol.tracing import Tracer, disable_tracing, enable_tracing, get_tracer, trace_span
+
+
+@pytest.fixture
+def fake_clock_start() -> int:
+    return 0
+
+
+@pytest.fixture
+def fake_clock_tick() -> int:
+    """ The tracer clock counts nanoseconds. Each read takes 1 us """
+    return 1000
+
+
+def test_disabled_tracing_records_nothing():
+    disable_tracing()
+
+    with trace_span("span"):
+        pass
+
+    assert get_tracer() is None
+
+
+def test_ring_buffer_drops_oldest_spans(fake_clock):
+    tracer = Tracer(capacity=2, clock=fake_clock)
+
+    for name in ["a", "b", "c"]:
+        with tracer.span(name):
+            pass
+
+    assert [span.name for span in tracer.get_spans()] == ["b", "c"]
+
+
+def test_nested_spans_are_recorded_when_they_end():
+    tracer = enable_tracing()
+    tracer.clear()
+    try:
+        with trace_span("outer", "test"):
+            with trace_span("inner", "test", value=1):
+                pass
+    finally:
+        disable_tracing()
+
+    inner, outer = tracer.get_spans()
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert inner.args == {"value": 1}
+    assert outer.start_ns <= inner.start_ns
+    assert inner.start_ns + inner.duration_ns <= outer.start_ns + outer.duration_ns
+
+
+@pytest.mark.asyncio
+async def test_chrome_trace_has_a_track_per_task(tmp_path: Path, fake_clock):
+    tracer = Tracer(clock=fake_clock)
+
+    async def work(name: str) -> None:
+        with tracer.span(name, "test", args={"name": name}):
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        asyncio.create_task(work("first"), name="task 1"),
+        asyncio.create_task(work("second"), name="task 2"),
+    )
+    trace_file = tmp_path / "trace.json"
+    tracer.export_chrome_trace(trace_file)
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    complete_events = [event for event in events if event["ph"] == "X"]
+    track_names = { event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M" }
+    assert sorted(track_names.values()) == ["task 1", "task 2"]
+    assert { track_names[event["tid"]]: event["name"] for event in complete_events } == {"task 1": "first", "task 2": "second"}
+    assert all(event["dur"] > 0 for event in complete_events)
@@ -0,0 +1,118 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from sonic_protocol.field_names import EFieldName
+from sonic_protocol.python_parser import commands
+from sonic_protocol.python_parser.answer import Answer
+from soniccontrol.events import Event
+from soniccontrol.sonic_device import SonicDevice
+from soniccontrol.telemetry_schedule import TelemetryEntry, TelemetrySchedule
+from soniccontrol.updater import Updater
+
+
+def create_device(statuses):
+    device = Mock(SonicDevice)
+    device.has_command = Mock(return_value=True)
+    device.execute_command = AsyncMock(side_effect=[
+        Answer("", True, True, field_value_dict=status) for status in statuses
+    ])
+    return device
+
+
+@pytest.mark.asyncio
+async def test_update_emits_changed_fields():
+    statuses = [
+        {EFieldName.FREQUENCY: 1000, EFieldName.GAIN: 10},
+        {EFieldName.FREQUENCY: 1000, EFieldName.GAIN: 20},
+        {EFieldName.FREQUENCY: 1000, EFieldName.GAIN: 20},
+    ]
+    updater = Updater(create_device(statuses))
+    events: list[Event] = []
+    updater.subscribe("update", events.append)
+
+    for _ in statuses:
+        await updater.update()
+
+    assert [event.data["changed_fields"] for event in events] == [
+        frozenset({EFieldName.FREQUENCY, EFieldName.GAIN}),
+        frozenset({EFieldName.GAIN}),
+        frozenset(),
+    ]
+    assert [event.data["status"] for event in events] == statuses
+    assert updater.last_status == statuses[-1]
+
+
+@pytest.mark.asyncio
+async def test_invalid_answers_do_not_change_last_status():
+    device = create_device([])
+    device.execute_command = AsyncMock(side_effect=[
+        Answer("", True, True, field_value_dict={EFieldName.GAIN: 10}),
+        Answer("garbage", False, True),
+        Answer("", True, True, field_value_dict={EFieldName.GAIN: 10}),
+    ])
+    updater = Updater(device)
+    events: list[Event] = []
+    updater.subscribe("update", events.append)
+
+    for _ in range(3):
+        await updater.update()
+
+    assert len(events) == 2
+    assert events[-1].data["changed_fields"] == frozenset()
+    assert updater.last_status == {EFieldName.GAIN: 10}
+
+
+def test_target_rate_creates_polling_statistics():
+    updater = Updater(create_device([]))
+    assert updater.get_target_rate() is None
+    assert updater.polling_statistics is None
+
+    updater.set_target_rate(20)
+
+    assert updater.get_target_rate() == pytest.approx(20)
+    assert updater.polling_statistics is not None
+    with pytest.raises(ValueError):
+        updater.set_target_rate(0)
+
+
+@pytest.mark.asyncio
+async def test_telemetry_schedule_merges_answers_into_status():
+    device = create_device([
+        {EFieldName.URMS: 1, EFieldName.IRMS: 2},
+        {EFieldName.TEMPERATURE: 300},
+        {EFieldName.URMS: 3, EFieldName.IRMS: 2},
+    ])
+    updater = Updater(device)
+    updater.set_telemetry_schedule(TelemetrySchedule([
+        TelemetryEntry(commands.GetUipt(), period_s=0.1),
+        TelemetryEntry(commands.GetTemp(), period_s=1),
+    ]))
+    events: list[Event] = []
+    updater.subscribe("update", events.append)
+
+    await updater.update(commands.GetUipt())
+    await updater.update(commands.GetTemp())
+    await updater.update(commands.GetUipt())
+
+    assert events[-1].data["status"] == {EFieldName.URMS: 3, EFieldName.IRMS: 2, EFieldName.TEMPERATURE: 300}
+    assert events[-1].data["changed_fields"] == frozenset({EFieldName.URMS})
+    assert events[1].data["changed_fields"] == frozenset({EFieldName.TEMPERATURE})
+
+
+def test_telemetry_schedule_requires_supported_commands():
+    device = create_device([])
+    device.has_command = Mock(return_value=False)
+    updater = Updater(device)
+
+    with pytest.raises(ValueError):
+        updater.set_telemetry_schedule(TelemetrySchedule([TelemetryEntry(commands.GetTemp(), period_s=1)]))
+
+
+def test_coalesced_update_events_keep_all_changed_fields():
+    older_event = Event("update", status={EFieldName.GAIN: 1}, changed_fields=frozenset({EFieldName.GAIN}))
+    newer_event = Event("update", status={EFieldName.GAIN: 1, EFieldName.URMS: 2}, changed_fields=frozenset({EFieldName.URMS}))
+
+    event = Updater.coalesce_update_events(older_event, newer_event)
+
+    assert event.data["status"] == newer_event.data["status"]
+    assert event.data["changed_fields"] == frozenset({EFieldName.GAIN, EFieldName.URMS})
@@ -0,0 +1,56 @@
+import sys
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from sonic_protocol.protocol import protocol_list
+from sonic_protocol.python_parser.command_deserializer import CommandDeserializer
+from sonic_protocol.schema import DeviceType, ProtocolType
+from soniccontrol_cli.monitor import Monitor
+
+
+@pytest.fixture
+def monitor() -> Monitor:
+    protocol = protocol_list.build_protocol_for(ProtocolType(protocol_list.version, DeviceType.MVP_WORKER))
+    # The constructor needs a connected device, but completion only needs the identifier trie
+    monitor = Monitor.__new__(Monitor)
+    monitor._remote_controller = Mock(_device=Mock(command_deserializer=CommandDeserializer(protocol)))
+    return monitor
+
+
+def complete(monitor: Monitor, line: str, begidx: int, monkeypatch) -> list[str]:
+    """ Drives Cmd.complete, like readline does, which treats ? and ! as delimiters """
+    fake_readline = types.SimpleNamespace(
+        get_line_buffer=lambda: line, get_begidx=lambda: begidx, get_endidx=lambda: len(line)
+    )
+    monkeypatch.setitem(sys.modules, "readline", fake_readline)
+    text = line[begidx:]
+    completions = []
+    while (completion := monitor.complete(text, len(completions))) is not None:
+        completions.append(completion)
+    return completions
+
+
+def test_getters_are_completed(monitor: Monitor, monkeypatch):
+    completions = complete(monitor, "?fre", 1, monkeypatch)
+
+    assert "freq" in completions
+    assert all(completion.startswith("fre") for completion in completions)
+
+
+def test_setters_are_completed(monitor: Monitor, monkeypatch):
+    completions = complete(monitor, "!fre", 1, monkeypatch)
+
+    assert "frequency" in completions
+
+
+def test_commands_with_leading_spaces_are_completed(monitor: Monitor, monkeypatch):
+    completions = complete(monitor, "  ?fr", 3, monkeypatch)
+
+    assert "freq" in completions
+    assert all(completion.startswith("fr") for completion in completions)
+
+
+def test_completion_ignores_leading_spaces_in_line(monitor: Monitor):
+    assert monitor._complete_command_identifier("  ?fr", 3, 5) == monitor._complete_command_identifier("?fr", 1, 3)